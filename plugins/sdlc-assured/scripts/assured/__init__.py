@@ -1,5 +1,6 @@
 """sdlc-assured runtime helpers — ID registry, validators, exporters."""
 
 from .dependency_extractor import ImportEdge
+from .source_corpus import SourceCorpus
 
-__all__ = ["ImportEdge"]
+__all__ = ["ImportEdge", "SourceCorpus"]
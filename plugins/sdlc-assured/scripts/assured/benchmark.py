@@ -0,0 +1,462 @@
+"""Offline benchmark harness for the Assured traceability pipeline.
+
+Generates a synthetic project — N feature spec sets, M Python source files
+and a configurable ``# implements:`` annotation density — then times each
+pipeline stage the way pytest-benchmark does: several rounds per stage,
+reporting min / mean / max wall-clock seconds.  Stages are timed cold (no
+shared :class:`~assured.source_corpus.SourceCorpus`) so a run reflects what
+one ``kb-rebuild-indexes`` pass costs.
+
+Results can be written to a JSON baseline and later runs compared against
+it: a stage whose ``min`` grows by more than the threshold (default 25%)
+is reported as a regression and ``main`` exits 1.
+
+CLI usage (via package module):
+    python3 -c "from sdlc_assured_scripts.assured.benchmark import main; import sys; sys.exit(main())" \\
+        --specs 50 --sources 500 --density 0.5 \\
+        --baseline library/_assured-benchmark.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .decomposition import (
+    CodeAnnotation,
+    Decomposition,
+    Module,
+    Program,
+    SubProgram,
+    forward_annotation_completeness,
+    run_annotation_validators,
+)
+from .dependency_extractor import PythonAstExtractor
+from .evidence_index import EvidenceIndexEntry, EvidenceIndexRegistry, EvidenceKind
+from .export import (
+    write_csv,
+    write_do178c_rtm,
+    write_fda_dhf_structure,
+    write_iec_62304_matrix,
+    write_iso_26262_asil_matrix,
+    write_markdown,
+)
+from .ids import IdRecord, build_id_registry
+from .requirement_metadata import (
+    RequirementMetadata,
+    build_requirement_metadata_registry,
+)
+from .trace_graph import TraceGraph
+from .traceability_validators import (
+    annotation_format_integrity,
+    backward_coverage,
+    cited_ids_resolve,
+    forward_link_integrity,
+    id_uniqueness,
+    orphan_ids,
+)
+
+FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 0.25
+_FILES_PER_MODULE = 20
+
+
+@dataclass
+class SyntheticProject:
+    """A generated project on disk plus the inputs the pipeline needs."""
+
+    root: Path
+    decomposition: Decomposition
+    source_files: List[Path]
+    spec_module_lookup: Dict[str, str]
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing statistics for one pipeline stage, in seconds."""
+
+    name: str
+    rounds: int
+    min: float
+    mean: float
+    max: float
+
+
+@dataclass
+class _PipelineState:
+    """Stage inputs computed once, outside the timed region."""
+
+    project: SyntheticProject
+    records: List[IdRecord] = field(default_factory=list)
+    metadata: Dict[str, RequirementMetadata] = field(default_factory=dict)
+    evidence: List[EvidenceIndexEntry] = field(default_factory=list)
+    annotations: List[CodeAnnotation] = field(default_factory=list)
+
+
+def generate_synthetic_project(
+    root: Path,
+    n_specs: int = 20,
+    n_sources: int = 100,
+    annotation_density: float = 0.5,
+    reqs_per_spec: int = 5,
+    seed: int = 0,
+) -> SyntheticProject:
+    """Write a synthetic Assured project under *root*.
+
+    Each of the *n_specs* features gets a requirements, design and test spec
+    with *reqs_per_spec* linked REQ/DES/TEST triples.  *n_sources* Python
+    files are spread over modules of 20 files each; every file defines four
+    public functions, and *annotation_density* (0.0–1.0) of them carry an
+    ``# implements:`` citing a random DES — so many land outside the cited
+    module's paths and the scatter validators have real work to do.
+    Generation is deterministic for a given *seed*.
+    """
+    rng = random.Random(seed)
+    specs_dir = root / "docs" / "specs"
+    des_ids: List[str] = []
+    lookup: Dict[str, str] = {}
+    n_modules = max(1, -(-n_sources // _FILES_PER_MODULE))
+
+    for i in range(n_specs):
+        feature = f"feat{i:04d}"
+        module = f"P1.SP1.M{i % n_modules + 1}"
+        feature_dir = specs_dir / feature
+        feature_dir.mkdir(parents=True, exist_ok=True)
+        req_lines = [f"**Feature-id:** {feature}", "", "## Requirements", ""]
+        des_lines = [f"**Feature-id:** {feature}", "", "## Design", ""]
+        test_lines = [f"**Feature-id:** {feature}", "", "## Test cases", ""]
+        for n in range(1, reqs_per_spec + 1):
+            req, des, test = (f"{k}-{feature}-{n:03d}" for k in ("REQ", "DES", "TEST"))
+            req_lines += [f"### {req}", "**Evidence-status:** linked", "Text.", ""]
+            des_lines += [f"### {des}", f"**satisfies:** {req}", "Text.", ""]
+            test_lines += [f"### {test}", f"**satisfies:** {des}", "Text.", ""]
+            des_ids.append(des)
+            for id_ in (req, des, test):
+                lookup[id_] = module
+        (feature_dir / "requirements-spec.md").write_text("\n".join(req_lines))
+        (feature_dir / "design-spec.md").write_text("\n".join(des_lines))
+        (feature_dir / "test-spec.md").write_text("\n".join(test_lines))
+
+    modules: List[Module] = []
+    for k in range(1, n_modules + 1):
+        module_dir = root / "src" / f"m{k}"
+        module_dir.mkdir(parents=True, exist_ok=True)
+        modules.append(
+            Module(
+                id=f"M{k}",
+                name=f"Module {k}",
+                paths=[str(module_dir) + "/"],
+                granularity="requirement",
+                structure="flat",
+            )
+        )
+
+    source_files: List[Path] = []
+    for j in range(n_sources):
+        path = root / "src" / f"m{j // _FILES_PER_MODULE + 1}" / f"unit_{j:05d}.py"
+        lines = []
+        if j:
+            lines += [f"import unit_{rng.randrange(j):05d}", ""]
+        for f in range(4):
+            lines.append(f"def func_{f}(x):")
+            if des_ids and rng.random() < annotation_density:
+                lines.append(f"    # implements: {rng.choice(des_ids)}")
+            lines += ["    y = x + 1", "    return y * 2", ""]
+        path.write_text("\n".join(lines))
+        source_files.append(path)
+
+    decomp = Decomposition(
+        programs=[
+            Program(
+                id="P1",
+                name="Synthetic",
+                description=None,
+                sub_programs=[SubProgram(id="SP1", name="Synthetic", modules=modules)],
+            )
+        ]
+    )
+    return SyntheticProject(
+        root=root,
+        decomposition=decomp,
+        source_files=source_files,
+        spec_module_lookup=lookup,
+    )
+
+
+def _prepare(project: SyntheticProject) -> _PipelineState:
+    state = _PipelineState(project=project)
+    state.records = build_id_registry(project.root)
+    state.metadata = build_requirement_metadata_registry(project.root)
+    state.evidence = list(
+        EvidenceIndexRegistry.with_default_adapters().scan(
+            project.source_files, project.root
+        )
+    )
+    state.annotations = [
+        CodeAnnotation(
+            file_path=str(project.root / e.source),
+            line=e.line or 0,
+            cited_ids=list(e.cited_ids),
+        )
+        for e in state.evidence
+        if e.kind == EvidenceKind.PYTHON_COMMENT
+    ]
+    return state
+
+
+def _traceability_validators(state: _PipelineState) -> None:
+    graph = TraceGraph.from_records(state.records)
+    for validator in (
+        id_uniqueness,
+        cited_ids_resolve,
+        orphan_ids,
+        forward_link_integrity,
+        backward_coverage,
+    ):
+        validator(state.records, graph=graph)
+
+
+def _decomposition_validators(state: _PipelineState) -> None:
+    project = state.project
+    run_annotation_validators(
+        state.annotations,
+        project.decomposition,
+        project.spec_module_lookup,
+        declared_reqs=[r.id for r in state.records if r.kind == "REQ"],
+        satisfies_graph={r.id: r.satisfies for r in state.records if r.kind == "DES"},
+    )
+    forward_annotation_completeness(project.source_files, project.decomposition)
+
+
+def _exporter(write: Callable[..., None]) -> Callable[[_PipelineState], None]:
+    def run(state: _PipelineState) -> None:
+        write(state.records, state.evidence, state.metadata, io.StringIO())
+
+    return run
+
+
+# Stage name → callable over the prepared state, in pipeline order.
+STAGES: Dict[str, Callable[[_PipelineState], object]] = {
+    "build_id_registry": lambda s: build_id_registry(s.project.root),
+    "build_requirement_metadata_registry": lambda s: (
+        build_requirement_metadata_registry(s.project.root)
+    ),
+    "evidence_index_scan": lambda s: list(
+        EvidenceIndexRegistry.with_default_adapters().scan(
+            s.project.source_files, s.project.root
+        )
+    ),
+    "python_ast_extract": lambda s: PythonAstExtractor().extract(
+        s.project.source_files, s.project.decomposition
+    ),
+    "traceability_validators": _traceability_validators,
+    "annotation_format_integrity": lambda s: annotation_format_integrity(
+        s.project.source_files, {r.id for r in s.records}
+    ),
+    "decomposition_validators": _decomposition_validators,
+    "export_do178c_rtm": _exporter(write_do178c_rtm),
+    "export_iec_62304_matrix": _exporter(write_iec_62304_matrix),
+    "export_iso_26262_asil_matrix": _exporter(write_iso_26262_asil_matrix),
+    "export_fda_dhf_structure": _exporter(write_fda_dhf_structure),
+    "export_csv": _exporter(write_csv),
+    "export_markdown": _exporter(write_markdown),
+}
+
+
+def run_benchmarks(
+    project: SyntheticProject,
+    rounds: int = 3,
+    only: Optional[List[str]] = None,
+) -> List[BenchmarkResult]:
+    """Time every stage (or just *only*) over *rounds* rounds each."""
+    if rounds < 1:
+        raise ValueError(f"rounds must be >= 1, got {rounds!r}")
+    unknown = sorted(set(only or []) - set(STAGES))
+    if unknown:
+        raise ValueError(f"unknown benchmark stage(s): {', '.join(unknown)}")
+    state = _prepare(project)
+    results: List[BenchmarkResult] = []
+    for name, stage in STAGES.items():
+        if only is not None and name not in only:
+            continue
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            stage(state)
+            timings.append(time.perf_counter() - start)
+        results.append(
+            BenchmarkResult(
+                name=name,
+                rounds=rounds,
+                min=min(timings),
+                mean=sum(timings) / len(timings),
+                max=max(timings),
+            )
+        )
+    return results
+
+
+def write_baseline(
+    results: List[BenchmarkResult], path: Path, params: Optional[dict] = None
+) -> None:
+    """Write *results* (and the generator *params*) as a JSON baseline."""
+    payload = {
+        "format_version": FORMAT_VERSION,
+        "params": params or {},
+        "results": {r.name: asdict(r) for r in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def read_baseline(path: Path) -> Optional[Dict[str, BenchmarkResult]]:
+    """Load a baseline, or ``None`` if it is missing or unreadable."""
+    try:
+        payload = json.loads(path.read_text())
+        if payload.get("format_version") != FORMAT_VERSION:
+            return None
+        return {
+            name: BenchmarkResult(**row) for name, row in payload["results"].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def read_baseline_params(path: Path) -> Optional[dict]:
+    """The generator params a baseline was recorded with, or ``None``."""
+    try:
+        payload = json.loads(path.read_text())
+        if payload.get("format_version") != FORMAT_VERSION:
+            return None
+        params = payload.get("params")
+        return params if isinstance(params, dict) else None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """Stages whose ``min`` exceeds the baseline ``min`` by more than *threshold*.
+
+    ``min`` is the least noisy statistic on a shared machine.  Stages absent
+    from the baseline are not compared.
+    """
+    regressions: List[str] = []
+    for r in results:
+        base = baseline.get(r.name)
+        if base is None or base.min <= 0:
+            continue
+        change = r.min / base.min - 1.0
+        if change > threshold:
+            regressions.append(
+                f"{r.name}: {r.min:.4f}s vs baseline {base.min:.4f}s "
+                f"(+{change:.0%}, threshold {threshold:.0%})"
+            )
+    return regressions
+
+
+def render_results(results: List[BenchmarkResult]) -> str:
+    """Render *results* as a fixed-width text table."""
+    width = max([len("stage")] + [len(r.name) for r in results])
+    lines = [f"{'stage':<{width}}  {'min':>9}  {'mean':>9}  {'max':>9}"]
+    for r in results:
+        lines.append(f"{r.name:<{width}}  {r.min:>9.4f}  {r.mean:>9.4f}  {r.max:>9.4f}")
+    return "\n".join(lines) + "\n"
+
+
+def main(args: list[str] | None = None) -> int:
+    """CLI entry point.
+
+    Returns:
+        0 on success, 1 when a stage regressed past the threshold, 2 when
+        the baseline was recorded with different generator params.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Assured traceability pipeline on a synthetic project."
+    )
+    parser.add_argument("--specs", type=int, default=20, help="Feature spec sets.")
+    parser.add_argument("--sources", type=int, default=100, help="Python source files.")
+    parser.add_argument(
+        "--density",
+        type=float,
+        default=0.5,
+        help="Fraction of functions carrying an # implements: annotation.",
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds per stage.")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed.")
+    parser.add_argument(
+        "--stage",
+        action="append",
+        default=None,
+        help="Run only this stage (repeatable).",
+    )
+    parser.add_argument("--baseline", default=None, help="JSON baseline path.")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write this run's results to --baseline instead of comparing.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown before a stage counts as regressed (default: 0.25).",
+    )
+    opts = parser.parse_args(args)
+
+    params = {
+        "specs": opts.specs,
+        "sources": opts.sources,
+        "density": opts.density,
+        "seed": opts.seed,
+    }
+    if opts.baseline is not None and not opts.update_baseline:
+        recorded = read_baseline_params(Path(opts.baseline))
+        if recorded and recorded != params:
+            print(
+                f"Baseline {opts.baseline} was recorded with {recorded}, "
+                f"not {params}; refusing to compare. Re-run with matching "
+                "options or --update-baseline."
+            )
+            return 2
+    with tempfile.TemporaryDirectory(prefix="assured-bench-") as tmp:
+        project = generate_synthetic_project(
+            Path(tmp),
+            n_specs=opts.specs,
+            n_sources=opts.sources,
+            annotation_density=opts.density,
+            seed=opts.seed,
+        )
+        results = run_benchmarks(project, rounds=opts.rounds, only=opts.stage)
+    sys.stdout.write(render_results(results))
+
+    if opts.baseline is None:
+        return 0
+    baseline_path = Path(opts.baseline)
+    if opts.update_baseline:
+        write_baseline(results, baseline_path, params)
+        print(f"Wrote baseline to {baseline_path}")
+        return 0
+    baseline = read_baseline(baseline_path)
+    if baseline is None:
+        print(f"No usable baseline at {baseline_path}; run with --update-baseline")
+        return 0
+    regressions = find_regressions(results, baseline, opts.threshold)
+    for line in regressions:
+        print(f"REGRESSION: {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,6 +26,7 @@ if TYPE_CHECKING:
     from .requirement_metadata import RequirementMetadata
 
 from .ids import IdRecord
+from .source_corpus import SourceCorpus
 
 _IMPLEMENTS_RE = re.compile(r"^\s*#\s*implements:\s*(?P<ids>.+)$")
 _ID_TOKEN_RE = re.compile(
@@ -45,19 +46,22 @@ class CodeIndexEntry:
 
 
 def parse_code_annotations(
-    files: List[Path], project_root: Path
+    files: List[Path],
+    project_root: Path,
+    corpus: Optional[SourceCorpus] = None,
 ) -> List[CodeIndexEntry]:
     # implements: DES-assured-code-index-001
     """Walk files via EvidenceIndexRegistry; convert PYTHON_COMMENT entries to CodeIndexEntry.
 
     v0.1.0 compatibility shim: returns CodeIndexEntry for backward compatibility with
     existing render_code_index calls. New code paths should use EvidenceIndexRegistry directly.
+    Pass a shared *corpus* to avoid re-reading files other validators have loaded.
     """
     from .evidence_index import EvidenceIndexRegistry, EvidenceKind
 
     registry = EvidenceIndexRegistry.with_default_adapters()
     entries: List[CodeIndexEntry] = []
-    for ev in registry.scan(files, project_root):
+    for ev in registry.scan(files, project_root, corpus=corpus):
         if ev.kind != EvidenceKind.PYTHON_COMMENT:
             continue
         entries.append(
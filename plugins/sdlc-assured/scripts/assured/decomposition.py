@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import ast
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional, Union
 
 import yaml
 
+from .source_corpus import SourceCorpus
+
 
 class DecompositionParseError(ValueError):
     """Raised when programs.yaml cannot be parsed."""
@@ -59,10 +62,19 @@ class VisibilityRule:
     to_modules: List[str]
 
 
+@dataclass(frozen=True)
+class Layer:
+    """A named architectural layer; layers are declared top (most dependent) first."""
+
+    name: str
+    modules: List[str]
+
+
 @dataclass(frozen=True)
 class Decomposition:
     programs: List[Program]
     visibility: List[VisibilityRule] = field(default_factory=list)
+    layers: List[Layer] = field(default_factory=list)
 
 
 def parse_programs_yaml(path: Path) -> Decomposition:
@@ -122,7 +134,12 @@ def parse_programs_yaml(path: Path) -> Decomposition:
                 to_modules=list(v.get("to", [])),
             )
         )
-    return Decomposition(programs=programs, visibility=visibility)
+    layers: List[Layer] = []
+    for layer in raw.get("layers", []) or []:
+        layers.append(
+            Layer(name=layer["name"], modules=list(layer.get("modules", [])))
+        )
+    return Decomposition(programs=programs, visibility=visibility, layers=layers)
 
 
 def default_decomposition(
@@ -231,35 +248,155 @@ def _module_paths(decomp: Decomposition) -> dict:
     return out
 
 
-def _file_under_paths(file_path: str, paths: List[str]) -> bool:
-    return any(file_path.startswith(p) for p in paths)
+class ModulePathIndex:
+    """Prefix trie over every declared module path of a decomposition.
+
+    Module paths are plain string prefixes (``file_path.startswith(path)``),
+    so a file lies under every module owning a path on its trie walk.  One
+    walk answers "which modules cover this file" for all modules at once,
+    instead of a ``startswith`` scan per candidate module; answers are
+    memoised per file path, since many annotations share a file.
+
+    Build with :meth:`for_decomposition` to reuse one index per
+    ``Decomposition`` across validators.
+    """
+
+    _END = ""  # trie key for "a declared path ends here"; never a path character
+
+    def __init__(self, paths_by_module: dict) -> None:
+        self.paths_by_module: dict = {m: list(ps) for m, ps in paths_by_module.items()}
+        self._root: dict = {}
+        for module, paths in self.paths_by_module.items():
+            for path in paths:
+                node = self._root
+                for ch in path:
+                    node = node.setdefault(ch, {})
+                node.setdefault(self._END, []).append((len(path), module))
+        self._memo: dict = {}
+
+    @classmethod
+    def for_decomposition(cls, decomp: Decomposition) -> "ModulePathIndex":
+        # implements: DES-assured-decomposition-validators-002
+        """Return the shared index for *decomp*, building it on first use."""
+        key = id(decomp)
+        cached = _PATH_INDEX_CACHE.get(key)
+        if cached is not None and cached[0] is decomp:
+            _PATH_INDEX_CACHE.move_to_end(key)
+            return cached[1]
+        index = cls(_module_paths(decomp))
+        _PATH_INDEX_CACHE[key] = (decomp, index)
+        while len(_PATH_INDEX_CACHE) > _PATH_INDEX_CACHE_SIZE:
+            _PATH_INDEX_CACHE.popitem(last=False)
+        return index
+
+    def modules_covering(self, file_path: str) -> frozenset:
+        """Every module with a declared path that prefixes *file_path*."""
+        return frozenset(m for _, m in self._matches(file_path))
+
+    def is_under(self, file_path: str, module: str) -> bool:
+        """True when one of *module*'s declared paths prefixes *file_path*."""
+        return module in self.modules_covering(file_path)
+
+    def is_declared(self, file_path: str) -> bool:
+        """True when *file_path* lies under any declared module path."""
+        return bool(self._matches(file_path))
+
+    def owner(self, file_path: str) -> Optional[str]:
+        """Module owning the longest declared path prefixing *file_path*."""
+        matches = self._matches(file_path)
+        if not matches:
+            return None
+        return max(matches, key=lambda hit: (hit[0], hit[1]))[1]
+
+    def _matches(self, file_path: str) -> tuple:
+        hits = self._memo.get(file_path)
+        if hits is not None:
+            return hits
+        found: list = []
+        node = self._root
+        found.extend(node.get(self._END, ()))
+        for ch in file_path:
+            node = node.get(ch)
+            if node is None:
+                break
+            found.extend(node.get(self._END, ()))
+        hits = tuple(found)
+        self._memo[file_path] = hits
+        return hits
+
+
+_PATH_INDEX_CACHE_SIZE = 8
+_PATH_INDEX_CACHE: "OrderedDict[int, tuple]" = OrderedDict()
+
+
+@dataclass
+class _AnnotationScatter:
+    """Per-module inside/outside split of annotation citations (one pass)."""
+
+    inside: dict = field(default_factory=dict)  # module → in-path count
+    outside: dict = field(default_factory=dict)  # module → [(file, line, cited)]
+    strays: list = field(default_factory=list)  # (ann, cited, module), in order
+    annotated_ids: set = field(default_factory=set)
+
+
+def _annotation_scatter(
+    annotations: List[CodeAnnotation],
+    spec_module_lookup: dict,
+    index: ModulePathIndex,
+) -> _AnnotationScatter:
+    scatter = _AnnotationScatter()
+    for ann in annotations:
+        scatter.annotated_ids.update(ann.cited_ids)
+        covering = None
+        for cited in ann.cited_ids:
+            module = spec_module_lookup.get(cited)
+            if module is None:
+                continue
+            if covering is None:
+                covering = index.modules_covering(ann.file_path)
+            if module in covering:
+                scatter.inside[module] = scatter.inside.get(module, 0) + 1
+            else:
+                scatter.outside.setdefault(module, []).append(
+                    (ann.file_path, ann.line, cited)
+                )
+                scatter.strays.append((ann, cited, module))
+    return scatter
+
+
+def _resolve_index(
+    decomp: Decomposition, path_index: Optional[ModulePathIndex]
+) -> ModulePathIndex:
+    return path_index or ModulePathIndex.for_decomposition(decomp)
+
+
+def _maps_to_module_result(
+    scatter: _AnnotationScatter, index: ModulePathIndex
+) -> DecompositionValidatorResult:
+    errors = [
+        f"{ann.file_path}:{ann.line} cites {cited} (module {module}) "
+        f"but file is not under any declared path: "
+        f"{index.paths_by_module.get(module, [])}"
+        for ann, cited, module in scatter.strays
+    ]
+    return DecompositionValidatorResult(passed=not errors, errors=errors)
 
 
 def code_annotation_maps_to_module(
     annotations: List[CodeAnnotation],
     decomp: Decomposition,
     spec_module_lookup: dict,
+    path_index: Optional[ModulePathIndex] = None,
 ) -> DecompositionValidatorResult:
     # implements: DES-assured-decomposition-validators-002
     """Each annotation's file path must lie under its cited spec's module path.
 
     spec_module_lookup maps REQ/DES/TEST IDs to their declared module.
+    IDs missing from it are caught by cited_ids_resolve and skipped here.
     """
-    paths_by_module = _module_paths(decomp)
-    errors: List[str] = []
-    for ann in annotations:
-        for cited in ann.cited_ids:
-            module = spec_module_lookup.get(cited)
-            if module is None:
-                # Caught by cited_ids_resolve; skip here.
-                continue
-            allowed_paths = paths_by_module.get(module, [])
-            if not _file_under_paths(ann.file_path, allowed_paths):
-                errors.append(
-                    f"{ann.file_path}:{ann.line} cites {cited} (module {module}) "
-                    f"but file is not under any declared path: {allowed_paths}"
-                )
-    return DecompositionValidatorResult(passed=not errors, errors=errors)
+    index = _resolve_index(decomp, path_index)
+    scatter = _annotation_scatter(annotations, spec_module_lookup, index)
+    return _maps_to_module_result(scatter, index)
 
 
 @dataclass(frozen=True)
@@ -301,6 +438,7 @@ def anaemic_context_detection(
     decomp: Decomposition,
     spec_module_lookup: dict,
     scatter_threshold: float = 0.20,
+    path_index: Optional[ModulePathIndex] = None,
 ) -> DecompositionValidatorResult:
     # implements: DES-assured-decomposition-validators-004
     """Flag systemic anaemia: a module whose implementations are significantly scattered.
@@ -324,6 +462,9 @@ def anaemic_context_detection(
     scatter_threshold:
         Fraction of a module's annotations that must be outside the module's
         declared paths before the validator fires (0.0–1.0, default 0.20).
+    path_index:
+        Optional prebuilt :class:`ModulePathIndex`; defaults to the shared
+        index for *decomp*.
 
     Returns
     -------
@@ -331,23 +472,15 @@ def anaemic_context_detection(
         Errors for every module whose scatter ratio exceeds the threshold,
         listing the out-of-module annotations as evidence.
     """
-    paths_by_module = _module_paths(decomp)
-
-    # Collect per-module annotation counts: inside vs outside declared paths.
-    inside: dict = {}  # module → count of in-module annotations
-    outside: dict = {}  # module → list of (file_path, line, cited_id) triples
+    index = _resolve_index(decomp, path_index)
+    scatter = _annotation_scatter(annotations, spec_module_lookup, index)
+    return _anaemic_result(scatter, scatter_threshold)
 
-    for ann in annotations:
-        for cited in ann.cited_ids:
-            module = spec_module_lookup.get(cited)
-            if module is None:
-                continue
-            allowed_paths = paths_by_module.get(module, [])
-            if _file_under_paths(ann.file_path, allowed_paths):
-                inside[module] = inside.get(module, 0) + 1
-            else:
-                outside.setdefault(module, []).append((ann.file_path, ann.line, cited))
 
+def _anaemic_result(
+    scatter: _AnnotationScatter, scatter_threshold: float
+) -> DecompositionValidatorResult:
+    inside, outside = scatter.inside, scatter.outside
     errors: List[str] = []
     for module, stray_annotations in outside.items():
         stray_count = len(stray_annotations)
@@ -383,7 +516,18 @@ def granularity_match(
     annotated_ids: set[str] = set()
     for ann in annotations:
         annotated_ids.update(ann.cited_ids)
+    return _granularity_result(
+        declared_reqs, annotated_ids, decomp, spec_module_lookup, satisfies_graph
+    )
+
 
+def _granularity_result(
+    declared_reqs: List[str],
+    annotated_ids: set,
+    decomp: Decomposition,
+    spec_module_lookup: dict,
+    satisfies_graph: Optional[dict],
+) -> DecompositionValidatorResult:
     granularity_by_module: dict[str, str] = {}
     for p in decomp.programs:
         for sp in p.sub_programs:
@@ -416,6 +560,41 @@ def granularity_match(
     return DecompositionValidatorResult(passed=True, warnings=warnings)
 
 
+def run_annotation_validators(
+    annotations: List[CodeAnnotation],
+    decomp: Decomposition,
+    spec_module_lookup: dict,
+    declared_reqs: Optional[List[str]] = None,
+    satisfies_graph: Optional[dict[str, list[str]]] = None,
+    scatter_threshold: float = 0.20,
+    path_index: Optional[ModulePathIndex] = None,
+) -> dict[str, DecompositionValidatorResult]:
+    # implements: DES-assured-decomposition-validators-002
+    """Run every annotation-driven decomposition validator in one pass.
+
+    Walks *annotations* once to split each module's citations into inside /
+    outside its declared paths, then derives the results of
+    ``code_annotation_maps_to_module``, ``anaemic_context_detection`` and
+    (when *declared_reqs* is given) ``granularity_match`` from those counts.
+    Results are keyed by validator name and equal the individual calls.
+    """
+    index = _resolve_index(decomp, path_index)
+    scatter = _annotation_scatter(annotations, spec_module_lookup, index)
+    results = {
+        "code_annotation_maps_to_module": _maps_to_module_result(scatter, index),
+        "anaemic_context_detection": _anaemic_result(scatter, scatter_threshold),
+    }
+    if declared_reqs is not None:
+        results["granularity_match"] = _granularity_result(
+            declared_reqs,
+            scatter.annotated_ids,
+            decomp,
+            spec_module_lookup,
+            satisfies_graph,
+        )
+    return results
+
+
 def _is_single_line_getter_setter(node: ast.FunctionDef) -> bool:
     """Return True if the function body is a single return-self-attr or assign-self-attr."""
     if len(node.body) != 1:
@@ -498,6 +677,7 @@ def _collect_functions(
 def forward_annotation_completeness(
     source_paths: List[Path],
     decomp: Decomposition,
+    corpus: Optional[SourceCorpus] = None,
 ) -> DecompositionValidatorResult:
     # implements: DES-assured-decomposition-validators-006
     """E2: every non-trivial public function in declared paths has a `# implements:` annotation.
@@ -505,29 +685,29 @@ def forward_annotation_completeness(
     Returns errors (not warnings) for functions missing annotations.
     Files outside declared module paths are silently skipped.
     Test files (test_*.py, conftest.py) are silently skipped.
+
+    Pass a shared *corpus* to reuse file text and ASTs already loaded by
+    other validators in the same run.
     """
-    declared_paths: List[str] = []
-    for p in decomp.programs:
-        for sp in p.sub_programs:
-            for m in sp.modules:
-                declared_paths.extend(m.paths)
+    if corpus is None:
+        corpus = SourceCorpus()
+    index = ModulePathIndex.for_decomposition(decomp)
 
     errors: List[str] = []
     for src in source_paths:
         # Skip files outside declared module paths
-        if not _file_under_paths(str(src), declared_paths):
+        if not index.is_declared(str(src)):
             continue
         # Skip test files and conftest — check filename only (not directory components)
         if src.name.startswith("test_") or src.name == "conftest.py":
             continue
 
         try:
-            source_text = src.read_text(encoding="utf-8")
-            tree = ast.parse(source_text, filename=str(src))
+            tree = corpus.tree(src)
         except (SyntaxError, OSError):
             continue
 
-        source_lines = source_text.splitlines()
+        source_lines = corpus.lines(src)
 
         for node in _collect_functions(tree):
             if _is_trivial(node):
@@ -9,13 +9,18 @@ from pathlib import Path
 from typing import Dict, List, Optional, Protocol, runtime_checkable
 
 from .decomposition import Decomposition, ImportEdge
+from .source_corpus import SourceCorpus, accepts_corpus
 
 __all__ = [
     "ImportEdge",
     "DependencyExtractor",
     "PythonAstExtractor",
     "GenericRegexExtractor",
+    "MultiLanguageRegexExtractor",
     "make_swift_extractor",
+    "make_kotlin_extractor",
+    "make_typescript_extractor",
+    "make_multi_language_extractor",
     "render_dependency_edges",
     "parse_dependency_edges",
     "build_dependency_edges",
@@ -26,12 +31,19 @@ logger = logging.getLogger(__name__)
 
 @runtime_checkable
 class DependencyExtractor(Protocol):
-    """Language-specific extractor of cross-module dependency edges."""
+    """Language-specific extractor of cross-module dependency edges.
+
+    ``corpus`` is optional: extractors whose ``extract`` takes only
+    ``(source_paths, programs)`` are still called, just without the shared corpus.
+    """
 
     language: str  # e.g. "python", "swift"
 
     def extract(
-        self, source_paths: List[Path], programs: Decomposition
+        self,
+        source_paths: List[Path],
+        programs: Decomposition,
+        corpus: Optional[SourceCorpus] = None,
     ) -> List[ImportEdge]:
         ...
 
@@ -52,9 +64,18 @@ class PythonAstExtractor:
     # ------------------------------------------------------------------
 
     def extract(
-        self, source_paths: List[Path], programs: Decomposition
+        self,
+        source_paths: List[Path],
+        programs: Decomposition,
+        corpus: Optional[SourceCorpus] = None,
     ) -> List[ImportEdge]:
-        """Return ImportEdges for all cross-module imports found in *source_paths*."""
+        """Return ImportEdges for all cross-module imports found in *source_paths*.
+
+        A shared *corpus* lets the extractor reuse ASTs already parsed by
+        ``forward_annotation_completeness`` in the same run.
+        """
+        if corpus is None:
+            corpus = SourceCorpus()
         path_index = self._build_path_index(source_paths, programs)
         seen: set = set()
         edges: List[ImportEdge] = []
@@ -69,9 +90,7 @@ class PythonAstExtractor:
                 continue
 
             try:
-                tree = ast.parse(
-                    src_path.read_text(encoding="utf-8"), filename=str(src_path)
-                )
+                tree = corpus.tree(src_path)
             except SyntaxError:
                 logger.warning(
                     "dependency_extractor: syntax error in %s — skipping", src_path
@@ -204,7 +223,10 @@ class GenericRegexExtractor:
         self._import_pattern = import_pattern
 
     def extract(
-        self, source_paths: List[Path], programs: Decomposition
+        self,
+        source_paths: List[Path],
+        programs: Decomposition,
+        corpus: Optional[SourceCorpus] = None,
     ) -> List[ImportEdge]:
         """Return ImportEdges by matching *import_pattern* against file text.
 
@@ -212,42 +234,82 @@ class GenericRegexExtractor:
         is identical regardless of language — only the import-detection step
         differs (regex text scan vs AST walk).
         """
-        py = PythonAstExtractor()
-        path_to_module: Dict[Path, str] = py._build_path_index(source_paths, programs)
-        seen: set = set()
-        edges: List[ImportEdge] = []
+        patterns = {ext: [self._import_pattern] for ext in self._file_extensions}
+        return _extract_by_suffix(source_paths, programs, patterns, corpus)
 
-        for src_path in source_paths:
-            if src_path.suffix not in self._file_extensions:
-                continue
-            if not src_path.is_file():
-                continue
-            from_module = py._resolve_module(src_path, programs)
-            if from_module is None:
-                continue
-            try:
-                text = src_path.read_text(encoding="utf-8")
-            except OSError:
-                logger.warning(
-                    "dependency_extractor: cannot read %s — skipping", src_path
-                )
-                continue
-            for match in self._import_pattern.finditer(text):
-                target_name = match.group(1)
-                for known_path, module_id in path_to_module.items():
-                    stem = known_path.stem.lower()
-                    parent = known_path.parent.name.lower()
-                    if target_name.lower() in (stem, parent):
-                        if module_id != from_module:
-                            edge = ImportEdge(
-                                from_module=from_module, to_module=module_id
-                            )
-                            if edge not in seen:
-                                seen.add(edge)
-                                edges.append(edge)
-                        break
 
-        return edges
+class MultiLanguageRegexExtractor:
+    """Combines several :class:`GenericRegexExtractor` configurations in one pass.
+
+    Mixed-language trees (e.g. a Swift + Kotlin + TypeScript mobile monorepo)
+    would otherwise be walked once per language.  This extractor builds the
+    path → module index and the import-target index once, reads each file
+    once, and dispatches to the import patterns registered for its suffix.
+    """
+
+    def __init__(self, extractors: List[GenericRegexExtractor]) -> None:
+        self.language = "+".join(e.language for e in extractors)
+        self._patterns: Dict[str, List["_re.Pattern[str]"]] = {}
+        for extractor in extractors:
+            for ext in extractor._file_extensions:
+                self._patterns.setdefault(ext, []).append(extractor._import_pattern)
+
+    def extract(
+        self,
+        source_paths: List[Path],
+        programs: Decomposition,
+        corpus: Optional[SourceCorpus] = None,
+    ) -> List[ImportEdge]:
+        """Return ImportEdges for every file whose suffix has a registered pattern."""
+        return _extract_by_suffix(source_paths, programs, self._patterns, corpus)
+
+
+def _extract_by_suffix(
+    source_paths: List[Path],
+    programs: Decomposition,
+    patterns_by_suffix: Dict[str, List["_re.Pattern[str]"]],
+    corpus: Optional[SourceCorpus],
+) -> List[ImportEdge]:
+    """Shared regex scan: one index build, one read per file, suffix dispatch.
+
+    Import targets are resolved through a lowercase ``stem``/``parent-dir``
+    → module map built once, in *source_paths* order, so the first file
+    whose stem or parent directory matches the imported name wins — the
+    same precedence as the original per-match linear scan.
+    """
+    if corpus is None:
+        corpus = SourceCorpus()
+    path_to_module = PythonAstExtractor()._build_path_index(source_paths, programs)
+    target_index: Dict[str, str] = {}
+    for known_path, module_id in path_to_module.items():
+        target_index.setdefault(known_path.stem.lower(), module_id)
+        target_index.setdefault(known_path.parent.name.lower(), module_id)
+
+    seen: set = set()
+    edges: List[ImportEdge] = []
+    for src_path in source_paths:
+        patterns = patterns_by_suffix.get(src_path.suffix)
+        if not patterns:
+            continue
+        from_module = path_to_module.get(src_path)
+        if from_module is None or not src_path.is_file():
+            continue
+        try:
+            text = corpus.text(src_path)
+        except OSError:
+            logger.warning("dependency_extractor: cannot read %s — skipping", src_path)
+            continue
+        for pattern in patterns:
+            for match in pattern.finditer(text):
+                module_id = target_index.get(match.group(1).lower())
+                if module_id is None or module_id == from_module:
+                    continue
+                edge = ImportEdge(from_module=from_module, to_module=module_id)
+                if edge not in seen:
+                    seen.add(edge)
+                    edges.append(edge)
+
+    return edges
 
 
 def make_swift_extractor() -> GenericRegexExtractor:
@@ -259,6 +321,58 @@ def make_swift_extractor() -> GenericRegexExtractor:
     )
 
 
+def make_kotlin_extractor() -> GenericRegexExtractor:
+    """Return a Kotlin import extractor.
+
+    Captures the last segment of the imported name — the class for
+    ``import com.acme.auth.LoginService`` and the package for
+    ``import com.acme.auth.*`` — which is then matched against file stems
+    and parent directory names.
+    """
+    return GenericRegexExtractor(
+        language="kotlin",
+        file_extensions=(".kt", ".kts"),
+        import_pattern=_re.compile(
+            r"^\s*import\s+(?:\w+\.)*?(\w+)(?:\.\*)?(?:\s+as\s+\w+)?\s*$",
+            _re.MULTILINE,
+        ),
+    )
+
+
+def make_typescript_extractor() -> GenericRegexExtractor:
+    """Return a TypeScript/JavaScript import extractor.
+
+    Matches ``import … from '<spec>'``, side-effect ``import '<spec>'`` and
+    ``require('<spec>')``, capturing the last path segment of the module
+    specifier without its extension.
+    """
+    return GenericRegexExtractor(
+        language="typescript",
+        file_extensions=(".ts", ".tsx", ".js", ".jsx"),
+        import_pattern=_re.compile(
+            r"""(?:\bfrom\s+|^\s*import\s+|\brequire\(\s*)['"]"""
+            r"""(?:[^'"]*/)?([\w.-]+?)(?:\.[jt]sx?)?['"]""",
+            _re.MULTILINE,
+        ),
+    )
+
+
+def make_multi_language_extractor(
+    extractors: Optional[List[GenericRegexExtractor]] = None,
+) -> MultiLanguageRegexExtractor:
+    """Return a single-pass extractor for Swift, Kotlin and TypeScript sources.
+
+    Pass *extractors* to combine a different set of language configurations.
+    """
+    if extractors is None:
+        extractors = [
+            make_swift_extractor(),
+            make_kotlin_extractor(),
+            make_typescript_extractor(),
+        ]
+    return MultiLanguageRegexExtractor(extractors)
+
+
 def render_dependency_edges(edges: List[ImportEdge], library_handle: str) -> str:
     """Render edges as a markdown table for library/_dependency-edges.md."""
     lines = [
@@ -297,14 +411,22 @@ def build_dependency_edges(
     source_paths: List[Path],
     programs: Decomposition,
     extractors: List[DependencyExtractor],
+    corpus: Optional[SourceCorpus] = None,
 ) -> List[ImportEdge]:
     """Run each extractor on source_paths; return deduplicated union of edges.
 
     Merges results from all extractors, deduplicates via a set, and returns
-    edges sorted by (from_module, to_module) for deterministic output.
+    edges sorted by (from_module, to_module) for deterministic output.  All
+    extractors share one *corpus*, so a file read by one is not re-read by
+    the next.
     """
+    if corpus is None:
+        corpus = SourceCorpus()
     seen: set = set()
     for extractor in extractors:
-        for edge in extractor.extract(source_paths, programs):
-            seen.add(edge)
+        if accepts_corpus(extractor.extract):
+            edges = extractor.extract(source_paths, programs, corpus=corpus)
+        else:
+            edges = extractor.extract(source_paths, programs)
+        seen.update(edges)
     return sorted(seen, key=lambda e: (e.from_module, e.to_module))
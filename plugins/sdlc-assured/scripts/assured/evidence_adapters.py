@@ -5,9 +5,10 @@ from __future__ import annotations
 import re
 import yaml as _yaml
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
 
 from .evidence_index import EvidenceIndexEntry, EvidenceKind
+from .source_corpus import SourceCorpus
 
 
 _IMPLEMENTS_RE = re.compile(r"^\s*#\s*implements:\s*(?P<ids>.+)$")
@@ -22,19 +23,23 @@ class PythonCommentAdapter:
     file_extensions = (".py",)
 
     def extract(
-        self, files: list[Path], project_root: Path
+        self,
+        files: list[Path],
+        project_root: Path,
+        corpus: Optional[SourceCorpus] = None,
     ) -> Iterable[EvidenceIndexEntry]:
+        if corpus is None:
+            corpus = SourceCorpus()
         for f in files:
             if f.suffix not in self.file_extensions:
                 continue
             if not f.is_file():
                 continue
-            text = f.read_text(encoding="utf-8")
             try:
                 rel_path = str(f.relative_to(project_root))
             except ValueError:
                 rel_path = str(f.name)
-            for line_no, line in enumerate(text.splitlines(), start=1):
+            for line_no, line in enumerate(corpus.lines(f), start=1):
                 m = _IMPLEMENTS_RE.match(line)
                 if not m:
                     continue
@@ -69,19 +74,23 @@ class MarkdownHtmlCommentAdapter:
     file_extensions = (".md",)
 
     def extract(
-        self, files: list[Path], project_root: Path
+        self,
+        files: list[Path],
+        project_root: Path,
+        corpus: Optional[SourceCorpus] = None,
     ) -> Iterable[EvidenceIndexEntry]:
+        if corpus is None:
+            corpus = SourceCorpus()
         for f in files:
             if f.suffix not in self.file_extensions:
                 continue
             if not f.is_file():
                 continue
-            text = f.read_text(encoding="utf-8")
             try:
                 rel_path = str(f.relative_to(project_root))
             except ValueError:
                 rel_path = str(f.name)
-            for line_no, line in enumerate(text.splitlines(), start=1):
+            for line_no, line in enumerate(corpus.lines(f), start=1):
                 m = _HTML_IMPLEMENTS_RE.search(line)
                 if not m:
                     continue
@@ -100,12 +109,17 @@ class YamlFrontmatterAdapter:
     file_extensions = (".md",)
 
     def extract(
-        self, files: list[Path], project_root: Path
+        self,
+        files: list[Path],
+        project_root: Path,
+        corpus: Optional[SourceCorpus] = None,
     ) -> Iterable[EvidenceIndexEntry]:
+        if corpus is None:
+            corpus = SourceCorpus()
         for f in files:
             if f.suffix not in self.file_extensions or not f.is_file():
                 continue
-            text = f.read_text(encoding="utf-8")
+            text = corpus.text(f)
             fm = _parse_frontmatter(text)
             if not fm or "implements" not in fm:
                 continue
@@ -130,12 +144,17 @@ class SatisfiesByExistenceAdapter:
     file_extensions = (".md",)
 
     def extract(
-        self, files: list[Path], project_root: Path
+        self,
+        files: list[Path],
+        project_root: Path,
+        corpus: Optional[SourceCorpus] = None,
     ) -> Iterable[EvidenceIndexEntry]:
+        if corpus is None:
+            corpus = SourceCorpus()
         for f in files:
             if f.suffix not in self.file_extensions or not f.is_file():
                 continue
-            text = f.read_text(encoding="utf-8")
+            text = corpus.text(f)
             fm = _parse_frontmatter(text)
             if not fm or "satisfies_by_existence" not in fm:
                 continue
@@ -11,6 +11,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Iterable, List, Optional, Protocol
 
+from .source_corpus import SourceCorpus, accepts_corpus
+
 
 class EvidenceKind(Enum):
     """Kind of evidence carried by an EvidenceIndexEntry."""
@@ -34,12 +36,19 @@ class EvidenceIndexEntry:
 
 
 class EvidenceAdapter(Protocol):
-    """Protocol for file-type-specific evidence adapters."""
+    """Protocol for file-type-specific evidence adapters.
+
+    ``corpus`` is optional: adapters whose ``extract`` takes only
+    ``(files, project_root)`` are still called, just without the shared corpus.
+    """
 
     file_extensions: tuple[str, ...]
 
     def extract(
-        self, files: list[Path], project_root: Path
+        self,
+        files: list[Path],
+        project_root: Path,
+        corpus: Optional[SourceCorpus] = None,
     ) -> Iterable[EvidenceIndexEntry]:
         ...
 
@@ -69,7 +78,16 @@ class EvidenceIndexRegistry:
         )
 
     def scan(
-        self, files: list[Path], project_root: Path
+        self,
+        files: list[Path],
+        project_root: Path,
+        corpus: Optional[SourceCorpus] = None,
     ) -> Iterable[EvidenceIndexEntry]:
+        """Run every adapter over *files*, sharing one corpus so each file is read once."""
+        if corpus is None:
+            corpus = SourceCorpus()
         for adapter in self._adapters:
-            yield from adapter.extract(files, project_root)
+            if accepts_corpus(adapter.extract):
+                yield from adapter.extract(files, project_root, corpus=corpus)
+            else:
+                yield from adapter.extract(files, project_root)
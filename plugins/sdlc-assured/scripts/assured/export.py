@@ -1,9 +1,17 @@
-"""Standard-specific traceability exports."""
+"""Standard-specific traceability exports.
+
+Every exporter is built on a line (or row) generator and comes in two
+forms: ``export_*`` returns the whole document as a string, and the
+matching ``write_*`` streams the same bytes to an open text handle so
+programme-level matrices never materialise as one giant string.
+"""
 
 from __future__ import annotations
 
+import csv
+import io
 from collections import defaultdict
-from typing import List, Mapping, Optional
+from typing import Iterator, List, Mapping, Optional, TextIO
 
 from .evidence_index import EvidenceIndexEntry
 from .evidence_status import EvidenceStatus
@@ -64,6 +72,25 @@ def _format_source_cell(
     return EvidenceStatus.MISSING.display()
 
 
+def _write_lines(lines: Iterator[str], out: TextIO) -> None:
+    for line in lines:
+        out.write(line)
+        out.write("\n")
+
+
+def _join_lines(lines: Iterator[str]) -> str:
+    buf = io.StringIO()
+    _write_lines(lines, buf)
+    return buf.getvalue()
+
+
+def _with_header(
+    header: tuple[str, ...], rows: Iterator[tuple[str, ...]]
+) -> Iterator[tuple[str, ...]]:
+    yield header
+    yield from rows
+
+
 def export_do178c_rtm(
     records: List[IdRecord],
     evidence: List[EvidenceIndexEntry],
@@ -80,9 +107,28 @@ def export_do178c_rtm(
 
     **DES:** DES-assured-export-formats-001
     """
+    return _join_lines(_do178c_lines(records, evidence, metadata))
+
+
+def write_do178c_rtm(
+    records: List[IdRecord],
+    evidence: List[EvidenceIndexEntry],
+    metadata: Mapping[str, RequirementMetadata],
+    out: TextIO,
+) -> None:
+    # implements: DES-assured-export-formats-001
+    """Stream :func:`export_do178c_rtm` output to *out* row by row."""
+    _write_lines(_do178c_lines(records, evidence, metadata), out)
+
+
+def _do178c_lines(
+    records: List[IdRecord],
+    evidence: List[EvidenceIndexEntry],
+    metadata: Mapping[str, RequirementMetadata],
+) -> Iterator[str]:
     cited_by = _index_by_satisfies(records)
     evidence_by_cited = _evidence_by_cited(evidence)
-    lines = [
+    yield from [
         "# Requirements Traceability Matrix (DO-178C)",
         "",
         (
@@ -94,8 +140,7 @@ def export_do178c_rtm(
         "|-----|-----|-------------|-----------|",
     ]
     _missing = EvidenceStatus.MISSING.display()
-    reqs = [r for r in records if r.kind == "REQ"]
-    for req in reqs:
+    for req in (r for r in records if r.kind == "REQ"):
         deses = [d for d in cited_by.get(req.id, []) if d.kind == "DES"]
         for des in deses:
             tests = [t for t in cited_by.get(des.id, []) if t.kind == "TEST"]
@@ -104,11 +149,10 @@ def export_do178c_rtm(
             )
             source_cell = _format_source_cell(evidence_cells, metadata.get(req.id))
             test_str = ", ".join(t.id for t in tests) or _missing
-            lines.append(f"| {req.id} | {des.id} | {source_cell} | {test_str} |")
+            yield f"| {req.id} | {des.id} | {source_cell} | {test_str} |"
         if not deses:
             source_cell = _format_source_cell([], metadata.get(req.id))
-            lines.append(f"| {req.id} | {_missing} | {source_cell} | {_missing} |")
-    return "\n".join(lines) + "\n"
+            yield f"| {req.id} | {_missing} | {source_cell} | {_missing} |"
 
 
 def export_iec_62304_matrix(
@@ -128,9 +172,34 @@ def export_iec_62304_matrix(
 
     **DES:** DES-assured-export-formats-002
     """
+    return _join_lines(
+        _iec_62304_lines(records, evidence, metadata, software_safety_class)
+    )
+
+
+def write_iec_62304_matrix(
+    records: List[IdRecord],
+    evidence: List[EvidenceIndexEntry],
+    metadata: Mapping[str, RequirementMetadata],
+    out: TextIO,
+    software_safety_class: str = "A",
+) -> None:
+    # implements: DES-assured-export-formats-002
+    """Stream :func:`export_iec_62304_matrix` output to *out* row by row."""
+    _write_lines(
+        _iec_62304_lines(records, evidence, metadata, software_safety_class), out
+    )
+
+
+def _iec_62304_lines(
+    records: List[IdRecord],
+    evidence: List[EvidenceIndexEntry],
+    metadata: Mapping[str, RequirementMetadata],
+    software_safety_class: str,
+) -> Iterator[str]:
     cited_by = _index_by_satisfies(records)
     evidence_by_cited = _evidence_by_cited(evidence)
-    lines = [
+    yield from [
         "# IEC 62304 Software Traceability Matrix",
         "",
         f"Software safety class: {software_safety_class}",
@@ -138,8 +207,7 @@ def export_iec_62304_matrix(
         "| Software requirement | Software unit | Verification activity |",
         "|----------------------|---------------|------------------------|",
     ]
-    reqs = [r for r in records if r.kind == "REQ"]
-    for req in reqs:
+    for req in (r for r in records if r.kind == "REQ"):
         units: list[EvidenceIndexEntry] = list(evidence_by_cited.get(req.id, []))
         deses = [d for d in cited_by.get(req.id, []) if d.kind == "DES"]
         tests: List[IdRecord] = []
@@ -148,8 +216,7 @@ def export_iec_62304_matrix(
             tests.extend([t for t in cited_by.get(des.id, []) if t.kind == "TEST"])
         unit_cell = _format_source_cell(units, metadata.get(req.id))
         test_str = ", ".join(t.id for t in tests) or EvidenceStatus.MISSING.display()
-        lines.append(f"| {req.id} | {unit_cell} | {test_str} |")
-    return "\n".join(lines) + "\n"
+        yield f"| {req.id} | {unit_cell} | {test_str} |"
 
 
 def export_iso_26262_asil_matrix(
@@ -169,9 +236,30 @@ def export_iso_26262_asil_matrix(
 
     **DES:** DES-assured-export-formats-003
     """
+    return _join_lines(_iso_26262_lines(records, evidence, metadata, asil_level))
+
+
+def write_iso_26262_asil_matrix(
+    records: List[IdRecord],
+    evidence: List[EvidenceIndexEntry],
+    metadata: Mapping[str, RequirementMetadata],
+    out: TextIO,
+    asil_level: str = "B",
+) -> None:
+    # implements: DES-assured-export-formats-003
+    """Stream :func:`export_iso_26262_asil_matrix` output to *out* row by row."""
+    _write_lines(_iso_26262_lines(records, evidence, metadata, asil_level), out)
+
+
+def _iso_26262_lines(
+    records: List[IdRecord],
+    evidence: List[EvidenceIndexEntry],
+    metadata: Mapping[str, RequirementMetadata],
+    asil_level: str,
+) -> Iterator[str]:
     cited_by = _index_by_satisfies(records)
     evidence_by_cited = _evidence_by_cited(evidence)
-    lines = [
+    yield from [
         "# ISO 26262 ASIL Traceability Matrix",
         "",
         f"ASIL: {asil_level}",
@@ -180,8 +268,7 @@ def export_iso_26262_asil_matrix(
         "|---------------------|----------------------|----------------|---------------|",
     ]
     _missing = EvidenceStatus.MISSING.display()
-    reqs = [r for r in records if r.kind == "REQ"]
-    for req in reqs:
+    for req in (r for r in records if r.kind == "REQ"):
         deses = [d for d in cited_by.get(req.id, []) if d.kind == "DES"]
         for des in deses:
             tests = [t for t in cited_by.get(des.id, []) if t.kind == "TEST"]
@@ -190,11 +277,10 @@ def export_iso_26262_asil_matrix(
             )
             source_cell = _format_source_cell(evidence_cells, metadata.get(req.id))
             test_str = ", ".join(t.id for t in tests) or _missing
-            lines.append(f"| {req.id} | {des.id} | {source_cell} | {test_str} |")
+            yield f"| {req.id} | {des.id} | {source_cell} | {test_str} |"
         if not deses:
             source_cell = _format_source_cell([], metadata.get(req.id))
-            lines.append(f"| {req.id} | {_missing} | {source_cell} | {_missing} |")
-    return "\n".join(lines) + "\n"
+            yield f"| {req.id} | {_missing} | {source_cell} | {_missing} |"
 
 
 def export_fda_dhf_structure(
@@ -213,11 +299,30 @@ def export_fda_dhf_structure(
 
     **DES:** DES-assured-export-formats-004
     """
+    return _join_lines(_fda_dhf_lines(records, evidence, metadata))
+
+
+def write_fda_dhf_structure(
+    records: List[IdRecord],
+    evidence: List[EvidenceIndexEntry],
+    metadata: Mapping[str, RequirementMetadata],
+    out: TextIO,
+) -> None:
+    # implements: DES-assured-export-formats-004
+    """Stream :func:`export_fda_dhf_structure` output to *out* section by section."""
+    _write_lines(_fda_dhf_lines(records, evidence, metadata), out)
+
+
+def _fda_dhf_lines(
+    records: List[IdRecord],
+    evidence: List[EvidenceIndexEntry],
+    metadata: Mapping[str, RequirementMetadata],
+) -> Iterator[str]:
     _missing = EvidenceStatus.MISSING.display()
     reqs = [r for r in records if r.kind == "REQ"]
     deses = [r for r in records if r.kind == "DES"]
     tests = [r for r in records if r.kind == "TEST"]
-    lines = [
+    yield from [
         "# FDA Design History File (21 CFR §820.30)",
         "",
         (
@@ -231,61 +336,62 @@ def export_fda_dhf_structure(
         "",
     ]
     for r in reqs:
-        lines.append(f"- **{r.id}**: see {r.source}")
+        yield f"- **{r.id}**: see {r.source}"
     if not reqs:
-        lines.append("_(no requirements declared)_")
-    lines.extend(["", "## Design outputs", "", "(Per §820.30(d) — Design outputs)", ""])
+        yield "_(no requirements declared)_"
+    yield from ["", "## Design outputs", "", "(Per §820.30(d) — Design outputs)", ""]
     for d in deses:
-        lines.append(f"- **{d.id}** satisfies {', '.join(d.satisfies)}: see {d.source}")
-    lines.append("")
+        yield f"- **{d.id}** satisfies {', '.join(d.satisfies)}: see {d.source}"
+    yield ""
     for e in evidence:
         cited = ", ".join(e.cited_ids)
         loc = f"{e.source}:{e.line}" if e.line is not None else e.source
-        lines.append(f"- Evidence: `{loc}` implements {cited}")
+        yield f"- Evidence: `{loc}` implements {cited}"
     if not deses and not evidence:
-        lines.append(f"_({_missing} — no design outputs declared)_")
-    lines.extend(
-        ["", "## Design verification", "", "(Per §820.30(f) — Design verification)", ""]
-    )
+        yield f"_({_missing} — no design outputs declared)_"
+    yield from [
+        "",
+        "## Design verification",
+        "",
+        "(Per §820.30(f) — Design verification)",
+        "",
+    ]
     for t in tests:
-        lines.append(f"- **{t.id}** verifies {', '.join(t.satisfies)}: see {t.source}")
+        yield f"- **{t.id}** verifies {', '.join(t.satisfies)}: see {t.source}"
     if not tests:
-        lines.append(f"_({_missing} — no verification tests declared)_")
-    lines.extend(
-        [
-            "",
-            "## Design validation",
-            "",
-            "(Per §820.30(g) — Design validation)",
-            "",
-            (
-                "_Design validation is performed under defined operating conditions on initial"
-                + " production units, units that simulate them, or their equivalents._"
-                + " This section is a placeholder for human-attested validation evidence;"
-                + " the framework does not auto-populate it."
-            ),
-            "",
-        ]
-    )
-    return "\n".join(lines)
+        yield f"_({_missing} — no verification tests declared)_"
+    yield from [
+        "",
+        "## Design validation",
+        "",
+        "(Per §820.30(g) — Design validation)",
+        "",
+        (
+            "_Design validation is performed under defined operating conditions on initial"
+            + " production units, units that simulate them, or their equivalents._"
+            + " This section is a placeholder for human-attested validation evidence;"
+            + " the framework does not auto-populate it."
+        ),
+    ]
 
 
-def _build_rows(
+def iter_rows(
     records: List[IdRecord],
     evidence: List[EvidenceIndexEntry],
     metadata: Mapping[str, RequirementMetadata],
-) -> list[tuple[str, str, str, str]]:
-    """Shared helper — yields one row per (REQ, DES, tests, evidence) combination.
+) -> Iterator[tuple[str, str, str, str]]:
+    # implements: DES-assured-export-formats-004
+    """Yield one ``(REQ, DES, TEST, CODE)`` row per (REQ, DES) combination.
 
-    Emits a stub row for any REQ with no DES.
+    Emits a stub row for any REQ with no DES.  Rows are produced lazily so
+    the CSV and Markdown writers never hold the whole matrix in memory.
     """
     cited_by = _index_by_satisfies(records)
     evidence_by_cited = _evidence_by_cited(evidence)
-    rows: list[tuple[str, str, str, str]] = []
-    for req in [r for r in records if r.kind == "REQ"]:
+    for req in (r for r in records if r.kind == "REQ"):
         deses = [d for d in cited_by.get(req.id, []) if d.kind == "DES"]
         if not deses:
-            rows.append((req.id, "", "", ""))
+            yield (req.id, "", "", "")
             continue
         for des in deses:
             tests = [t for t in cited_by.get(des.id, []) if t.kind == "TEST"]
@@ -294,8 +400,19 @@ def _build_rows(
             )
             source_cell = _format_source_cell(evidence_cells, metadata.get(req.id))
             test_str = "; ".join(t.id for t in tests)
-            rows.append((req.id, des.id, test_str, source_cell))
-    return rows
+            yield (req.id, des.id, test_str, source_cell)
+
+
+_CSV_HEADER = ("REQ", "DES", "TEST", "CODE")
+
+
+def _build_rows(
+    records: List[IdRecord],
+    evidence: List[EvidenceIndexEntry],
+    metadata: Mapping[str, RequirementMetadata],
+) -> list[tuple[str, str, str, str]]:
+    """Materialised :func:`iter_rows`, kept for existing callers."""
+    return list(iter_rows(records, evidence, metadata))
 
 
 def export_csv(
@@ -307,15 +424,32 @@ def export_csv(
     """Generic CSV traceability export.
 
     Header: REQ,DES,TEST,CODE. Commas within cells are replaced with semicolons
-    to avoid breaking the CSV structure.
+    to avoid breaking the CSV structure.  Use :func:`write_csv` for RFC 4180
+    quoting that preserves cell text verbatim.
 
     **DES:** DES-assured-export-formats-004 (non-regulatory companion)
     """
-    rows = _build_rows(records, evidence, metadata)
-    out = ["REQ,DES,TEST,CODE"]
-    for r in rows:
-        out.append(",".join(c.replace(",", ";") for c in r))
-    return "\n".join(out) + "\n"
+    rows = _with_header(_CSV_HEADER, iter_rows(records, evidence, metadata))
+    return _join_lines(",".join(c.replace(",", ";") for c in row) for row in rows)
+
+
+def write_csv(
+    records: List[IdRecord],
+    evidence: List[EvidenceIndexEntry],
+    metadata: Mapping[str, RequirementMetadata],
+    out: TextIO,
+) -> None:
+    # implements: DES-assured-export-formats-004
+    """Stream the CSV traceability matrix to *out* using the ``csv`` module.
+
+    Cells are quoted only when they contain a comma, quote or newline, so
+    for such cell-clean matrices the bytes match :func:`export_csv`; cells
+    that do contain commas keep their text instead of having commas
+    rewritten to semicolons.  Open *out* with ``newline=""``.
+    """
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(_CSV_HEADER)
+    writer.writerows(iter_rows(records, evidence, metadata))
 
 
 def export_markdown(
@@ -331,13 +465,30 @@ def export_markdown(
 
     **DES:** DES-assured-export-formats-004 (non-regulatory companion)
     """
-    rows = _build_rows(records, evidence, metadata)
-    out = [
+    return _join_lines(_markdown_lines(records, evidence, metadata))
+
+
+def write_markdown(
+    records: List[IdRecord],
+    evidence: List[EvidenceIndexEntry],
+    metadata: Mapping[str, RequirementMetadata],
+    out: TextIO,
+) -> None:
+    # implements: DES-assured-export-formats-004
+    """Stream :func:`export_markdown` output to *out* row by row."""
+    _write_lines(_markdown_lines(records, evidence, metadata), out)
+
+
+def _markdown_lines(
+    records: List[IdRecord],
+    evidence: List[EvidenceIndexEntry],
+    metadata: Mapping[str, RequirementMetadata],
+) -> Iterator[str]:
+    yield from [
         "# Traceability Matrix",
         "",
         "| REQ | DES | TEST | CODE |",
         "|-----|-----|------|------|",
     ]
-    for r in rows:
-        out.append("| " + " | ".join(r) + " |")
-    return "\n".join(out) + "\n"
+    for r in iter_rows(records, evidence, metadata):
+        yield "| " + " | ".join(r) + " |"
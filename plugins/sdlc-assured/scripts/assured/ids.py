@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
+from .spec_lexer import HEADING, SpecEventCache, spec_events
+
 
 class IdParseError(ValueError):
     """Raised when a string cannot be parsed as an Assured ID."""
@@ -78,58 +80,52 @@ class IdRecord:
     satisfies: List[str]
 
 
-_HEADING_RE = re.compile(
-    r"^###\s+(?P<id>(?:P\d+\.SP\d+\.M\d+\.)?(?:REQ|DES|TEST|CODE)-(?:[a-z0-9][a-z0-9-]*-)?\d+)\b"
-)
-_SATISFIES_RE = re.compile(r"^\*\*satisfies:\*\*\s+(?P<refs>.+)$", re.MULTILINE)
 _REF_ID_RE = re.compile(
     r"\b((?:P\d+\.SP\d+\.M\d+\.)?(?:REQ|DES|TEST|CODE)-(?:[a-z0-9][a-z0-9-]*-)?\d+)\b"
 )
 
 
-def build_id_registry(project_root: Path) -> List[IdRecord]:  # implements: DES-assured-id-system-002
+def build_id_registry(  # implements: DES-assured-id-system-002
+    project_root: Path, spec_cache: Optional[SpecEventCache] = None
+) -> List[IdRecord]:
     # implements: DES-assured-id-system-002
-    """Walk docs/specs/ and collect every declared ID with its forward links."""
+    """Walk docs/specs/ and collect every declared ID with its forward links.
+
+    Pass the same *spec_cache* to ``build_requirement_metadata_registry`` to
+    read and classify each spec file once per run.
+    """
     specs_dir = project_root / "docs" / "specs"
     records: List[IdRecord] = []
     if not specs_dir.is_dir():
         return records
     for spec_file in sorted(specs_dir.glob("**/*.md")):
-        text = spec_file.read_text(encoding="utf-8")
         rel_source = str(spec_file.relative_to(project_root))
-        in_code_block = False
         current_id: Optional[str] = None
         current_satisfies: List[str] = []
-
-        def _flush() -> None:
-            nonlocal current_id, current_satisfies
-            if current_id is not None:
-                records.append(
-                    IdRecord(
-                        id=current_id,
-                        kind=parse_id(current_id).kind,
-                        source=rel_source,
-                        satisfies=current_satisfies,
+        for event in spec_events(spec_file, spec_cache):
+            if event.type == HEADING:
+                if current_id is not None:
+                    records.append(
+                        IdRecord(
+                            id=current_id,
+                            kind=parse_id(current_id).kind,
+                            source=rel_source,
+                            satisfies=current_satisfies,
+                        )
                     )
+                current_id = event.value
+                current_satisfies = []
+            elif event.key == "satisfies" and current_id is not None:
+                current_satisfies = _REF_ID_RE.findall(event.value)
+        if current_id is not None:
+            records.append(
+                IdRecord(
+                    id=current_id,
+                    kind=parse_id(current_id).kind,
+                    source=rel_source,
+                    satisfies=current_satisfies,
                 )
-            current_id = None
-            current_satisfies = []
-
-        for line in text.splitlines():
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-                continue
-            if in_code_block:
-                continue
-            heading = _HEADING_RE.match(line)
-            if heading:
-                _flush()
-                current_id = heading["id"]
-                continue
-            satisfies = _SATISFIES_RE.match(line)
-            if satisfies and current_id is not None:
-                current_satisfies = _REF_ID_RE.findall(satisfies["refs"])
-        _flush()
+            )
     return records
 
 
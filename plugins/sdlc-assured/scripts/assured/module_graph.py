@@ -0,0 +1,279 @@
+"""Module dependency graph analytics over ``ImportEdge`` lists.
+
+``render_module_dependency_graph`` and ``visibility_rule_enforcement`` look
+at direct edges only.  :class:`ModuleGraph` adds the whole-graph views a
+reviewer needs on large decompositions:
+
+- strongly connected components (iterative Tarjan, so deep graphs do not
+  hit the recursion limit) and the dependency cycles they imply;
+- transitive-closure reachability, stored as one Python-int bitset per
+  strongly connected component so thousands of modules stay cheap;
+- layering violations against the optional ``layers`` block of
+  ``programs.yaml``;
+- DOT and JSON export.
+
+Two validators in the style of :mod:`assured.decomposition` wrap the
+analytics for CI: :func:`dependency_cycle_detection` and
+:func:`layering_rule_enforcement`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Dict, Iterable, List, Optional
+
+from .decomposition import (
+    Decomposition,
+    DecompositionValidatorResult,
+    ImportEdge,
+    Layer,
+    _all_module_ids,
+)
+
+
+class ModuleGraph:
+    """Directed module graph with SCC, closure and layering analytics."""
+
+    def __init__(
+        self, edges: Iterable[ImportEdge], modules: Optional[Iterable[str]] = None
+    ) -> None:
+        pairs = {
+            (e.from_module, e.to_module) for e in edges if e.from_module != e.to_module
+        }
+        names = set(modules or [])
+        for from_, to_ in pairs:
+            names.add(from_)
+            names.add(to_)
+        self.modules: List[str] = sorted(names)
+        self._index: Dict[str, int] = {m: i for i, m in enumerate(self.modules)}
+        self._adj: List[List[int]] = [[] for _ in self.modules]
+        for from_, to_ in sorted(pairs):
+            self._adj[self._index[from_]].append(self._index[to_])
+        self._sccs: Optional[List[List[int]]] = None
+        self._comp_of: List[int] = []
+        self._comp_reach: List[int] = []
+
+    @classmethod
+    def from_decomposition(
+        cls, decomp: Decomposition, edges: Iterable[ImportEdge]
+    ) -> "ModuleGraph":
+        # implements: DES-assured-render-002
+        """Graph over every declared module, including ones with no edges."""
+        return cls(edges, modules=_all_module_ids(decomp))
+
+    @property
+    def edges(self) -> List[ImportEdge]:
+        return [
+            ImportEdge(from_module=self.modules[v], to_module=self.modules[w])
+            for v, targets in enumerate(self._adj)
+            for w in targets
+        ]
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        # implements: DES-assured-decomposition-validators-003
+        """SCCs in reverse topological order (dependencies before dependents)."""
+        return [sorted(self.modules[v] for v in comp) for comp in self._components()]
+
+    def cycles(self) -> List[List[str]]:
+        # implements: DES-assured-decomposition-validators-003
+        """Every SCC with more than one module, sorted for stable output."""
+        return sorted(c for c in self.strongly_connected_components() if len(c) > 1)
+
+    def reachable_from(self, module: str) -> List[str]:
+        # implements: DES-assured-decomposition-validators-003
+        """Modules reachable from *module* via one or more edges, sorted."""
+        bits = self._reach_bits(module)
+        return [m for i, m in enumerate(self.modules) if bits >> i & 1]
+
+    def can_reach(self, from_module: str, to_module: str) -> bool:
+        # implements: DES-assured-decomposition-validators-003
+        """True when *to_module* is transitively reachable from *from_module*."""
+        target = self._index.get(to_module)
+        if target is None:
+            return False
+        return bool(self._reach_bits(from_module) >> target & 1)
+
+    def layering_violations(self, layers: List[Layer]) -> List[ImportEdge]:
+        # implements: DES-assured-decomposition-validators-003
+        """Edges from a lower layer to a higher one (layers listed top first).
+
+        Modules outside every layer are not constrained.
+        """
+        rank: Dict[str, int] = {}
+        for i, layer in enumerate(layers):
+            for m in layer.modules:
+                rank.setdefault(m, i)
+        return [
+            e
+            for e in self.edges
+            if e.from_module in rank
+            and e.to_module in rank
+            and rank[e.from_module] > rank[e.to_module]
+        ]
+
+    def to_dot(self, layers: Optional[List[Layer]] = None) -> str:
+        # implements: DES-assured-render-002
+        """Graphviz DOT; cycle edges red, layering violations dashed."""
+        cyclic = self._cyclic_edges()
+        violations = {
+            (e.from_module, e.to_module) for e in self.layering_violations(layers or [])
+        }
+        lines = ["digraph modules {", "  rankdir=LR;"]
+        for m in self.modules:
+            lines.append(f'  "{m}";')
+        for e in self.edges:
+            attrs = []
+            if (e.from_module, e.to_module) in cyclic:
+                attrs.append("color=red")
+            if (e.from_module, e.to_module) in violations:
+                attrs.append("style=dashed")
+            suffix = f" [{', '.join(attrs)}]" if attrs else ""
+            lines.append(f'  "{e.from_module}" -> "{e.to_module}"{suffix};')
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def to_json(self, layers: Optional[List[Layer]] = None) -> str:
+        # implements: DES-assured-render-002
+        """Deterministic JSON: modules, edges, cycles, closure and violations."""
+        payload = {
+            "modules": self.modules,
+            "edges": [[e.from_module, e.to_module] for e in self.edges],
+            "cycles": self.cycles(),
+            "reachable": {m: self.reachable_from(m) for m in self.modules},
+            "layering_violations": [
+                [e.from_module, e.to_module]
+                for e in self.layering_violations(layers or [])
+            ],
+        }
+        return json.dumps(payload, indent=2) + "\n"
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _components(self) -> List[List[int]]:
+        if self._sccs is None:
+            self._sccs = self._tarjan()
+            self._comp_of = [0] * len(self.modules)
+            for c, comp in enumerate(self._sccs):
+                for v in comp:
+                    self._comp_of[v] = c
+            self._comp_reach = self._closure()
+        return self._sccs
+
+    def _tarjan(self) -> List[List[int]]:
+        n = len(self.modules)
+        index = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        stack: List[int] = []
+        sccs: List[List[int]] = []
+        counter = 0
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, 0)]
+            while work:
+                v, i = work[-1]
+                if i < len(self._adj[v]):
+                    work[-1] = (v, i + 1)
+                    w = self._adj[v][i]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, 0))
+                    elif on_stack[w]:
+                        low[v] = min(low[v], index[w])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[v])
+                if low[v] == index[v]:
+                    comp: List[int] = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        comp.append(w)
+                        if w == v:
+                            break
+                    sccs.append(comp)
+        return sccs
+
+    def _closure(self) -> List[int]:
+        # Tarjan emits components sink-first, so every successor component's
+        # reach set is complete before the component that depends on it.
+        reach = [0] * len(self._sccs or [])
+        for c, comp in enumerate(self._sccs or []):
+            bits = 0
+            for v in comp:
+                for w in self._adj[v]:
+                    bits |= 1 << w
+                    target = self._comp_of[w]
+                    if target != c:
+                        bits |= reach[target]
+            reach[c] = bits
+        return reach
+
+    def _reach_bits(self, module: str) -> int:
+        v = self._index.get(module)
+        if v is None:
+            return 0
+        self._components()
+        return self._comp_reach[self._comp_of[v]]
+
+    def _cyclic_edges(self) -> set:
+        self._components()
+        out = set()
+        for v, targets in enumerate(self._adj):
+            for w in targets:
+                if self._comp_of[v] == self._comp_of[w]:
+                    out.add((self.modules[v], self.modules[w]))
+        return out
+
+
+def dependency_cycle_detection(
+    edges: List[ImportEdge], decomp: Decomposition, mode: str = "advisory"
+) -> DecompositionValidatorResult:
+    # implements: DES-assured-decomposition-validators-003
+    """Report every module dependency cycle.
+
+    mode = 'strict' -> cycles block (errors).
+    mode = 'advisory' -> cycles warn.
+    """
+    graph = ModuleGraph.from_decomposition(decomp, edges)
+    issues = ["dependency cycle: " + " ↔ ".join(cycle) for cycle in graph.cycles()]
+    if mode == "strict":
+        return DecompositionValidatorResult(passed=not issues, errors=issues)
+    return DecompositionValidatorResult(passed=True, warnings=issues)
+
+
+def layering_rule_enforcement(
+    edges: List[ImportEdge], decomp: Decomposition, mode: str = "advisory"
+) -> DecompositionValidatorResult:
+    # implements: DES-assured-decomposition-validators-003
+    """Verify no edge points from a lower layer up to a higher one.
+
+    Uses the ``layers`` block of programs.yaml; passes trivially without one.
+    mode = 'strict' -> violations block (errors).
+    mode = 'advisory' -> violations warn.
+    """
+    graph = ModuleGraph.from_decomposition(decomp, edges)
+    layer_of: Dict[str, str] = {}
+    for layer in decomp.layers:
+        for m in layer.modules:
+            layer_of.setdefault(m, layer.name)
+    issues = [
+        f"layering violation: {e.from_module} ({layer_of[e.from_module]}) → "
+        f"{e.to_module} ({layer_of[e.to_module]})"
+        for e in graph.layering_violations(decomp.layers)
+    ]
+    if mode == "strict":
+        return DecompositionValidatorResult(passed=not issues, errors=issues)
+    return DecompositionValidatorResult(passed=True, warnings=issues)
@@ -0,0 +1,261 @@
+"""Compact serialised snapshot of the Assured registry for fast reload.
+
+Every validator run re-derives the ID registry, the requirement metadata
+map and the evidence index by regex-parsing spec Markdown and scanning
+source files.  This module persists all three in one versioned JSON-lines
+file (``library/_registry-cache.jsonl`` by default) together with the
+SHA-256 of every input file, so tools can load the snapshot in one read
+and only rebuild when an input has actually changed.
+
+File layout — one JSON object per line, discriminated by ``type``:
+
+- ``header``: ``format_version``, ``spec_hashes`` and ``evidence_hashes``
+  (project-relative POSIX path → SHA-256 hex digest).  Always first.
+- ``id``: one :class:`~assured.ids.IdRecord`.
+- ``req_metadata``: one :class:`~assured.requirement_metadata.RequirementMetadata`.
+- ``evidence``: one :class:`~assured.evidence_index.EvidenceIndexEntry`.
+
+The cache is a derived artefact: a missing, corrupt or wrong-version file
+is treated as stale and rebuilt, never as an error.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .evidence_index import EvidenceIndexEntry, EvidenceIndexRegistry, EvidenceKind
+from .evidence_status import EvidenceStatus
+from .ids import IdRecord, build_id_registry
+from .requirement_metadata import (
+    RequirementMetadata,
+    build_requirement_metadata_registry,
+)
+from .source_corpus import SourceCorpus
+from .spec_lexer import SpecEventCache
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+DEFAULT_CACHE_PATH = Path("library") / "_registry-cache.jsonl"
+
+
+@dataclass
+class RegistrySnapshot:
+    """Registry, requirement metadata and evidence index plus input hashes."""
+
+    records: List[IdRecord]
+    metadata: Dict[str, RequirementMetadata]
+    evidence: List[EvidenceIndexEntry]
+    spec_hashes: Dict[str, str] = field(default_factory=dict)
+    evidence_hashes: Dict[str, str] = field(default_factory=dict)
+
+
+def build_registry_snapshot(
+    project_root: Path,
+    evidence_files: Optional[List[Path]] = None,
+    corpus: Optional[SourceCorpus] = None,
+) -> RegistrySnapshot:
+    # implements: DES-assured-id-system-002
+    """Build a fresh snapshot by parsing specs and scanning *evidence_files*."""
+    files = list(evidence_files or [])
+    evidence = list(
+        EvidenceIndexRegistry.with_default_adapters().scan(
+            files, project_root, corpus=corpus
+        )
+    )
+    spec_cache = SpecEventCache()
+    return RegistrySnapshot(
+        records=build_id_registry(project_root, spec_cache=spec_cache),
+        metadata=build_requirement_metadata_registry(
+            project_root, spec_cache=spec_cache
+        ),
+        evidence=evidence,
+        spec_hashes=_spec_hashes(project_root),
+        evidence_hashes=_file_hashes(files, project_root),
+    )
+
+
+def write_registry_cache(snapshot: RegistrySnapshot, cache_path: Path) -> None:
+    # implements: DES-assured-id-system-002
+    """Write *snapshot* to *cache_path* atomically (temp file + rename)."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as fh:
+        _dump(
+            fh,
+            {
+                "type": "header",
+                "format_version": FORMAT_VERSION,
+                "spec_hashes": snapshot.spec_hashes,
+                "evidence_hashes": snapshot.evidence_hashes,
+            },
+        )
+        for r in snapshot.records:
+            _dump(
+                fh,
+                {
+                    "type": "id",
+                    "id": r.id,
+                    "kind": r.kind,
+                    "source": r.source,
+                    "satisfies": r.satisfies,
+                },
+            )
+        for md in snapshot.metadata.values():
+            _dump(
+                fh,
+                {
+                    "type": "req_metadata",
+                    "req_id": md.req_id,
+                    "evidence_status": (
+                        md.evidence_status.value if md.evidence_status else None
+                    ),
+                    "justification": md.justification,
+                    "related": md.related,
+                },
+            )
+        for e in snapshot.evidence:
+            _dump(
+                fh,
+                {
+                    "type": "evidence",
+                    "kind": e.kind.value,
+                    "source": e.source,
+                    "line": e.line,
+                    "cited_ids": e.cited_ids,
+                    "terms": e.terms,
+                    "facts": e.facts,
+                },
+            )
+    os.replace(tmp_path, cache_path)
+
+
+def read_registry_cache(cache_path: Path) -> Optional[RegistrySnapshot]:
+    # implements: DES-assured-id-system-002
+    """Load a snapshot, or return ``None`` if the file is missing or unusable."""
+    if not cache_path.is_file():
+        return None
+    snapshot = RegistrySnapshot(records=[], metadata={}, evidence=[])
+    try:
+        with cache_path.open("r", encoding="utf-8") as fh:
+            header = json.loads(fh.readline())
+            if (
+                header.get("type") != "header"
+                or header.get("format_version") != FORMAT_VERSION
+            ):
+                return None
+            snapshot.spec_hashes = dict(header["spec_hashes"])
+            snapshot.evidence_hashes = dict(header["evidence_hashes"])
+            for line in fh:
+                _load_row(json.loads(line), snapshot)
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("registry_cache: ignoring unreadable %s (%s)", cache_path, exc)
+        return None
+    return snapshot
+
+
+def is_fresh(
+    snapshot: RegistrySnapshot,
+    project_root: Path,
+    evidence_files: Optional[List[Path]] = None,
+) -> bool:
+    # implements: DES-assured-id-system-002
+    """True when no spec file or evidence file changed since *snapshot* was built.
+
+    Added and removed files count as changes.
+    """
+    if snapshot.spec_hashes != _spec_hashes(project_root):
+        return False
+    return snapshot.evidence_hashes == _file_hashes(
+        list(evidence_files or []), project_root
+    )
+
+
+def load_registry_snapshot(
+    project_root: Path,
+    evidence_files: Optional[List[Path]] = None,
+    cache_path: Optional[Path] = None,
+    corpus: Optional[SourceCorpus] = None,
+) -> RegistrySnapshot:
+    # implements: DES-assured-id-system-002
+    """Return a current snapshot, reusing the on-disk cache when it is fresh.
+
+    A stale or missing cache is rebuilt and rewritten.  *cache_path*
+    defaults to ``<project_root>/library/_registry-cache.jsonl``.
+    """
+    path = cache_path or project_root / DEFAULT_CACHE_PATH
+    cached = read_registry_cache(path)
+    if cached is not None and is_fresh(cached, project_root, evidence_files):
+        return cached
+    snapshot = build_registry_snapshot(project_root, evidence_files, corpus=corpus)
+    write_registry_cache(snapshot, path)
+    return snapshot
+
+
+def _dump(fh, row: dict) -> None:
+    fh.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+    fh.write("\n")
+
+
+def _load_row(row: dict, snapshot: RegistrySnapshot) -> None:
+    kind = row["type"]
+    if kind == "id":
+        snapshot.records.append(
+            IdRecord(
+                id=row["id"],
+                kind=row["kind"],
+                source=row["source"],
+                satisfies=list(row["satisfies"]),
+            )
+        )
+    elif kind == "req_metadata":
+        status = row["evidence_status"]
+        snapshot.metadata[row["req_id"]] = RequirementMetadata(
+            req_id=row["req_id"],
+            evidence_status=EvidenceStatus(status) if status else None,
+            justification=row["justification"],
+            related=list(row["related"]),
+        )
+    elif kind == "evidence":
+        snapshot.evidence.append(
+            EvidenceIndexEntry(
+                kind=EvidenceKind(row["kind"]),
+                source=row["source"],
+                line=row["line"],
+                cited_ids=list(row["cited_ids"]),
+                terms=list(row["terms"]),
+                facts=list(row["facts"]),
+            )
+        )
+    else:
+        raise ValueError(f"unknown row type {kind!r}")
+
+
+def _hash_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _rel(path: Path, project_root: Path) -> str:
+    try:
+        return path.relative_to(project_root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _spec_hashes(project_root: Path) -> Dict[str, str]:
+    specs_dir = project_root / "docs" / "specs"
+    if not specs_dir.is_dir():
+        return {}
+    return {
+        _rel(f, project_root): _hash_file(f) for f in sorted(specs_dir.glob("**/*.md"))
+    }
+
+
+def _file_hashes(files: List[Path], project_root: Path) -> Dict[str, str]:
+    return {_rel(f, project_root): _hash_file(f) for f in files if f.is_file()}
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 
 from .code_index import CodeIndexEntry
 from .decomposition import Decomposition, ImportEdge
@@ -18,20 +20,98 @@ def render_module_scope(
     # implements: DES-assured-render-001
     """Render the REQ → DES → TEST → CODE chain for a single module."""
     in_module = [r for r in records if spec_module_lookup.get(r.id) == module_id]
-    reqs = [r for r in in_module if r.kind == "REQ"]
-    deses = [r for r in in_module if r.kind == "DES"]
-    tests = [r for r in in_module if r.kind == "TEST"]
     in_module_code = [
         c
         for c in code_entries
         if any(spec_module_lookup.get(cid) == module_id for cid in c.cited_ids)
     ]
-    orphan_code = [
+    return _render_scope_page(
+        module_id,
+        in_module,
+        in_module_code,
+        _orphan_code(code_entries, spec_module_lookup),
+    )
+
+
+def render_all_module_scopes(
+    module_ids: Iterable[str],
+    records: List[IdRecord],
+    code_entries: List[CodeIndexEntry],
+    spec_module_lookup: dict[str, str],
+    output_dir: Optional[Path] = None,
+    dependency_graph: Optional[str] = None,
+    workers: int = 1,
+) -> Dict[str, str]:
+    # implements: DES-assured-render-001
+    """Render every module's scope page in one pass over records and code.
+
+    Produces the same page as :func:`render_module_scope` for each module,
+    but buckets records and code entries by module once instead of
+    re-filtering the full lists per module.  Orphan code does not depend on
+    the module, so it is computed once and shared.
+
+    When *output_dir* is given each page is written to
+    ``<output_dir>/<module-id>.md``, with *dependency_graph* (the output of
+    :func:`render_module_dependency_graph`) appended if provided.  Writes
+    are spread over *workers* threads.  Returns module ID → page text.
+    """
+    ids = list(module_ids)
+    records_by_module: Dict[str, List[IdRecord]] = {m: [] for m in ids}
+    for r in records:
+        bucket = records_by_module.get(spec_module_lookup.get(r.id, ""))
+        if bucket is not None:
+            bucket.append(r)
+    code_by_module: Dict[str, List[CodeIndexEntry]] = {m: [] for m in ids}
+    for c in code_entries:
+        modules = {spec_module_lookup.get(cid) for cid in c.cited_ids}
+        for module in modules:
+            bucket = code_by_module.get(module or "")
+            if bucket is not None:
+                bucket.append(c)
+    orphan_code = _orphan_code(code_entries, spec_module_lookup)
+
+    pages = {
+        m: _render_scope_page(m, records_by_module[m], code_by_module[m], orphan_code)
+        for m in ids
+    }
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        def _write(module_id: str) -> None:
+            text = pages[module_id]
+            if dependency_graph is not None:
+                text = text + "\n" + dependency_graph
+            (output_dir / f"{module_id}.md").write_text(text, encoding="utf-8")
+
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(_write, ids))
+        else:
+            for module_id in ids:
+                _write(module_id)
+    return pages
+
+
+def _orphan_code(
+    code_entries: List[CodeIndexEntry], spec_module_lookup: dict[str, str]
+) -> List[CodeIndexEntry]:
+    """Code entries none of whose cited IDs exist in the registry."""
+    return [
         c
         for c in code_entries
-        if c not in in_module_code
-        and not any(cid in spec_module_lookup for cid in c.cited_ids)
+        if not any(cid in spec_module_lookup for cid in c.cited_ids)
     ]
+
+
+def _render_scope_page(
+    module_id: str,
+    in_module: List[IdRecord],
+    in_module_code: List[CodeIndexEntry],
+    orphan_code: List[CodeIndexEntry],
+) -> str:
+    reqs = [r for r in in_module if r.kind == "REQ"]
+    deses = [r for r in in_module if r.kind == "DES"]
+    tests = [r for r in in_module if r.kind == "TEST"]
     lines = [
         f"# Module: {module_id}",
         "",
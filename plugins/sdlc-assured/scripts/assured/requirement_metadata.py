@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Optional
 
 from .evidence_status import EvidenceStatus
+from .spec_lexer import HEADING, SpecEventCache, spec_events
 
 
 @dataclass(frozen=True)
@@ -23,17 +24,13 @@ class RequirementMetadata:
     related: list[str] = field(default_factory=list)
 
 
-_REQ_HEADING_RE = re.compile(
-    r"^###\s+(?P<id>(?:P\d+\.SP\d+\.M\d+\.)?REQ-(?:[a-z0-9][a-z0-9-]*-)?\d+)\b"
-)
-_FIELD_RE = re.compile(r"^\*\*(?P<key>[A-Za-z][A-Za-z0-9-]*)?:\*\*\s+(?P<value>.+)$")
 _ID_TOKEN_RE = re.compile(
     r"\b((?:P\d+\.SP\d+\.M\d+\.)?(?:REQ|DES|TEST|CODE)-(?:[a-z0-9][a-z0-9-]*-)?\d+)\b"
 )
 
 
 def build_requirement_metadata_registry(
-    project_root: Path,
+    project_root: Path, spec_cache: Optional[SpecEventCache] = None
 ) -> dict[str, RequirementMetadata]:
     """Walk docs/specs/**/requirements-spec.md; build {req_id: RequirementMetadata}."""
     registry: dict[str, RequirementMetadata] = {}
@@ -41,53 +38,32 @@ def build_requirement_metadata_registry(
     if not specs_dir.is_dir():
         return registry
     for spec_file in sorted(specs_dir.glob("**/requirements-spec.md")):
-        text = spec_file.read_text(encoding="utf-8")
-        current_id: Optional[str] = None
-        evidence_status: Optional[EvidenceStatus] = None
-        justification: Optional[str] = None
-        related: list[str] = []
-        in_code_block = False
-
-        def _flush() -> None:
-            nonlocal current_id, evidence_status, justification, related
-            if current_id is not None:
-                registry[current_id] = RequirementMetadata(
-                    req_id=current_id,
-                    evidence_status=evidence_status,
-                    justification=justification,
-                    related=list(related),
-                )
-            current_id = None
-            evidence_status = None
-            justification = None
-            related = []
-
-        for line in text.splitlines():
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-                continue
-            if in_code_block:
+        current: Optional[dict] = None
+        for event in spec_events(spec_file, spec_cache):
+            if event.type == HEADING:
+                # Only REQ headings open a metadata block; other IDs are
+                # part of the current requirement's body.
+                if event.key == "REQ":
+                    _flush(registry, current)
+                    current = {"req_id": event.value, "related": []}
                 continue
-            heading = _REQ_HEADING_RE.match(line)
-            if heading:
-                _flush()
-                current_id = heading["id"]
+            if current is None:
                 continue
-            if current_id is None:
-                continue
-            field_match = _FIELD_RE.match(line)
-            if not field_match:
-                continue
-            key = (field_match["key"] or "").lower()
-            value = field_match["value"].strip()
+            key = event.key.lower()
+            value = event.value.strip()
             if key == "evidence-status":
                 try:
-                    evidence_status = EvidenceStatus(value.lower())
+                    current["evidence_status"] = EvidenceStatus(value.lower())
                 except ValueError:
                     pass
             elif key == "justification":
-                justification = value
+                current["justification"] = value
             elif key == "related":
-                related = _ID_TOKEN_RE.findall(value)
-        _flush()
+                current["related"] = _ID_TOKEN_RE.findall(value)
+        _flush(registry, current)
     return registry
+
+
+def _flush(registry: dict[str, RequirementMetadata], current: Optional[dict]) -> None:
+    if current is not None:
+        registry[current["req_id"]] = RequirementMetadata(**current)
@@ -0,0 +1,128 @@
+"""Shared, memoised view of source files for the Assured validators.
+
+Several validators and extractors look at the same source tree in one
+``kb-rebuild-indexes`` run: ``forward_annotation_completeness`` and
+``PythonAstExtractor`` both ``ast.parse`` every Python file, while
+``annotation_format_integrity`` and the evidence adapters re-read the same
+files for line-based regex scanning.  A :class:`SourceCorpus` is passed to
+each of them so every file is read once, split into lines once and parsed
+once.
+
+Entries are held in an LRU bounded by the total size of cached text, so a
+corpus can be shared across a large tree without holding every AST in
+memory at once.  Evicted entries are simply re-read on the next access.
+"""
+
+from __future__ import annotations
+
+import ast
+import inspect
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def accepts_corpus(extract: Callable[..., object]) -> bool:
+    """Return True if *extract* can be called with a ``corpus=`` keyword.
+
+    Adapters and extractors written before :class:`SourceCorpus` existed
+    take only the two positional arguments; callers use this to keep
+    invoking those without the keyword instead of raising ``TypeError``.
+    """
+    try:
+        params = inspect.signature(extract).parameters
+    except (TypeError, ValueError):
+        return False
+    return "corpus" in params or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+    )
+
+
+@dataclass
+class _CorpusEntry:
+    text: str
+    lines: Optional[List[str]] = None
+    tree: Optional[ast.Module] = None
+
+
+class SourceCorpus:
+    """Lazy, memoised text + line index + AST per source path.
+
+    All accessors raise the same exceptions as the direct call they replace
+    (``OSError`` / ``UnicodeDecodeError`` from ``Path.read_text``,
+    ``SyntaxError`` from ``ast.parse``), so callers keep their existing
+    error handling.  Failures are not cached.
+
+    Parameters
+    ----------
+    max_bytes:
+        Upper bound on the summed length of cached file texts.  When an
+        insertion exceeds it, least-recently-used entries are evicted.  The
+        most recent entry is always kept, even if it alone exceeds the bound.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes!r}")
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _CorpusEntry]" = OrderedDict()
+        self._size = 0
+        self.reads = 0
+        self.parses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, (str, Path)) and str(path) in self._entries
+
+    @property
+    def cached_bytes(self) -> int:
+        """Summed length of the texts currently held in the cache."""
+        return self._size
+
+    def text(self, path: Path) -> str:
+        """Return the UTF-8 text of *path*."""
+        return self._entry(path).text
+
+    def lines(self, path: Path) -> List[str]:
+        """Return ``text(path).splitlines()``; callers must not mutate it."""
+        entry = self._entry(path)
+        if entry.lines is None:
+            entry.lines = entry.text.splitlines()
+        return entry.lines
+
+    def tree(self, path: Path) -> ast.Module:
+        """Return the parsed AST of *path*; callers must not mutate it."""
+        entry = self._entry(path)
+        if entry.tree is None:
+            entry.tree = ast.parse(entry.text, filename=str(path))
+            self.parses += 1
+        return entry.tree
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+        self._size = 0
+
+    def _entry(self, path: Path) -> _CorpusEntry:
+        key = str(path)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        text = Path(path).read_text(encoding="utf-8")
+        self.reads += 1
+        entry = _CorpusEntry(text=text)
+        self._entries[key] = entry
+        self._size += len(text)
+        self._evict()
+        return entry
+
+    def _evict(self) -> None:
+        while self._size > self._max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.text)
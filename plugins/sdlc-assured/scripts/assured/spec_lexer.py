@@ -0,0 +1,92 @@
+"""Single-pass line classifier for Assured spec markdown.
+
+``build_id_registry`` and ``build_requirement_metadata_registry`` both walk
+``docs/specs/`` and, per line, toggled fenced-code state and tried several
+regexes.  :func:`lex_spec` does that work once per file: it dispatches on
+the line's first characters (only ``###`` lines can be ID headings, only
+``**`` lines can be fields) and yields typed :class:`SpecEvent` values.
+A :class:`SpecEventCache` shared between the two builders means each spec
+file is read and classified once per run.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+HEADING = "heading"
+FIELD = "field"
+
+_HEADING_RE = re.compile(
+    r"^###\s+(?P<id>(?:P\d+\.SP\d+\.M\d+\.)?(?P<kind>REQ|DES|TEST|CODE)-"
+    r"(?:[a-z0-9][a-z0-9-]*-)?\d+)\b"
+)
+_FIELD_RE = re.compile(r"^\*\*(?P<key>[A-Za-z][A-Za-z0-9-]*)?:\*\*\s+(?P<value>.+)$")
+
+
+@dataclass(frozen=True)
+class SpecEvent:
+    """One classified spec line.
+
+    ``HEADING`` events carry the declared ID in ``value`` and its kind
+    (``REQ``/``DES``/``TEST``/``CODE``) in ``key``.  ``FIELD`` events carry
+    the raw ``**Key:**`` name (empty for ``**:**``) and the value text.
+    """
+
+    type: str
+    line: int
+    key: str
+    value: str
+
+
+def lex_spec(text: str) -> List[SpecEvent]:
+    # implements: DES-assured-id-system-002
+    """Classify *text* into heading/field events, skipping fenced code blocks."""
+    events: List[SpecEvent] = []
+    in_code_block = False
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        if "```" in line and line.lstrip().startswith("```"):
+            in_code_block = not in_code_block
+            continue
+        if in_code_block:
+            continue
+        if line.startswith("###"):
+            heading = _HEADING_RE.match(line)
+            if heading:
+                events.append(SpecEvent(HEADING, lineno, heading["kind"], heading["id"]))
+        elif line.startswith("**"):
+            field_match = _FIELD_RE.match(line)
+            if field_match:
+                events.append(
+                    SpecEvent(
+                        FIELD, lineno, field_match["key"] or "", field_match["value"]
+                    )
+                )
+    return events
+
+
+class SpecEventCache:
+    """Per-run memo of :func:`lex_spec` results keyed by spec path."""
+
+    def __init__(self) -> None:
+        self._events: Dict[str, List[SpecEvent]] = {}
+        self.reads = 0
+
+    def events(self, path: Path) -> List[SpecEvent]:
+        """Return the events of *path*, reading and lexing it on first use."""
+        key = str(path)
+        cached = self._events.get(key)
+        if cached is None:
+            cached = lex_spec(Path(path).read_text(encoding="utf-8"))
+            self.reads += 1
+            self._events[key] = cached
+        return cached
+
+
+def spec_events(path: Path, cache: Optional[SpecEventCache] = None) -> List[SpecEvent]:
+    """Events of *path*, through *cache* when one is given."""
+    if cache is not None:
+        return cache.events(path)
+    return lex_spec(path.read_text(encoding="utf-8"))
@@ -0,0 +1,80 @@
+"""Precomputed traceability graph over an ID registry.
+
+The traceability validators all need the same views of the registry —
+ID → record lookup, who-cites-whom in both directions, and records grouped
+by kind.  :class:`TraceGraph` builds them once in a single pass over the
+records so each validator runs in O(records + links) and several
+validators in one run can share the same instance.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .ids import IdRecord
+
+
+@dataclass
+class TraceGraph:
+    """Forward/reverse adjacency and kind index for a list of ``IdRecord``.
+
+    Attributes
+    ----------
+    records:
+        The records the graph was built from, in their original order.
+    by_id:
+        ID → first record declaring it.  Duplicate declarations are kept in
+        :attr:`declarations`.
+    declarations:
+        ID → every record declaring it, in registry order.
+    forward:
+        ID → IDs it cites via ``satisfies`` (union over duplicate declarations).
+    reverse:
+        Cited ID → records that cite it.  Keys include undeclared targets, so
+        dangling citations are visible here too.
+    by_kind:
+        Kind (``REQ``/``DES``/``TEST``/``CODE``) → records of that kind.
+    """
+
+    records: List[IdRecord]
+    by_id: Dict[str, IdRecord] = field(default_factory=dict)
+    declarations: Dict[str, List[IdRecord]] = field(default_factory=dict)
+    forward: Dict[str, List[str]] = field(default_factory=dict)
+    reverse: Dict[str, List[IdRecord]] = field(default_factory=dict)
+    by_kind: Dict[str, List[IdRecord]] = field(default_factory=dict)
+
+    @classmethod
+    def from_records(cls, records: List[IdRecord]) -> "TraceGraph":
+        # implements: DES-assured-traceability-validators-001
+        """Build every index in one pass over *records*."""
+        graph = cls(records=list(records))
+        for r in graph.records:
+            graph.declarations.setdefault(r.id, []).append(r)
+            graph.by_id.setdefault(r.id, r)
+            graph.by_kind.setdefault(r.kind, []).append(r)
+            graph.forward.setdefault(r.id, []).extend(r.satisfies)
+            for target in r.satisfies:
+                graph.reverse.setdefault(target, []).append(r)
+        return graph
+
+    def is_declared(self, id_: str) -> bool:
+        return id_ in self.by_id
+
+    def duplicates(self) -> List[str]:
+        """IDs declared more than once, sorted."""
+        return sorted(id_ for id_, decls in self.declarations.items() if len(decls) > 1)
+
+    def cited_by(self, id_: str, kind: Optional[str] = None) -> List[IdRecord]:
+        """Records citing *id_*, optionally restricted to one kind."""
+        citing = self.reverse.get(id_, [])
+        if kind is None:
+            return list(citing)
+        return [r for r in citing if r.kind == kind]
+
+    def has_child_of_kind(self, id_: str, kind: str) -> bool:
+        """True when at least one record of *kind* cites *id_*."""
+        return any(r.kind == kind for r in self.reverse.get(id_, []))
+
+    def of_kind(self, kind: str) -> List[IdRecord]:
+        return list(self.by_kind.get(kind, []))
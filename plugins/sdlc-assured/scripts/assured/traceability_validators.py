@@ -1,14 +1,20 @@
-"""Mandatory + optional traceability validators for the Assured bundle."""
+"""Mandatory + optional traceability validators for the Assured bundle.
+
+The registry-level validators accept an optional shared :class:`TraceGraph`;
+build it once with ``TraceGraph.from_records(records)`` when running several
+of them over the same registry.
+"""
 
 from __future__ import annotations
 
 import re
-from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, List
+from typing import Callable, List, Optional
 
 from .ids import IdParseError, IdRecord, parse_id
+from .source_corpus import SourceCorpus
+from .trace_graph import TraceGraph
 
 
 @dataclass
@@ -20,57 +26,67 @@ class ValidatorResult:
     warnings: List[str] = field(default_factory=list)
 
 
-def id_uniqueness(records: List[IdRecord]) -> ValidatorResult:  # implements: DES-assured-traceability-validators-001
+def _graph_for(records: List[IdRecord], graph: Optional[TraceGraph]) -> TraceGraph:
+    return graph if graph is not None else TraceGraph.from_records(records)
+
+
+def id_uniqueness(  # implements: DES-assured-traceability-validators-001
+    records: List[IdRecord], graph: Optional[TraceGraph] = None
+) -> ValidatorResult:
     # implements: DES-assured-traceability-validators-001
-    counts = Counter(r.id for r in records)
-    duplicates = [id_ for id_, n in counts.items() if n > 1]
+    graph = _graph_for(records, graph)
+    duplicates = graph.duplicates()
     if not duplicates:
         return ValidatorResult(passed=True)
     errors = [
         f"duplicate ID {id_!r} declared in: "
-        + ", ".join(r.source for r in records if r.id == id_)
-        for id_ in sorted(duplicates)
+        + ", ".join(r.source for r in graph.declarations[id_])
+        for id_ in duplicates
     ]
     return ValidatorResult(passed=False, errors=errors)
 
 
-def cited_ids_resolve(records: List[IdRecord]) -> ValidatorResult:  # implements: DES-assured-traceability-validators-001
-    declared = {r.id for r in records}
+def cited_ids_resolve(  # implements: DES-assured-traceability-validators-001
+    records: List[IdRecord], graph: Optional[TraceGraph] = None
+) -> ValidatorResult:
+    graph = _graph_for(records, graph)
     errors: List[str] = []
-    for r in records:
+    for r in graph.records:
         for cited in r.satisfies:
-            if cited not in declared:
+            if not graph.is_declared(cited):
                 errors.append(
                     f"{r.id} (in {r.source}) cites {cited!r} which is not declared anywhere"
                 )
     return ValidatorResult(passed=not errors, errors=errors)
 
 
-def orphan_ids(records: List[IdRecord]) -> ValidatorResult:  # implements: DES-assured-traceability-validators-001, DES-assured-traceability-validators-005
+def orphan_ids(  # implements: DES-assured-traceability-validators-001, DES-assured-traceability-validators-005
+    records: List[IdRecord], graph: Optional[TraceGraph] = None
+) -> ValidatorResult:
     # implements: DES-assured-traceability-validators-005
     """Warn when any declared ID is never cited by another record.
 
     Covers REQ, DES, TEST, and CODE kinds (E1: widened in v0.2.0).
     Complementary to backward_coverage, which checks the REQ→DES→TEST chain.
     """
-    cited: set[str] = set()
-    for r in records:
-        cited.update(r.satisfies)
+    graph = _graph_for(records, graph)
     warnings: List[str] = []
-    for r in records:
-        if r.kind in {"REQ", "DES", "TEST", "CODE"} and r.id not in cited:
+    for r in graph.records:
+        if r.kind in {"REQ", "DES", "TEST", "CODE"} and r.id not in graph.reverse:
             warnings.append(
                 f"orphan {r.kind} {r.id!r} (declared in {r.source}) is never cited"
             )
     return ValidatorResult(passed=True, warnings=warnings)
 
 
-def forward_link_integrity(records: List[IdRecord]) -> ValidatorResult:  # implements: DES-assured-traceability-validators-002
+def forward_link_integrity(  # implements: DES-assured-traceability-validators-002
+    records: List[IdRecord], graph: Optional[TraceGraph] = None
+) -> ValidatorResult:
     # implements: DES-assured-traceability-validators-002
     """Verify every DES cites at least one REQ; every TEST cites at least one DES; targets resolve."""
-    declared = {r.id: r for r in records}
+    graph = _graph_for(records, graph)
     errors: List[str] = []
-    for r in records:
+    for r in graph.records:
         if r.kind == "DES" and not r.satisfies:
             errors.append(
                 f"{r.id} (in {r.source}) has no satisfies links — DES must cite at least one REQ"
@@ -80,36 +96,22 @@ def forward_link_integrity(records: List[IdRecord]) -> ValidatorResult:  # imple
                 f"{r.id} (in {r.source}) has no satisfies links — TEST must cite at least one DES"
             )
         for cited in r.satisfies:
-            if cited not in declared:
+            if not graph.is_declared(cited):
                 errors.append(f"{r.id} (in {r.source}) cites missing target {cited!r}")
     return ValidatorResult(passed=not errors, errors=errors)
 
 
-def backward_coverage(records: List[IdRecord]) -> ValidatorResult:  # implements: DES-assured-traceability-validators-002
+def backward_coverage(  # implements: DES-assured-traceability-validators-002
+    records: List[IdRecord], graph: Optional[TraceGraph] = None
+) -> ValidatorResult:
     """Verify every REQ is covered by a DES; every DES is covered by a TEST."""
-    cited_by: dict[str, List[str]] = {r.id: [] for r in records}
-    for r in records:
-        for target in r.satisfies:
-            if target in cited_by:
-                cited_by[target].append(r.id)
+    graph = _graph_for(records, graph)
     errors: List[str] = []
-    for r in records:
-        if r.kind == "REQ":
-            des_children = [
-                c
-                for c in cited_by[r.id]
-                if c.startswith("DES") or "DES-" in c.split(".")[-1]
-            ]
-            if not des_children:
-                errors.append(f"{r.id} (in {r.source}) has no DES covering it")
-        if r.kind == "DES":
-            test_children = [
-                c
-                for c in cited_by[r.id]
-                if c.startswith("TEST") or "TEST-" in c.split(".")[-1]
-            ]
-            if not test_children:
-                errors.append(f"{r.id} (in {r.source}) has no TEST covering it")
+    for r in graph.records:
+        if r.kind == "REQ" and not graph.has_child_of_kind(r.id, "DES"):
+            errors.append(f"{r.id} (in {r.source}) has no DES covering it")
+        if r.kind == "DES" and not graph.has_child_of_kind(r.id, "TEST"):
+            errors.append(f"{r.id} (in {r.source}) has no TEST covering it")
     return ValidatorResult(passed=not errors, errors=errors)
 
 
@@ -155,33 +157,57 @@ def change_impact_gate(  # implements: DES-assured-substrate-003
     cited_paths: set[str] = set()
     for record in change_impact_records_dir.glob("*.md"):
         cited_paths |= {
-            line.split(":")[0].strip().lstrip("- ")
+            _normalise_cited_path(line.split(":")[0].strip().lstrip("- "))
             for line in record.read_text(encoding="utf-8").splitlines()
             if "src/" in line and ":" in line
         }
     errors: List[str] = []
     for f in changed_code_files:
-        rel = str(f).replace(str(f.anchor), "")
-        if not any(rel.endswith(c) or c in str(f) for c in cited_paths):
+        if cited_paths.isdisjoint(_path_windows(f)):
             errors.append(f"{f}: no change-impact record cites this file")
     return ValidatorResult(passed=not errors, errors=errors)
 
 
+def _normalise_cited_path(cited: str) -> str:
+    """Drop a leading ``./`` and trailing ``/`` so cited directories match windows."""
+    while cited.startswith("./"):
+        cited = cited[2:]
+    return cited.rstrip("/")
+
+
+def _path_windows(path: Path) -> set[str]:
+    """Every contiguous run of *path*'s components, joined with ``/``.
+
+    A cited path matches a changed file when it equals one of these windows,
+    so the gate does one set lookup per file instead of substring-scanning
+    every cited path.  Cited directories (``src/auth``) match too.
+    """
+    parts = [p for p in path.parts if p != path.anchor]
+    return {
+        "/".join(parts[start:end])
+        for start in range(len(parts))
+        for end in range(start + 1, len(parts) + 1)
+    }
+
+
 _IMPLEMENTS_RE = re.compile(r"^\s*#\s*implements:\s*(?P<ids>.+)$", re.MULTILINE)
 _ID_TOKEN_RE = re.compile(r"[A-Za-z0-9.\-]+")
 
 
 def annotation_format_integrity(  # implements: DES-assured-traceability-validators-004
-    code_files: List[Path], declared_ids: set[str]
+    code_files: List[Path],
+    declared_ids: set[str],
+    corpus: Optional[SourceCorpus] = None,
 ) -> ValidatorResult:
     # implements: DES-assured-traceability-validators-004
     """Check that every `# implements:` annotation cites a declared, well-formed ID."""
+    if corpus is None:
+        corpus = SourceCorpus()
     errors: List[str] = []
     for f in code_files:
         if not f.is_file():
             continue
-        text = f.read_text(encoding="utf-8")
-        for line_no, line in enumerate(text.splitlines(), start=1):
+        for line_no, line in enumerate(corpus.lines(f), start=1):
             m = _IMPLEMENTS_RE.match(line)
             if not m:
                 continue
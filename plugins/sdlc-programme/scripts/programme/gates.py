@@ -9,15 +9,25 @@ Four gates correspond to the four phases:
   and all references resolve to declared REQ + DES IDs
 - code_gate — checks code text has at least one # implements: TEST-<feature>-NNN
   annotation and the cited TEST-ID exists in test-spec.md
+  (code_tree_gate does the same over source directories, file by file)
 
 Each gate returns a GateResult with passed: bool and errors: list[str]. Block
 on errors at pre-push validation; weak (vague but non-broken) references are
 out of scope here — phase-review (skill) catches those.
+
+run_all_gates runs every gate over every feature directory under a specs
+root in one call: each spec is parsed once per feature into a SpecCache
+shared by that feature's gates, features are evaluated in parallel, and the
+results come back as one GateReport (render_gate_report → JSON).
 """
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 from .spec_parser import ParsedSpec, SpecParseError, parse_spec
@@ -26,6 +36,11 @@ from .spec_parser import ParsedSpec, SpecParseError, parse_spec
 _TEST_ID_REF_RE = re.compile(r"#\s*implements:\s*([^\n]+)")
 _TEST_ID_RE = re.compile(r"\b(TEST-[a-z0-9][a-z0-9-]*-\d+)\b")
 
+_SPEC_FILES = ("requirements-spec.md", "design-spec.md", "test-spec.md")
+
+# (spec path, phase) → _try_parse outcome, shared by the gates of one feature.
+SpecCache = dict[tuple[Path, str], tuple[ParsedSpec | None, str | None]]
+
 
 class GateError(Exception):
     """Raised when a gate cannot be executed (not the same as gate failing)."""
@@ -41,12 +56,47 @@ class GateResult:
     errors: list[str] = field(default_factory=list)
 
 
-def _try_parse(path: Path, phase: str) -> tuple[ParsedSpec | None, str | None]:
-    """Parse a spec; return (parsed, None) or (None, error_message)."""
+@dataclass
+class GateReport:
+    """Consolidated outcome of run_all_gates: feature-id → gate results."""
+
+    features: dict[str, list[GateResult]] = field(default_factory=dict)
+
+    @property
+    def passed(self) -> bool:
+        return all(r.passed for results in self.features.values() for r in results)
+
+    def to_dict(self) -> dict:
+        return {
+            "passed": self.passed,
+            "features": {
+                fid: [asdict(r) for r in results]
+                for fid, results in self.features.items()
+            },
+        }
+
+
+def _try_parse(
+    path: Path, phase: str, cache: SpecCache | None = None
+) -> tuple[ParsedSpec | None, str | None]:
+    """Parse a spec; return (parsed, None) or (None, error_message).
+
+    With a cache, each (path, phase) is parsed at most once — failures
+    included, so a missing prerequisite is not re-probed by every gate.
+    """
+    key = (path, phase)
+    if cache is not None and key in cache:
+        return cache[key]
     try:
-        return parse_spec(path, phase=phase), None
+        outcome: tuple[ParsedSpec | None, str | None] = (
+            parse_spec(path, phase=phase),
+            None,
+        )
     except SpecParseError as e:
-        return None, str(e)
+        outcome = (None, str(e))
+    if cache is not None:
+        cache[key] = outcome
+    return outcome
 
 
 def _has_review_record(feature_dir: Path, phase: str) -> bool:
@@ -100,13 +150,15 @@ def _check_mandatory_sections_non_empty(spec_path: Path, result: GateResult) ->
             )
 
 
-def requirements_gate(feature_dir: Path, feature_id: str) -> GateResult:
+def requirements_gate(
+    feature_dir: Path, feature_id: str, spec_cache: SpecCache | None = None
+) -> GateResult:
     """Check requirements-spec.md exists, has feature-id, declares ≥ 1 REQ-ID."""
     # implements: DES-programme-validators-001
     result = GateResult(gate_name="requirements", feature_id=feature_id)
     spec = feature_dir / "requirements-spec.md"
 
-    parsed, err = _try_parse(spec, "requirements")
+    parsed, err = _try_parse(spec, "requirements", spec_cache)
     if parsed is None:
         result.passed = False
         result.errors.append(f"requirements-spec.md: {err}")
@@ -131,7 +183,9 @@ def requirements_gate(feature_dir: Path, feature_id: str) -> GateResult:
     return result
 
 
-def design_gate(feature_dir: Path, feature_id: str) -> GateResult:
+def design_gate(
+    feature_dir: Path, feature_id: str, spec_cache: SpecCache | None = None
+) -> GateResult:
     """Check design-spec.md exists with valid satisfies refs to requirements-spec."""
     # implements: DES-programme-validators-002
     result = GateResult(gate_name="design", feature_id=feature_id)
@@ -139,13 +193,13 @@ def design_gate(feature_dir: Path, feature_id: str) -> GateResult:
     req_spec = feature_dir / "requirements-spec.md"
     des_spec = feature_dir / "design-spec.md"
 
-    req_parsed, req_err = _try_parse(req_spec, "requirements")
+    req_parsed, req_err = _try_parse(req_spec, "requirements", spec_cache)
     if req_parsed is None:
         result.passed = False
         result.errors.append(f"requirements-spec.md (prerequisite): {req_err}")
         return result
 
-    des_parsed, des_err = _try_parse(des_spec, "design")
+    des_parsed, des_err = _try_parse(des_spec, "design", spec_cache)
     if des_parsed is None:
         result.passed = False
         result.errors.append(f"design-spec.md: {des_err}")
@@ -185,7 +239,9 @@ def design_gate(feature_dir: Path, feature_id: str) -> GateResult:
     return result
 
 
-def test_gate(feature_dir: Path, feature_id: str) -> GateResult:
+def test_gate(
+    feature_dir: Path, feature_id: str, spec_cache: SpecCache | None = None
+) -> GateResult:
     """Check test-spec.md exists with valid satisfies refs to both prior phases."""
     # implements: DES-programme-validators-003
     result = GateResult(gate_name="test", feature_id=feature_id)
@@ -194,19 +250,19 @@ def test_gate(feature_dir: Path, feature_id: str) -> GateResult:
     des_spec = feature_dir / "design-spec.md"
     test_spec = feature_dir / "test-spec.md"
 
-    req_parsed, req_err = _try_parse(req_spec, "requirements")
+    req_parsed, req_err = _try_parse(req_spec, "requirements", spec_cache)
     if req_parsed is None:
         result.passed = False
         result.errors.append(f"requirements-spec.md (prerequisite): {req_err}")
         return result
 
-    des_parsed, des_err = _try_parse(des_spec, "design")
+    des_parsed, des_err = _try_parse(des_spec, "design", spec_cache)
     if des_parsed is None:
         result.passed = False
         result.errors.append(f"design-spec.md (prerequisite): {des_err}")
         return result
 
-    test_parsed, test_err = _try_parse(test_spec, "test")
+    test_parsed, test_err = _try_parse(test_spec, "test", spec_cache)
     if test_parsed is None:
         result.passed = False
         result.errors.append(f"test-spec.md: {test_err}")
@@ -251,13 +307,18 @@ def test_gate(feature_dir: Path, feature_id: str) -> GateResult:
     return result
 
 
-def code_gate(feature_dir: Path, feature_id: str, code_text: str) -> GateResult:
+def code_gate(
+    feature_dir: Path,
+    feature_id: str,
+    code_text: str,
+    spec_cache: SpecCache | None = None,
+) -> GateResult:
     """Check code_text has a TEST-ID annotation that resolves to test-spec.md."""
     # implements: DES-programme-validators-004
     result = GateResult(gate_name="code", feature_id=feature_id)
 
     test_spec = feature_dir / "test-spec.md"
-    test_parsed, test_err = _try_parse(test_spec, "test")
+    test_parsed, test_err = _try_parse(test_spec, "test", spec_cache)
     if test_parsed is None:
         result.passed = False
         result.errors.append(f"test-spec.md (prerequisite): {test_err}")
@@ -282,3 +343,271 @@ def code_gate(feature_dir: Path, feature_id: str, code_text: str) -> GateResult:
             )
 
     return result
+
+
+@dataclass(frozen=True)
+class CodeCitation:
+    """One TEST-ID cited on an ``# implements:`` line of a source file."""
+
+    path: str
+    line: int
+    test_id: str
+
+
+class CodeScanCache:
+    """SHA-256 of a file's bytes → the (line, TEST-ID) citations found in it.
+
+    Keyed by content rather than path, so renamed or copied files hit too.
+    ``load`` / ``save`` persist it as JSON between runs; a missing or
+    unreadable cache file just starts empty.
+    """
+
+    def __init__(self, entries: dict[str, list[tuple[int, str]]] | None = None):
+        self._entries: dict[str, list[tuple[int, str]]] = dict(entries or {})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, digest: str) -> list[tuple[int, str]] | None:
+        return self._entries.get(digest)
+
+    def put(self, digest: str, citations: list[tuple[int, str]]) -> None:
+        self._entries[digest] = citations
+
+    @classmethod
+    def load(cls, path: Path) -> "CodeScanCache":
+        try:
+            raw = json.loads(path.read_text())
+            return cls(
+                {
+                    digest: [(int(line), str(tid)) for line, tid in cites]
+                    for digest, cites in raw.items()
+                }
+            )
+        except (OSError, ValueError, TypeError, AttributeError):
+            return cls()
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self._entries, sort_keys=True) + "\n")
+
+
+_SKIP_DIRS = {"__pycache__", "node_modules"}
+
+
+def _iter_source_files(
+    source_roots: list[Path], suffixes: tuple[str, ...] | None
+) -> list[Path]:
+    files: list[Path] = []
+    for root in source_roots:
+        if root.is_file():
+            files.append(root)
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(
+                d for d in dirnames if not d.startswith(".") and d not in _SKIP_DIRS
+            )
+            for name in sorted(filenames):
+                if suffixes is None or name.endswith(suffixes):
+                    files.append(Path(dirpath) / name)
+    return files
+
+
+def _scan_file(path: Path, cache: CodeScanCache | None) -> list[tuple[int, str]]:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return []
+    # Byte-level prefilter: most files carry no annotation at all, so skip
+    # hashing, decoding and regex work for them.
+    if b"implements:" not in data:
+        return []
+    digest = hashlib.sha256(data).hexdigest()
+    if cache is not None:
+        cached = cache.get(digest)
+        if cached is not None:
+            return cached
+    found: list[tuple[int, str]] = []
+    text = data.decode("utf-8", errors="replace")
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        if "implements:" not in line:
+            continue
+        match = _TEST_ID_REF_RE.search(line)
+        if match is None:
+            continue
+        for tid in _TEST_ID_RE.findall(match.group(1)):
+            found.append((lineno, tid))
+    if cache is not None:
+        cache.put(digest, found)
+    return found
+
+
+def scan_code_citations(
+    source_roots: list[Path],
+    suffixes: tuple[str, ...] | None = None,
+    workers: int = 1,
+    cache: CodeScanCache | None = None,
+) -> list[CodeCitation]:
+    """Collect every ``# implements: TEST-...`` citation under source_roots.
+
+    Walks each root (hidden directories, __pycache__ and node_modules are
+    skipped), optionally keeping only files ending in one of suffixes.
+    Files are read as bytes and only decoded when they contain
+    ``implements:``; results are memoised per content hash in cache.
+    Citations come back ordered by path then line.
+    """
+    # implements: DES-programme-validators-004
+    files = _iter_source_files(source_roots, suffixes)
+    if workers > 1 and len(files) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            per_file = list(pool.map(lambda f: _scan_file(f, cache), files))
+    else:
+        per_file = [_scan_file(f, cache) for f in files]
+    return [
+        CodeCitation(path=str(f), line=line, test_id=tid)
+        for f, found in zip(files, per_file)
+        for line, tid in found
+    ]
+
+
+def _text_citations(code_text: str) -> list[CodeCitation]:
+    """Citations in an in-memory code blob, reported as ``<code_text>:line``."""
+    return [
+        CodeCitation(path="<code_text>", line=lineno, test_id=tid)
+        for lineno, line in enumerate(code_text.splitlines(), start=1)
+        for match in _TEST_ID_REF_RE.finditer(line)
+        for tid in _TEST_ID_RE.findall(match.group(1))
+    ]
+
+
+def _feature_citations(
+    citations: list[CodeCitation], feature_id: str
+) -> list[CodeCitation]:
+    feature_re = re.compile(rf"TEST-{re.escape(feature_id)}-\d+")
+    return [c for c in citations if feature_re.fullmatch(c.test_id)]
+
+
+def code_tree_gate(
+    feature_dir: Path,
+    feature_id: str,
+    source_roots: list[Path] | None = None,
+    suffixes: tuple[str, ...] | None = None,
+    workers: int = 1,
+    cache: CodeScanCache | None = None,
+    spec_cache: SpecCache | None = None,
+    citations: list[CodeCitation] | None = None,
+) -> GateResult:
+    """Tree-scanning variant of code_gate.
+
+    Scans source_roots (or reuses a precomputed citations list) and checks
+    the citations belonging to this feature — TEST-<feature_id>-NNN — so
+    one scan of a shared source tree serves every feature.  Unresolved
+    citations are reported with their path:line.
+    """
+    # implements: DES-programme-validators-004
+    result = GateResult(gate_name="code", feature_id=feature_id)
+
+    test_spec = feature_dir / "test-spec.md"
+    test_parsed, test_err = _try_parse(test_spec, "test", spec_cache)
+    if test_parsed is None:
+        result.passed = False
+        result.errors.append(f"test-spec.md (prerequisite): {test_err}")
+        return result
+
+    if citations is None:
+        citations = scan_code_citations(
+            source_roots or [], suffixes=suffixes, workers=workers, cache=cache
+        )
+    own = _feature_citations(citations, feature_id)
+
+    if not own:
+        result.passed = False
+        result.errors.append(
+            f"code has no # implements: TEST-{feature_id}-NNN annotation"
+        )
+        return result
+
+    for c in own:
+        if c.test_id not in test_parsed.declared_ids:
+            result.passed = False
+            result.errors.append(
+                f"{c.path}:{c.line} references {c.test_id} which is not "
+                f"declared in test-spec.md"
+            )
+
+    return result
+
+
+def _feature_dirs(features_root: Path) -> list[Path]:
+    """Sub-directories of features_root holding at least one phase spec."""
+    if not features_root.is_dir():
+        return []
+    return sorted(
+        d
+        for d in features_root.iterdir()
+        if d.is_dir() and any((d / name).is_file() for name in _SPEC_FILES)
+    )
+
+
+def _run_feature_gates(
+    feature_dir: Path,
+    citations: list[CodeCitation] | None,
+) -> list[GateResult]:
+    feature_id = feature_dir.name
+    cache: SpecCache = {}
+    results = [
+        requirements_gate(feature_dir, feature_id, spec_cache=cache),
+        design_gate(feature_dir, feature_id, spec_cache=cache),
+        test_gate(feature_dir, feature_id, spec_cache=cache),
+    ]
+    if citations is not None:
+        results.append(
+            code_tree_gate(
+                feature_dir, feature_id, spec_cache=cache, citations=citations
+            )
+        )
+    return results
+
+
+def run_all_gates(
+    features_root: Path,
+    workers: int = 1,
+    code_text: str | None = None,
+    source_roots: list[Path] | None = None,
+    suffixes: tuple[str, ...] | None = None,
+    code_cache: CodeScanCache | None = None,
+) -> GateReport:
+    """Run every phase gate for every feature directory under features_root.
+
+    Feature directories follow the docs/specs/<feature-id>/ layout, so the
+    directory name is the expected feature-id.  The code gate runs when
+    source_roots (scanned once for all features, see code_tree_gate) or
+    code_text is given; either way each feature checks only its own
+    TEST-<feature_id>-NNN citations.  The report is ordered by feature-id.
+
+    Features are evaluated serially: gate checks are CPU-bound regex and
+    Markdown parsing, which threads cannot speed up under the GIL.  The
+    gain over calling each gate separately comes from parsing every spec
+    once per feature (shared spec cache) and scanning source_roots once
+    for all features.  workers only sizes the thread pool of that source
+    scan, whose cost is dominated by file reads.
+    """
+    # implements: DES-programme-validators-001, DES-programme-validators-002
+    # implements: DES-programme-validators-003, DES-programme-validators-004
+    feature_dirs = _feature_dirs(features_root)
+    citations = None
+    if source_roots is not None:
+        citations = scan_code_citations(
+            source_roots, suffixes=suffixes, workers=workers, cache=code_cache
+        )
+    elif code_text is not None:
+        citations = _text_citations(code_text)
+    all_results = [_run_feature_gates(d, citations) for d in feature_dirs]
+    return GateReport(
+        features={d.name: results for d, results in zip(feature_dirs, all_results)}
+    )
+
+
+def render_gate_report(report: GateReport) -> str:
+    """Serialise report as deterministic, indented JSON."""
+    return json.dumps(report.to_dict(), indent=2, sort_keys=True) + "\n"
@@ -0,0 +1,185 @@
+"""Programme-wide traceability index across every feature under docs/specs/.
+
+``traceability.build_matrix`` and the phase gates work one feature directory
+at a time, so a programme-level question ("which tests cover REQ X?", "which
+IDs are declared twice?", "which satisfies links cross features?") means
+re-parsing every feature.  ``build_programme_index`` walks the specs root
+once, parses each phase spec once, and precomputes the answers:
+
+- one ID table (ID → feature, phase, spec path, satisfies refs);
+- reverse links (ID → IDs citing it), including links across features;
+- REQ → covering TEST-IDs, direct or through a satisfying DES-ID;
+- duplicate declarations and dangling references.
+
+Queries on the result are dictionary lookups.  ``write_index`` /
+``read_index`` persist it as JSON so other tools can load the global view
+without parsing any markdown.
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from .spec_parser import SpecParseError, parse_spec
+
+FORMAT_VERSION = 1
+
+_PHASE_FILES = (
+    ("requirements", "requirements-spec.md"),
+    ("design", "design-spec.md"),
+    ("test", "test-spec.md"),
+)
+
+
+@dataclass
+class IndexEntry:
+    """One declared ID in the programme index."""
+
+    id: str
+    feature: str
+    phase: str
+    source: str
+    satisfies: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ProgrammeIndex:
+    """Unified ID table and precomputed reverse links for a whole programme."""
+
+    entries: dict[str, IndexEntry] = field(default_factory=dict)
+    duplicates: dict[str, list[str]] = field(default_factory=dict)
+    reverse: dict[str, list[str]] = field(default_factory=dict)
+    coverage: dict[str, list[str]] = field(default_factory=dict)
+    dangling: dict[str, list[str]] = field(default_factory=dict)
+    errors: list[str] = field(default_factory=list)
+
+    def feature_of(self, id_: str) -> str | None:
+        entry = self.entries.get(id_)
+        return entry.feature if entry else None
+
+    def cited_by(self, id_: str) -> list[str]:
+        """IDs whose satisfies line cites id_, sorted."""
+        return self.reverse.get(id_, [])
+
+    def tests_covering(self, req_id: str) -> list[str]:
+        """TEST-IDs covering req_id directly or through a satisfying DES, sorted."""
+        return self.coverage.get(req_id, [])
+
+    def cross_feature_links(self) -> list[tuple[str, str]]:
+        """(citing ID, cited ID) pairs whose declarations sit in different features."""
+        links = []
+        for entry in self.entries.values():
+            for ref in entry.satisfies:
+                target = self.entries.get(ref)
+                if target is not None and target.feature != entry.feature:
+                    links.append((entry.id, ref))
+        return sorted(links)
+
+    def to_dict(self) -> dict:
+        return {
+            "format_version": FORMAT_VERSION,
+            "entries": [asdict(e) for e in self.entries.values()],
+            "duplicates": self.duplicates,
+            "reverse": self.reverse,
+            "coverage": self.coverage,
+            "dangling": self.dangling,
+            "errors": self.errors,
+        }
+
+
+def build_programme_index(specs_root: Path) -> ProgrammeIndex:
+    """Walk every feature directory under specs_root once and index it.
+
+    A feature directory is any sub-directory holding at least one phase
+    spec; missing phases are skipped (features in early phases are normal)
+    and unparseable specs are recorded in ``errors``.  The first
+    declaration of an ID wins in ``entries``; every declaring spec is
+    listed in ``duplicates``.
+    """
+    # implements: DES-programme-substrate-002
+    index = ProgrammeIndex()
+    declared_in: dict[str, list[str]] = {}
+    feature_dirs = (
+        sorted(d for d in specs_root.iterdir() if d.is_dir())
+        if specs_root.is_dir()
+        else []
+    )
+    for feature_dir in feature_dirs:
+        for phase, filename in _PHASE_FILES:
+            path = feature_dir / filename
+            if not path.is_file():
+                continue
+            try:
+                parsed = parse_spec(path, phase=phase)
+            except SpecParseError as e:
+                index.errors.append(f"{path}: {e}")
+                continue
+            for id_ in sorted(parsed.declared_ids):
+                declared_in.setdefault(id_, []).append(str(path))
+                index.entries.setdefault(
+                    id_,
+                    IndexEntry(
+                        id=id_,
+                        feature=feature_dir.name,
+                        phase=phase,
+                        source=str(path),
+                        satisfies=sorted(parsed.satisfies.get(id_, ())),
+                    ),
+                )
+
+    index.duplicates = {i: srcs for i, srcs in declared_in.items() if len(srcs) > 1}
+    _link(index)
+    return index
+
+
+def _link(index: ProgrammeIndex) -> None:
+    reverse: dict[str, set[str]] = {}
+    dangling: dict[str, set[str]] = {}
+    des_to_req: dict[str, set[str]] = {}
+    for entry in index.entries.values():
+        for ref in entry.satisfies:
+            reverse.setdefault(ref, set()).add(entry.id)
+            if ref not in index.entries:
+                dangling.setdefault(ref, set()).add(entry.id)
+            if entry.phase == "design" and ref.startswith("REQ-"):
+                des_to_req.setdefault(entry.id, set()).add(ref)
+
+    coverage: dict[str, set[str]] = {}
+    for entry in index.entries.values():
+        if entry.phase != "test":
+            continue
+        for ref in entry.satisfies:
+            reqs = {ref} if ref.startswith("REQ-") else des_to_req.get(ref, set())
+            for r in reqs:
+                coverage.setdefault(r, set()).add(entry.id)
+
+    index.reverse = {k: sorted(v) for k, v in sorted(reverse.items())}
+    index.dangling = {k: sorted(v) for k, v in sorted(dangling.items())}
+    index.coverage = {k: sorted(v) for k, v in sorted(coverage.items())}
+
+
+def write_index(index: ProgrammeIndex, path: Path) -> None:
+    """Persist index as deterministic JSON."""
+    # implements: DES-programme-substrate-002
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(index.to_dict(), indent=2, sort_keys=True) + "\n")
+
+
+def read_index(path: Path) -> ProgrammeIndex | None:
+    """Load a persisted index, or None if missing, corrupt or another version."""
+    # implements: DES-programme-substrate-002
+    try:
+        raw = json.loads(path.read_text())
+        if raw.get("format_version") != FORMAT_VERSION:
+            return None
+        return ProgrammeIndex(
+            entries={e["id"]: IndexEntry(**e) for e in raw["entries"]},
+            duplicates=raw["duplicates"],
+            reverse=raw["reverse"],
+            coverage=raw["coverage"],
+            dangling=raw["dangling"],
+            errors=raw["errors"],
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
@@ -51,6 +51,8 @@ class ParsedSpec:
     phase: str
     declared_ids: set[str] = field(default_factory=set)
     references: set[str] = field(default_factory=set)
+    # Declared ID → IDs on the **satisfies:** lines of its section.
+    satisfies: dict[str, set[str]] = field(default_factory=dict)
 
 
 def parse_spec(path: Path, phase: str) -> ParsedSpec:
@@ -80,15 +82,21 @@ def parse_spec(path: Path, phase: str) -> ParsedSpec:
 
     declared_ids: set[str] = set()
     references: set[str] = set()
+    satisfies: dict[str, set[str]] = {}
+    current_id: str | None = None
     expected_prefix = _PHASE_TO_PREFIX[phase]
 
     in_code_block = False
     in_html_comment = False
+    # Dispatch on the first character so each line costs at most one regex:
+    # only ``###`` lines can declare IDs and only ``**`` lines can be
+    # satisfies lines.
     for line in text.splitlines():
         stripped = line.strip()
+        first = stripped[:1]
 
         # Track fenced code blocks
-        if stripped.startswith("```"):
+        if first == "`" and stripped.startswith("```"):
             in_code_block = not in_code_block
             continue
         if in_code_block:
@@ -99,33 +107,40 @@ def parse_spec(path: Path, phase: str) -> ParsedSpec:
             if "-->" in line:
                 in_html_comment = False
             continue
-        if stripped.startswith("<!--"):
+        if first == "<" and stripped.startswith("<!--"):
             if "-->" not in line:
                 in_html_comment = True
             continue
 
         # Skip blockquote lines
-        if stripped.startswith(">"):
+        if first == ">":
             continue
 
-        # H3 headings — declared IDs (only those matching this phase's prefix)
-        heading_match = _HEADING_ID_RE.match(line)
-        if heading_match:
-            heading_id = heading_match.group("id")
-            if heading_id.startswith(expected_prefix + "-"):
-                declared_ids.add(heading_id)
-            continue
-
-        # **satisfies:** lines — cross-phase references
-        satisfies_match = _SATISFIES_RE.match(line)
-        if satisfies_match:
-            refs_text = _strip_inline_code(satisfies_match.group("refs"))
-            for ref in _REF_ID_RE.findall(refs_text):
-                references.add(ref)
+        if line.startswith("###"):
+            # H3 headings — declared IDs (only those matching this phase's prefix)
+            heading_match = _HEADING_ID_RE.match(line)
+            if heading_match:
+                heading_id = heading_match.group("id")
+                if heading_id.startswith(expected_prefix + "-"):
+                    declared_ids.add(heading_id)
+                    current_id = heading_id
+                    satisfies.setdefault(current_id, set())
+                else:
+                    current_id = None
+        elif line.startswith("**"):
+            # **satisfies:** lines — cross-phase references
+            satisfies_match = _SATISFIES_RE.match(line)
+            if satisfies_match:
+                refs_text = _strip_inline_code(satisfies_match.group("refs"))
+                for ref in _REF_ID_RE.findall(refs_text):
+                    references.add(ref)
+                    if current_id is not None:
+                        satisfies[current_id].add(ref)
 
     return ParsedSpec(
         feature_id=feature_id,
         phase=phase,
         declared_ids=declared_ids,
         references=references,
+        satisfies=satisfies,
     )
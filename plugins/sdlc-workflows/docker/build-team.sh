@@ -40,10 +40,18 @@ done
 
 mkdir -p "$GENERATED_DIR"
 
-# Generate team CLAUDE.md from manifest
+# Generate team CLAUDE.md from manifest.  The project CLAUDE.md (if any) is
+# concatenated exactly as build_team_fleet.py --project-claude does, so both
+# tools produce the same file and the same content digest for a team.
+PROJECT_CLAUDE="${PROJECT_CLAUDE_MD:-CLAUDE.md}"
+PROJECT_CLAUDE_ARGS=()
+if [ -f "$PROJECT_CLAUDE" ]; then
+    PROJECT_CLAUDE_ARGS=(--project-claude "$PROJECT_CLAUDE")
+fi
 echo "Generating team CLAUDE.md for $TEAM_NAME..."
 python3 "$PLUGIN_DIR/scripts/generate_team_claude_md.py" \
     "$MANIFEST" \
+    "${PROJECT_CLAUDE_ARGS[@]}" \
     --output "$GENERATED_DIR/${TEAM_NAME}-CLAUDE.md"
 
 # S-M-5: emit SHA-256 of the generated team CLAUDE.md so audit trails
@@ -63,12 +71,24 @@ python3 "$PLUGIN_DIR/scripts/generate_team_dockerfile.py" \
     "$MANIFEST" \
     --installed-plugins "$PLUGINS_JSON" \
     --team-claude-md "$GENERATED_DIR/${TEAM_NAME}-CLAUDE.md" \
-    --output "$GENERATED_DIR/${TEAM_NAME}.Dockerfile"
+    --output "$GENERATED_DIR/${TEAM_NAME}.Dockerfile" \
+    --layout "${TEAM_DOCKERFILE_LAYOUT:-per-file}"
+
+# Content digest of everything baked into the image (manifest, resolved
+# agents/skills, generated CLAUDE.md).  Stored as an image label so
+# teams_status_report can detect real drift instead of comparing mtimes.
+TEAM_DIGEST=$(python3 "$PLUGIN_DIR/scripts/teams_status_report.py" \
+    --teams-dir .archon/teams \
+    --installed-plugins "$PLUGINS_JSON" \
+    --digest "$TEAM_NAME")
+echo "Team content digest: $TEAM_DIGEST"
 
 echo "Building $IMAGE_TAG..."
 docker build -t "$IMAGE_TAG" \
+    --label "sdlc.team-digest=$TEAM_DIGEST" \
     -f "$GENERATED_DIR/${TEAM_NAME}.Dockerfile" \
     .
 
 echo ""
 echo "Done. Image: $IMAGE_TAG"
+echo "Record in manifest: image_digest: '$TEAM_DIGEST'"
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""Regenerate and rebuild every stale team image in one pass.
+
+``build-team.sh`` handles a single team.  This command reads all manifests
+with ``teams_status_report.load_manifests``, selects the ``stale`` and
+``not_built`` ones via ``teams_status_report.staleness``, generates each
+team's CLAUDE.md and Dockerfile in parallel, then runs the image builds
+with bounded concurrency.
+
+Every team image shares the ``sdlc-worker:base`` / ``sdlc-worker:full``
+layers plus one ``COPY`` layer per plugin's metadata, so builds are
+scheduled in two waves: first one "seed" team per distinct plugin set
+(most widely shared sets first), then everyone else.  By the time the second wave
+starts, the shared plugin layers are already in the builder cache.
+
+Staleness is content-based: each image carries its
+``teams_status_report.content_digest`` as the ``sdlc.team-digest`` label,
+which is compared against the digest of the freshly generated inputs.
+
+The image builder is pluggable: :class:`DockerBuilder` shells out to
+``docker``; tests pass any object with the same ``image_exists`` /
+``image_label`` / ``build`` methods.
+
+Public API
+----------
+select_teams(manifests, include_current=False, only=None) -> list[dict]
+prepare_team(manifest, installed_json, generated_dir, ...) -> TeamBuildPlan
+schedule_builds(plans) -> list[list[TeamBuildPlan]]
+build_fleet(teams_dir, installed_json, builder, ...) -> FleetBuildReport
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Protocol
+
+# Allow sibling import when run as a script.
+_scripts_dir = Path(__file__).resolve().parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+import generate_team_claude_md  # noqa: E402
+import generate_team_dockerfile  # noqa: E402
+import teams_status_report  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+BASE_IMAGES: tuple[str, ...] = ("sdlc-worker:base", "sdlc-worker:full")
+_REBUILD_STATES = ("stale", "not_built")
+_STAMP_RE = {
+    key: re.compile(rf"^{key}:.*$", re.MULTILINE) for key in ("image_built", "image_digest")
+}
+
+
+class ImageBuilder(Protocol):
+    """What :func:`build_fleet` needs from an image builder."""
+
+    def image_exists(self, tag: str) -> bool:
+        """Return True if *tag* is present locally."""
+
+    def image_label(self, tag: str, key: str) -> str | None:
+        """Return label *key* of image *tag*, or None."""
+
+    def build(
+        self, tag: str, dockerfile: Path, context_dir: Path, labels: dict[str, str],
+    ) -> None:
+        """Build *dockerfile* as *tag* with *labels*; raise on failure."""
+
+
+class DockerBuilder:
+    """:class:`ImageBuilder` backed by the ``docker`` CLI."""
+
+    def __init__(self, docker: str = "docker") -> None:
+        self.docker = docker
+
+    def image_exists(self, tag: str) -> bool:
+        result = subprocess.run(
+            [self.docker, "image", "inspect", tag],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        return result.returncode == 0
+
+    def image_label(self, tag: str, key: str) -> str | None:
+        return teams_status_report.read_image_label(tag, key, self.docker)
+
+    def build(
+        self, tag: str, dockerfile: Path, context_dir: Path, labels: dict[str, str],
+    ) -> None:
+        label_args = [arg for k, v in sorted(labels.items()) for arg in ("--label", f"{k}={v}")]
+        result = subprocess.run(
+            [self.docker, "build", "-t", tag, *label_args, "-f", str(dockerfile), str(context_dir)],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            tail = "\n".join(result.stderr.strip().splitlines()[-5:])
+            raise RuntimeError(f"docker build failed for {tag}: {tail}")
+
+
+@dataclass
+class TeamBuildPlan:
+    """Generated inputs for one team image."""
+
+    name: str
+    manifest_path: Path
+    staleness: str
+    plugins: tuple[str, ...]
+    claude_md: Path
+    dockerfile: Path
+    image_tag: str
+    digest: str = ""
+
+
+@dataclass
+class TeamBuildResult:
+    """Outcome of one team in a fleet run.
+
+    ``status`` is ``"built"``, ``"generated"`` (dry run), or ``"failed"``.
+    """
+
+    name: str
+    staleness: str
+    status: str
+    image_tag: str = ""
+    wave: int = 0
+    seconds: float = 0.0
+    error: str = ""
+
+
+@dataclass
+class FleetBuildReport:
+    """All results of :func:`build_fleet`, plus teams left untouched."""
+
+    results: list[TeamBuildResult] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+
+    @property
+    def failed(self) -> list[TeamBuildResult]:
+        return [r for r in self.results if r.status == "failed"]
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "results": [asdict(r) for r in self.results],
+            "skipped": self.skipped,
+            "failed_count": len(self.failed),
+        }
+
+
+def select_teams(
+    manifests: list[dict],
+    include_current: bool = False,
+    only: list[str] | None = None,
+) -> list[dict]:
+    """Return the manifests whose images need rebuilding.
+
+    Parameters
+    ----------
+    manifests:
+        Output of ``teams_status_report.load_manifests``.
+    include_current:
+        Also select teams whose image is ``current`` (forced rebuild).
+    only:
+        Restrict to these team names.
+
+    This is the timestamp-based pre-check; :func:`build_fleet` refines it
+    with content digests once the team inputs are regenerated.
+    """
+    selected: list[dict] = []
+    for manifest in manifests:
+        name = str(manifest.get("name", ""))
+        if only is not None and name not in only:
+            continue
+        state = teams_status_report.staleness(manifest)
+        if include_current or state in _REBUILD_STATES:
+            manifest["_staleness"] = state
+            selected.append(manifest)
+    return selected
+
+
+def prepare_team(
+    manifest: dict,
+    installed_json: Path,
+    generated_dir: Path,
+    project_claude: Path | None = None,
+    project_root: Path = Path("."),
+    layout: str = "per-file",
+) -> TeamBuildPlan:
+    """Write the team's CLAUDE.md and Dockerfile into *generated_dir*.
+
+    Mirrors the generation steps of ``build-team.sh``, then records the
+    content digest of the generated inputs on the plan.
+    """
+    name = str(manifest.get("name", "unnamed-team"))
+    claude_md = generated_dir / f"{name}-CLAUDE.md"
+    dockerfile = generated_dir / f"{name}.Dockerfile"
+    manifest_path = Path(manifest["_manifest_path"])
+
+    content = generate_team_claude_md.generate(manifest, {}, {})
+    if project_claude is not None and project_claude.exists():
+        content = generate_team_claude_md.concatenate(project_claude, content)
+    generated_dir.mkdir(parents=True, exist_ok=True)
+    claude_md.write_text(content)
+
+    generate_team_dockerfile.generate(
+        manifest_path=manifest_path,
+        installed_json=installed_json,
+        team_claude_md_path=claude_md,
+        output_path=dockerfile,
+        layout=layout,
+    )
+    return TeamBuildPlan(
+        name=name,
+        manifest_path=manifest_path,
+        staleness=str(manifest.get("_staleness", "")),
+        plugins=tuple(sorted(str(p) for p in manifest.get("plugins", []) or [])),
+        claude_md=claude_md,
+        dockerfile=dockerfile,
+        image_tag=f"sdlc-worker:{name}",
+        digest=teams_status_report.content_digest(manifest, installed_json, project_root),
+    )
+
+
+def schedule_builds(plans: list[TeamBuildPlan]) -> list[list[TeamBuildPlan]]:
+    """Split *plans* into a seed wave and a follow-up wave.
+
+    Teams are grouped by plugin set.  The first team of each group (groups
+    ordered largest first, then by plugin set) goes in wave 0 so its shared
+    plugin layers are cached before the rest of the group builds in wave 1.
+    """
+    groups: dict[tuple[str, ...], list[TeamBuildPlan]] = {}
+    for plan in sorted(plans, key=lambda p: p.name):
+        groups.setdefault(plan.plugins, []).append(plan)
+    ordered = sorted(groups.items(), key=lambda item: (-len(item[1]), item[0]))
+
+    seeds = [members[0] for _, members in ordered]
+    rest = [plan for _, members in ordered for plan in members[1:]]
+    return [wave for wave in (seeds, rest) if wave]
+
+
+def stamp_image_built(manifest_path: Path, timestamp: str, digest: str = "") -> None:
+    """Set ``image_built`` (and ``image_digest``) in *manifest_path*.
+
+    Only those lines are touched; the rest of the file is preserved.
+    """
+    text = manifest_path.read_text()
+    for key, value in (("image_built", timestamp), ("image_digest", digest)):
+        if not value:
+            continue
+        line = f"{key}: '{value}'"
+        if _STAMP_RE[key].search(text):
+            text = _STAMP_RE[key].sub(line, text, count=1)
+        else:
+            text = text.rstrip("\n") + f"\n{line}\n"
+    manifest_path.write_text(text)
+
+
+def build_fleet(
+    teams_dir: Path,
+    installed_json: Path,
+    builder: ImageBuilder,
+    *,
+    context_dir: Path = Path("."),
+    project_claude: Path | None = None,
+    include_current: bool = False,
+    only: list[str] | None = None,
+    workers: int = 4,
+    max_builds: int = 2,
+    dry_run: bool = False,
+    layout: str = "per-file",
+) -> FleetBuildReport:
+    """Regenerate and rebuild every stale or unbuilt team under *teams_dir*.
+
+    Generation runs on *workers* threads; image builds run at most
+    *max_builds* at a time, wave by wave (see :func:`schedule_builds`).
+    Every candidate's inputs are regenerated first; a team is rebuilt when
+    its content digest differs from the ``sdlc.team-digest`` label on its
+    image (or the manifest's ``image_digest``).  Successful builds carry the
+    new digest as that label and stamp ``image_built`` and ``image_digest``
+    in the team manifest.  With *dry_run* only the CLAUDE.md and Dockerfile
+    are generated.
+    """
+    manifests = teams_status_report.load_manifests(teams_dir)
+    candidates = select_teams(manifests, include_current=True, only=only)
+    logger.info(
+        "Fleet build starting",
+        extra={"teams_dir": str(teams_dir), "candidate_count": len(candidates)},
+    )
+    report = FleetBuildReport()
+    if not candidates:
+        return report
+
+    if not dry_run:
+        missing = [tag for tag in BASE_IMAGES if not builder.image_exists(tag)]
+        if missing:
+            raise RuntimeError(
+                "Required base images not found: " + ", ".join(missing)
+                + " (run build-base.sh and build-full.sh)"
+            )
+
+    generated_dir = teams_dir / ".generated"
+
+    def _prepare(manifest: dict) -> TeamBuildPlan | TeamBuildResult:
+        try:
+            return prepare_team(
+                manifest, installed_json, generated_dir, project_claude, context_dir, layout,
+            )
+        except Exception as exc:  # noqa: BLE001 — one bad team must not stop the fleet
+            logger.warning(
+                "Team generation failed",
+                extra={"team": manifest.get("name"), "error": str(exc)},
+            )
+            return TeamBuildResult(
+                name=str(manifest.get("name", "")),
+                staleness=str(manifest.get("_staleness", "")),
+                status="failed",
+                error=f"generation: {exc}",
+            )
+
+    def _recorded_digest(manifest: dict) -> str | None:
+        name = str(manifest.get("name", ""))
+        label = builder.image_label(f"sdlc-worker:{name}", teams_status_report.DIGEST_LABEL)
+        return label or manifest.get("image_digest")
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        recorded = list(pool.map(_recorded_digest, candidates))
+
+        # Teams built before digests existed keep the timestamp verdict from
+        # select_teams; current ones are left untouched (regenerating them
+        # would only bump their CLAUDE.md mtime) and pick up a label on
+        # their next rebuild.
+        to_prepare: list[tuple[dict, str | None]] = []
+        for manifest, digest in zip(candidates, recorded):
+            has_digest = bool(digest and manifest.get("image_built"))
+            if has_digest or include_current or manifest["_staleness"] in _REBUILD_STATES:
+                to_prepare.append((manifest, digest if has_digest else None))
+            else:
+                report.skipped.append(str(manifest.get("name", "")))
+        outcomes = list(pool.map(_prepare, [m for m, _ in to_prepare]))
+
+    # Inputs are freshly regenerated, so a digest recorded at the last build
+    # decides staleness.
+    plans: list[TeamBuildPlan] = []
+    for (manifest, digest), outcome in zip(to_prepare, outcomes):
+        if isinstance(outcome, TeamBuildResult):
+            report.results.append(outcome)
+            continue
+        if digest:
+            outcome.staleness = "current" if outcome.digest == digest else "stale"
+        if include_current or outcome.staleness in _REBUILD_STATES:
+            plans.append(outcome)
+        else:
+            report.skipped.append(outcome.name)
+    report.skipped.sort()
+
+    if dry_run:
+        report.results.extend(
+            TeamBuildResult(p.name, p.staleness, "generated", p.image_tag) for p in plans
+        )
+        report.results.sort(key=lambda r: r.name)
+        return report
+
+    def _build(wave: int, plan: TeamBuildPlan) -> TeamBuildResult:
+        start = time.perf_counter()
+        result = TeamBuildResult(plan.name, plan.staleness, "built", plan.image_tag, wave)
+        try:
+            builder.build(
+                plan.image_tag,
+                plan.dockerfile,
+                context_dir,
+                {teams_status_report.DIGEST_LABEL: plan.digest},
+            )
+            # Full precision: staleness compares this string against the
+            # generated CLAUDE.md mtime, written moments earlier.
+            stamp_image_built(
+                plan.manifest_path,
+                datetime.now(timezone.utc).isoformat(timespec="microseconds"),
+                plan.digest,
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Team image build failed",
+                extra={"team": plan.name, "error": str(exc)},
+            )
+            result.status = "failed"
+            result.error = str(exc)
+        result.seconds = round(time.perf_counter() - start, 3)
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, max_builds)) as pool:
+        for wave_no, wave in enumerate(schedule_builds(plans)):
+            report.results.extend(pool.map(lambda p, w=wave_no: _build(w, p), wave))
+
+    report.results.sort(key=lambda r: r.name)
+    logger.info(
+        "Fleet build complete",
+        extra={"built": len(report.results) - len(report.failed), "failed": len(report.failed)},
+    )
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point for build_team_fleet."""
+    import argparse
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    logger.info("build_team_fleet CLI start")
+    parser = argparse.ArgumentParser(description="Rebuild all stale team images")
+    parser.add_argument("--teams-dir", type=Path, default=Path(".archon/teams"))
+    parser.add_argument(
+        "--installed-plugins",
+        type=Path,
+        default=Path.home() / ".claude" / "plugins" / "installed_plugins.json",
+    )
+    parser.add_argument("--project-claude", type=Path, default=None)
+    parser.add_argument("--team", action="append", dest="teams", help="Limit to this team (repeatable).")
+    parser.add_argument("--all", action="store_true", help="Also rebuild current images.")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel generation workers.")
+    parser.add_argument("--max-builds", type=int, default=2, help="Concurrent docker builds.")
+    parser.add_argument("--dry-run", action="store_true", help="Generate files only.")
+    parser.add_argument(
+        "--layout",
+        choices=generate_team_dockerfile.LAYOUTS,
+        default="per-file",
+        help="Dockerfile layer layout for plugin files.",
+    )
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        report = build_fleet(
+            args.teams_dir,
+            args.installed_plugins,
+            DockerBuilder(),
+            project_claude=args.project_claude,
+            include_current=args.all,
+            only=args.teams,
+            workers=args.workers,
+            max_builds=args.max_builds,
+            dry_run=args.dry_run,
+            layout=args.layout,
+        )
+    except RuntimeError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        for result in report.results:
+            line = f"  {result.name:30s} {result.staleness:10s} {result.status:10s}"
+            if result.error:
+                line += f" {result.error}"
+            print(line)
+        print(f"Skipped (current): {len(report.skipped)}")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
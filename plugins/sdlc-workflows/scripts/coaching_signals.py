@@ -6,22 +6,50 @@ Signal tiers:
 - **advisory** — worth reviewing (e.g. stale image, unused team)
 - **informational** — patterns to be aware of (e.g. frequent overrides)
 
+Override analysis is incremental: per-agent counters and the byte offset
+reached in ``overrides.jsonl`` are checkpointed beside the log
+(``overrides.jsonl.checkpoint.json``), so each run only reads lines
+appended since the last one. The append-only log grows with every
+workflow run across the fleet. Counters keep daily buckets for the
+trailing windows in ``OVERRIDE_WINDOWS_DAYS`` (7 and 30 days).
+
 Public API
 ----------
 analyse_team(team_data) -> list[dict]
 analyse_fleet(teams) -> dict[str, list[dict]]
-analyse_overrides(log_path, threshold=3) -> list[dict]
+update_override_aggregate(log_path, persist=True, now=None) -> OverrideAggregate
+analyse_overrides(log_path, threshold=3, now=None, persist=True) -> list[dict]
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from collections import Counter
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
+
+# Allow sibling import when run as a script.
+_scripts_dir = Path(__file__).resolve().parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+import override_logger  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
+# Trailing windows (in days, counting today) reported for override counts.
+OVERRIDE_WINDOWS_DAYS = (7, 30)
+
+# Bump when the checkpoint layout changes; older checkpoints are rebuilt.
+CHECKPOINT_FORMAT_VERSION = 1
+
+# Bytes just before the checkpointed offset, kept to detect a truncated or
+# replaced log that has since grown past the old offset.
+_TAIL_BYTES = 64
+
 
 def analyse_team(team: dict) -> list[dict]:
     """Produce coaching signals for a single team status dict.
@@ -111,9 +139,169 @@ def analyse_fleet(
     return result
 
 
+def checkpoint_path(log_path: Path) -> Path:
+    """Where the override aggregate for ``log_path`` is persisted."""
+    return log_path.with_name(log_path.name + ".checkpoint.json")
+
+
+def _entry_day(entry: dict) -> str | None:
+    """UTC calendar day (``YYYY-MM-DD``) of an entry's timestamp, if parseable."""
+    try:
+        stamp = datetime.fromisoformat(str(entry["timestamp"]))
+    except (KeyError, ValueError):
+        return None
+    if stamp.tzinfo is not None:
+        stamp = stamp.astimezone(timezone.utc)
+    return stamp.date().isoformat()
+
+
+@dataclass
+class OverrideAggregate:
+    """Per-agent override counters up to ``offset`` bytes of the log.
+
+    Each agent entry holds a lifetime ``count``, the ``teams`` it was added
+    to and ``days`` — counts per UTC day, pruned to the longest window in
+    ``OVERRIDE_WINDOWS_DAYS`` so the checkpoint stays small.
+    """
+
+    offset: int = 0
+    tail: str = ""
+    malformed: int = 0
+    agents: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def add(self, entry: dict) -> None:
+        agent = entry.get("agent", "")
+        if not agent:
+            return
+        stats = self.agents.setdefault(agent, {"count": 0, "teams": [], "days": {}})
+        stats["count"] += 1
+        team = entry.get("team", "")
+        if team not in stats["teams"]:
+            stats["teams"].append(team)
+            stats["teams"].sort()
+        day = _entry_day(entry)
+        if day is not None:
+            stats["days"][day] = stats["days"].get(day, 0) + 1
+
+    def prune(self, now: datetime) -> None:
+        cutoff = (now.date() - timedelta(days=max(OVERRIDE_WINDOWS_DAYS))).isoformat()
+        for stats in self.agents.values():
+            stats["days"] = {d: n for d, n in stats["days"].items() if d > cutoff}
+
+    def window_counts(self, agent: str, now: datetime) -> dict[str, int]:
+        """Overrides of ``agent`` in each trailing window, keyed ``last_<N>_days``."""
+        days = self.agents.get(agent, {}).get("days", {})
+        counts = {}
+        for window in OVERRIDE_WINDOWS_DAYS:
+            cutoff = (now.date() - timedelta(days=window)).isoformat()
+            counts[f"last_{window}_days"] = sum(n for d, n in days.items() if d > cutoff)
+        return counts
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "format": CHECKPOINT_FORMAT_VERSION,
+            "offset": self.offset,
+            "tail": self.tail,
+            "malformed": self.malformed,
+            "agents": self.agents,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "OverrideAggregate":
+        return cls(
+            offset=int(data["offset"]),
+            tail=str(data["tail"]),
+            malformed=int(data["malformed"]),
+            agents=dict(data["agents"]),
+        )
+
+
+def _read_tail(log_path: Path, offset: int) -> str:
+    start = max(0, offset - _TAIL_BYTES)
+    with log_path.open("rb") as fh:
+        fh.seek(start)
+        return fh.read(offset - start).hex()
+
+
+def _load_checkpoint(log_path: Path) -> OverrideAggregate | None:
+    """The persisted aggregate if it still describes a prefix of the log."""
+    try:
+        data = json.loads(checkpoint_path(log_path).read_text())
+        if data.get("format") != CHECKPOINT_FORMAT_VERSION:
+            return None
+        aggregate = OverrideAggregate.from_dict(data)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if aggregate.offset > log_path.stat().st_size:
+        return None
+    if _read_tail(log_path, aggregate.offset) != aggregate.tail:
+        return None
+    return aggregate
+
+
+def _write_checkpoint(log_path: Path, aggregate: OverrideAggregate) -> None:
+    path = checkpoint_path(log_path)
+    try:
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(aggregate.to_dict(), indent=2, sort_keys=True) + "\n")
+        tmp.replace(path)
+    except OSError as exc:
+        logger.debug(
+            "Could not persist override checkpoint",
+            extra={"checkpoint": str(path), "error": str(exc)},
+        )
+
+
+def update_override_aggregate(
+    log_path: Path,
+    persist: bool = True,
+    now: datetime | None = None,
+) -> OverrideAggregate:
+    """Fold lines appended since the last checkpoint into the aggregate.
+
+    Resumes from the checkpoint beside the log when it is present, current
+    and still matches the log's bytes at its offset; otherwise (first run,
+    format change, truncated or rotated log) rebuilds from the start. With
+    ``persist`` the updated aggregate is written back atomically.
+    """
+    now = now or datetime.now(timezone.utc)
+    if not log_path.exists():
+        return OverrideAggregate()
+    aggregate = _load_checkpoint(log_path)
+    resumed = aggregate is not None
+    if aggregate is None:
+        aggregate = OverrideAggregate()
+    start = aggregate.offset
+    new_lines = 0
+    for offset, entry in override_logger.scan_overrides(log_path, aggregate.offset):
+        aggregate.offset = offset
+        new_lines += 1
+        if not isinstance(entry, dict):
+            aggregate.malformed += 1
+            continue
+        aggregate.add(entry)
+    aggregate.prune(now)
+    logger.info(
+        "Override aggregate updated",
+        extra={
+            "log_path": str(log_path),
+            "resumed": resumed,
+            "from_offset": start,
+            "to_offset": aggregate.offset,
+            "new_lines": new_lines,
+        },
+    )
+    if persist and (new_lines or not resumed):
+        aggregate.tail = _read_tail(log_path, aggregate.offset)
+        _write_checkpoint(log_path, aggregate)
+    return aggregate
+
+
 def analyse_overrides(
     log_path: Path,
     threshold: int = 3,
+    now: datetime | None = None,
+    persist: bool = True,
 ) -> list[dict]:
     """Detect frequently overridden agents from the override log.
 
@@ -123,11 +311,16 @@ def analyse_overrides(
         Path to ``overrides.jsonl`` (append-only JSONL file).
     threshold:
         Minimum number of overrides to trigger a signal.
+    now:
+        Reference time for the trailing windows (default: current UTC time).
+    persist:
+        Write the updated aggregate checkpoint beside the log.
 
     Returns
     -------
     list[dict]
-        Coaching signals for frequently overridden agents.
+        Coaching signals for frequently overridden agents, each carrying
+        ``last_7_days``/``last_30_days`` counts alongside the lifetime count.
     """
     logger.info(
         "Analysing override log",
@@ -136,47 +329,34 @@ def analyse_overrides(
     if not log_path.exists():
         return []
 
-    counter: Counter[str] = Counter()
-    teams_for_agent: dict[str, set[str]] = {}
-    malformed = 0
-
-    for line in log_path.read_text().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            logger.warning(
-                "Skipping malformed override log line",
-                extra={"log_path": str(log_path)},
-            )
-            malformed += 1
-            continue
-        agent = entry.get("agent", "")
-        team = entry.get("team", "")
-        if agent:
-            counter[agent] += 1
-            teams_for_agent.setdefault(agent, set()).add(team)
+    now = now or datetime.now(timezone.utc)
+    aggregate = update_override_aggregate(log_path, persist=persist, now=now)
 
     signals: list[dict] = []
-    for agent, count in counter.items():
+    for agent, stats in aggregate.agents.items():
+        count = stats["count"]
         if count >= threshold:
             logger.info(
                 "Override threshold crossed",
                 extra={"agent": agent, "count": count, "threshold": threshold},
             )
-            team_names = ", ".join(sorted(teams_for_agent.get(agent, set())))
+            team_names = ", ".join(stats["teams"])
+            windows = aggregate.window_counts(agent, now)
+            recent = ", ".join(
+                f"{windows[f'last_{w}_days']} in the last {w} days"
+                for w in OVERRIDE_WINDOWS_DAYS
+            )
             signals.append({
                 "type": "frequent_override",
                 "tier": "informational",
                 "agent": agent,
                 "count": count,
+                **windows,
                 "teams": team_names,
                 "message": (
                     f"{agent} has been added via team_extend {count} times "
-                    f"(on teams: {team_names}) — consider promoting to "
-                    "a standing team member"
+                    f"({recent}; on teams: {team_names}) — consider "
+                    "promoting to a standing team member"
                 ),
             })
 
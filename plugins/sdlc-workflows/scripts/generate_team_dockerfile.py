@@ -12,6 +12,13 @@ Reads a team manifest YAML, resolves plugin install paths via
 6. Copies local agents/skills from the project.
 7. Makes plugins read-only (``chmod -R a-w``).
 8. Bakes in the generated team ``CLAUDE.md``.
+
+The default ``per-file`` layout emits one ``COPY --from=plugin-source`` per
+plugin, agent and skill, i.e. one image layer each.  The ``grouped`` and
+``consolidated`` layouts first stage the selected plugin files in
+``FROM scratch`` stages and copy them into the runtime image as three
+layers (metadata, skills, agents — least to most frequently changed) or as
+a single layer.  An agent tweak then only invalidates the last layer.
 """
 
 from __future__ import annotations
@@ -29,6 +36,7 @@ if str(_scripts_dir) not in sys.path:
     sys.path.insert(0, str(_scripts_dir))
 
 import resolve_plugin_paths  # noqa: E402
+import team_inventory  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +48,8 @@ _IMAGE_PLUGINS_ROOT = "/home/sdlc/.claude/plugins"
 _IMAGE_CACHE_PREFIX = f"{_IMAGE_PLUGINS_ROOT}/cache"
 _IMAGE_WORKSPACE = "/workspace"
 
+LAYOUTS: tuple[str, ...] = ("per-file", "grouped", "consolidated")
+
 
 # ---------------------------------------------------------------------------
 # Helper functions
@@ -77,11 +87,10 @@ def find_agent_file(plugin_path: Path, agent_name: str) -> Path | None:
     if candidate.exists():
         return candidate
 
-    # Case-insensitive fallback
-    lower_name = f"{agent_name}.md".lower()
-    for child in agents_dir.iterdir():
-        if child.name.lower() == lower_name and child.is_file():
-            return child
+    # Case-insensitive fallback via the cached plugin inventory
+    found = team_inventory.load_plugin_inventory(plugin_path).agent_file(agent_name)
+    if found is not None:
+        return found
 
     logger.info(
         "Agent file not found in plugin",
@@ -117,12 +126,10 @@ def find_skill_dir(plugin_path: Path, skill_name: str) -> Path | None:
     if candidate.is_dir() and (candidate / "SKILL.md").exists():
         return candidate
 
-    # Case-insensitive fallback
-    lower_name = skill_name.lower()
-    for child in skills_dir.iterdir():
-        if child.name.lower() == lower_name and child.is_dir():
-            if (child / "SKILL.md").exists():
-                return child
+    # Case-insensitive fallback via the cached plugin inventory
+    found = team_inventory.load_plugin_inventory(plugin_path).skill_dir(skill_name)
+    if found is not None:
+        return found
 
     logger.info(
         "Skill dir not found in plugin",
@@ -242,14 +249,14 @@ def generate_container_installed_json(
     This function rewrites every ``installPath`` so that scripts running
     inside the container can resolve plugin directories.
     """
+    import copy
     import json
 
     logger.info(
         "Rewriting installed_plugins.json for container",
         extra={"source": str(installed_json), "output": str(output_path)},
     )
-    with installed_json.open() as fh:
-        raw = json.load(fh)
+    raw = copy.deepcopy(resolve_plugin_paths.PluginRegistry.for_path(installed_json).raw)
 
     def _rewrite(path_str: str) -> str:
         return _host_to_image_rel(Path(path_str), plugins_root)
@@ -275,11 +282,90 @@ def generate_container_installed_json(
     output_path.write_text(json.dumps(raw, indent=2) + "\n")
 
 
+def _copy_from(stage: str, image_path: str) -> list[str]:
+    """Two-line ``COPY --from=<stage>`` of *image_path* onto itself."""
+    return [f"COPY --from={stage} {image_path} \\", f"     {image_path}"]
+
+
+def _per_file_copies(
+    metadata: list[tuple[str | None, str | None]],
+    agents: list[tuple[str | None, str | None]],
+    skills: list[tuple[str | None, str | None]],
+) -> list[str]:
+    """One ``COPY --from=plugin-source`` (and image layer) per item."""
+    lines: list[str] = []
+    for comment, image_path in metadata:
+        lines.append(str(comment))
+        lines.extend(_copy_from("plugin-source", str(image_path)))
+        lines.append("")
+    for header, copies in (
+        ("# Agents (additive copy — only listed files)", agents),
+        ("# Skills (additive copy — only listed directories)", skills),
+    ):
+        if not copies:
+            continue
+        lines.append(header)
+        for comment, image_path in copies:
+            if image_path is None:
+                lines.append(str(comment))
+            else:
+                lines.extend(_copy_from("plugin-source", image_path))
+        lines.append("")
+    return lines
+
+
+def _staged_copies(
+    layout: str,
+    metadata: list[tuple[str | None, str | None]],
+    skills: list[tuple[str | None, str | None]],
+    agents: list[tuple[str | None, str | None]],
+) -> list[str]:
+    """Stage plugin files in scratch stages, then copy them in few layers.
+
+    Groups are given least- to most-frequently changed.  ``grouped`` keeps
+    one stage (and one runtime layer) per non-empty group; ``consolidated``
+    stages everything together and adds a single runtime layer.
+    """
+    groups = [("metadata", metadata), ("skills", skills), ("agents", agents)]
+    if layout == "consolidated":
+        groups = [("plugins", [item for _, items in groups for item in items])]
+
+    lines: list[str] = []
+    stages: list[str] = []
+    for group, items in groups:
+        if not items:
+            continue
+        lines.append("")
+        if any(path is not None for _, path in items):
+            stage = f"stage-{group}"
+            stages.append(stage)
+            lines.append(f"FROM scratch AS {stage}")
+        for comment, image_path in items:
+            if image_path is None:
+                lines.append(str(comment))
+            else:
+                lines.extend(_copy_from("plugin-source", image_path))
+    lines.append("")
+    lines.append("FROM sdlc-worker:base")
+    lines.append("")
+    if stages:
+        lines.append(
+            "# Plugin files (staged; least- to most-frequently changed)"
+        )
+        for stage in stages:
+            lines.append(
+                f"COPY --from={stage} {_IMAGE_PLUGINS_ROOT}/ {_IMAGE_PLUGINS_ROOT}/"
+            )
+        lines.append("")
+    return lines
+
+
 def generate(
     manifest_path: Path,
     installed_json: Path,
     team_claude_md_path: Path,
     output_path: Path,
+    layout: str = "per-file",
 ) -> str:
     """Generate a Dockerfile for a team image from a manifest.
 
@@ -293,12 +379,18 @@ def generate(
         Path to the pre-generated team ``CLAUDE.md`` file.
     output_path:
         Where to write the generated Dockerfile.
+    layout:
+        ``"per-file"`` (one layer per copied item), ``"grouped"`` (one layer
+        each for plugin metadata, skills and agents) or ``"consolidated"``
+        (a single layer for all plugin files).
 
     Returns
     -------
     str
         The generated Dockerfile content.
     """
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown Dockerfile layout {layout!r}; expected one of {LAYOUTS}")
     with manifest_path.open() as fh:
         manifest: dict[str, object] = yaml.safe_load(fh)
 
@@ -323,80 +415,67 @@ def generate(
     plugin_paths = resolve_plugin_paths.resolve_all(plugin_keys, installed_json)
     plugins_root = _infer_plugins_root(plugin_paths)
 
-    lines: list[str] = []
-    lines.append(f"# Auto-generated Dockerfile for team: {team_name}")
-    lines.append("# DO NOT EDIT — regenerate with generate_team_dockerfile.py")
-    lines.append("")
-    lines.append("FROM sdlc-worker:full AS plugin-source")
-    lines.append("FROM sdlc-worker:base")
-    lines.append("")
-
-    # -- Plugin metadata (.claude-plugin/ directories) -------------------------
+    # -- Collect plugin-source copies ---------------------------------------
+    # Each entry is (comment or None, image path); a None path is a warning
+    # comment for an unresolved agent/skill.
+    metadata_copies: list[tuple[str | None, str | None]] = []
     for plugin_key in plugin_keys:
         plugin_path = plugin_paths[plugin_key]
         image_base = _image_path_for_plugin(plugin_path, plugins_root)
         short_name = plugin_key.split("@")[0] if "@" in plugin_key else plugin_key
-
-        lines.append(f"# Plugin: {short_name} — plugin metadata")
-        lines.append(
-            f"COPY --from=plugin-source {image_base}/.claude-plugin/ \\"
+        metadata_copies.append(
+            (f"# Plugin: {short_name} — plugin metadata", f"{image_base}/.claude-plugin/")
         )
-        lines.append(f"     {image_base}/.claude-plugin/")
-        lines.append("")
 
-    # -- Agents (additive copy — only listed files) ----------------------------
-    plugin_agents: list[tuple[str, str]] = []
+    agent_copies: list[tuple[str | None, str | None]] = []
     local_agents: list[str] = []
-
     for agent_ref in agent_refs:
         if agent_ref.startswith("local:"):
             local_agents.append(agent_ref.removeprefix("local:"))
-        else:
-            parts = agent_ref.rsplit(":", 1)
-            if len(parts) == 2:
-                plugin_agents.append((parts[0], parts[1]))
-
-    if plugin_agents:
-        lines.append("# Agents (additive copy — only listed files)")
-        for plugin_key, agent_name in plugin_agents:
-            plugin_path = plugin_paths[plugin_key]
-            agent_file = find_agent_file(plugin_path, agent_name)
-            if agent_file is None:
-                lines.append(
-                    f"# WARNING: agent '{agent_name}' not found in {plugin_key}"
-                )
-                continue
-            image_agent = _host_to_image_rel(agent_file, plugins_root)
-            lines.append(f"COPY --from=plugin-source {image_agent} \\")
-            lines.append(f"     {image_agent}")
-        lines.append("")
-
-    # -- Skills (additive copy — only listed directories) ----------------------
-    plugin_skills: list[tuple[str, str]] = []
+            continue
+        parts = agent_ref.rsplit(":", 1)
+        if len(parts) != 2:
+            continue
+        plugin_key, agent_name = parts
+        agent_file = find_agent_file(plugin_paths[plugin_key], agent_name)
+        if agent_file is None:
+            agent_copies.append(
+                (f"# WARNING: agent '{agent_name}' not found in {plugin_key}", None)
+            )
+            continue
+        agent_copies.append((None, _host_to_image_rel(agent_file, plugins_root)))
+
+    skill_copies: list[tuple[str | None, str | None]] = []
     local_skills: list[str] = []
-
     for skill_ref in skill_refs:
         if skill_ref.startswith("local:"):
             local_skills.append(skill_ref.removeprefix("local:"))
-        else:
-            parts = skill_ref.rsplit(":", 1)
-            if len(parts) == 2:
-                plugin_skills.append((parts[0], parts[1]))
-
-    if plugin_skills:
-        lines.append("# Skills (additive copy — only listed directories)")
-        for plugin_key, skill_name in plugin_skills:
-            plugin_path = plugin_paths[plugin_key]
-            skill_dir = find_skill_dir(plugin_path, skill_name)
-            if skill_dir is None:
-                lines.append(
-                    f"# WARNING: skill '{skill_name}' not found in {plugin_key}"
-                )
-                continue
-            image_skill = _host_to_image_rel(skill_dir, plugins_root)
-            lines.append(f"COPY --from=plugin-source {image_skill}/ \\")
-            lines.append(f"     {image_skill}/")
+            continue
+        parts = skill_ref.rsplit(":", 1)
+        if len(parts) != 2:
+            continue
+        plugin_key, skill_name = parts
+        skill_dir = find_skill_dir(plugin_paths[plugin_key], skill_name)
+        if skill_dir is None:
+            skill_copies.append(
+                (f"# WARNING: skill '{skill_name}' not found in {plugin_key}", None)
+            )
+            continue
+        skill_copies.append((None, _host_to_image_rel(skill_dir, plugins_root) + "/"))
+
+    lines: list[str] = []
+    lines.append(f"# Auto-generated Dockerfile for team: {team_name}")
+    lines.append("# DO NOT EDIT — regenerate with generate_team_dockerfile.py")
+    lines.append("")
+    lines.append("FROM sdlc-worker:full AS plugin-source")
+    if layout == "per-file":
+        lines.append("FROM sdlc-worker:base")
         lines.append("")
+        lines.extend(_per_file_copies(metadata_copies, agent_copies, skill_copies))
+    else:
+        lines.extend(
+            _staged_copies(layout, metadata_copies, skill_copies, agent_copies)
+        )
 
     # -- Local agents and skills (from project, not from plugin-source) --------
     if local_agents:
@@ -507,6 +586,12 @@ def main() -> None:
         required=True,
         help="Output path for the generated Dockerfile.",
     )
+    parser.add_argument(
+        "--layout",
+        choices=LAYOUTS,
+        default="per-file",
+        help="Layer layout for plugin files (default: per-file).",
+    )
 
     args = parser.parse_args()
 
@@ -526,6 +611,7 @@ def main() -> None:
         installed_json=args.installed_plugins,
         team_claude_md_path=args.team_claude_md,
         output_path=args.output,
+        layout=args.layout,
     )
 
     print(f"Generated Dockerfile: {args.output}")
@@ -5,9 +5,16 @@ Each workflow run that uses ``team_extend`` logs one entry per extended
 agent.  The coaching signals module reads this log to detect frequently
 overridden agents that should be promoted to standing team members.
 
+The log is read as a stream rather than loaded whole: ``iter_overrides``
+yields each entry with the byte offset just past it, so a consumer can
+checkpoint that offset and later resume from it, processing only lines
+appended since.
+
 Public API
 ----------
 log_override(log_path, team, agent, workflow, node) -> None
+scan_overrides(log_path, offset=0) -> Iterator[tuple[int, dict | None]]
+iter_overrides(log_path, offset=0) -> Iterator[tuple[int, dict]]
 read_overrides(log_path) -> list[dict]
 """
 
@@ -17,6 +24,7 @@ import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +64,53 @@ def log_override(
         fh.write(json.dumps(entry) + "\n")
 
 
+def scan_overrides(log_path: Path, offset: int = 0) -> Iterator[tuple[int, dict | None]]:
+    """Yield ``(next_offset, entry)`` per line from ``offset``; None if malformed.
+
+    Malformed lines are still yielded (as None) so checkpointing callers
+    can advance past them and count them.  Reads in binary so offsets are
+    exact byte positions.  A final line with no newline that does not parse
+    is an append still in flight: it is neither yielded nor consumed, so a
+    resumed scan picks it up whole.
+    """
+    with log_path.open("rb") as fh:
+        fh.seek(offset)
+        for raw in fh:
+            line = raw.strip()
+            if not line:
+                offset += len(raw)
+                continue
+            try:
+                entry = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                if not raw.endswith(b"\n"):
+                    return
+                offset += len(raw)
+                logger.warning(
+                    "Skipping malformed override log entry",
+                    extra={"log_path": str(log_path)},
+                )
+                yield offset, None
+                continue
+            offset += len(raw)
+            yield offset, entry
+
+
+def iter_overrides(log_path: Path, offset: int = 0) -> Iterator[tuple[int, dict]]:
+    """Stream override entries starting at byte ``offset``.
+
+    Yields ``(next_offset, entry)`` pairs, one line in memory at a time;
+    ``next_offset`` is where a later call should resume to see only newer
+    entries. Malformed lines are logged and skipped. Yields nothing if the
+    file doesn't exist.
+    """
+    if not log_path.exists():
+        return
+    for next_offset, entry in scan_overrides(log_path, offset):
+        if entry is not None:
+            yield next_offset, entry
+
+
 def read_overrides(log_path: Path) -> list[dict]:
     """Read all override entries from the JSONL log.
 
@@ -67,19 +122,11 @@ def read_overrides(log_path: Path) -> list[dict]:
 
     entries: list[dict] = []
     malformed = 0
-    for line in log_path.read_text().splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            entries.append(json.loads(line))
-        except json.JSONDecodeError:
-            logger.warning(
-                "Skipping malformed override log entry",
-                extra={"log_path": str(log_path)},
-            )
+    for _, entry in scan_overrides(log_path):
+        if entry is None:
             malformed += 1
-            continue
+        else:
+            entries.append(entry)
     logger.info(
         "Override log read complete",
         extra={"log_path": str(log_path), "entries": len(entries), "malformed": malformed},
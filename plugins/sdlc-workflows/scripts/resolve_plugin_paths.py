@@ -15,13 +15,19 @@ resolve(plugin_name, installed_json) -> Path | None
 
 resolve_all(plugin_names, installed_json) -> dict[str, Path]
     Bulk lookup.  Raises ``PluginNotFoundError`` if any are missing.
+
+PluginRegistry.for_path(installed_json) -> PluginRegistry
+    Process-wide parsed view of ``installed_plugins.json``, reloaded only
+    when the file's mtime or size changes.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import threading
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -41,8 +47,8 @@ class PluginNotFoundError(Exception):
         super().__init__(f"Plugins not found in installed_plugins.json: {names}")
 
 
-def _load_installed(installed_json: Path) -> dict[str, list[dict[str, str]]]:
-    """Load installed_plugins.json and return the plugins mapping.
+def _normalise(raw: Any) -> dict[str, list[dict[str, str]]]:
+    """Return the plugins mapping of a decoded installed_plugins.json.
 
     The file has two known formats:
     - v2 (current): ``{"version": 2, "plugins": {"name@marketplace": [{"scope": ..., "installPath": ...}]}}``
@@ -50,15 +56,13 @@ def _load_installed(installed_json: Path) -> dict[str, list[dict[str, str]]]:
 
     Returns a normalised dict: ``key -> [{"installPath": ...}]``
     """
-    with installed_json.open() as fh:
-        raw = json.load(fh)
-
+    source = raw
     if isinstance(raw, dict) and "version" in raw and "plugins" in raw:
-        return raw["plugins"]
+        source = raw["plugins"]
 
-    # Legacy / test format: flat dict of key -> entry_dict
+    # v2 values are lists; legacy / test values are a single entry dict
     result: dict[str, list[dict[str, str]]] = {}
-    for key, val in raw.items():
+    for key, val in source.items():
         if isinstance(val, dict):
             result[key] = [val]
         elif isinstance(val, list):
@@ -77,7 +81,7 @@ def _build_name_lookup(
     """
     lookup: dict[str, Path] = {}
     for key, entries in plugins.items():
-        bare_name = key.split("@")[0] if "@" in key else key
+        bare_name = _bare(key)
         if bare_name in lookup:
             continue
         for entry in entries if isinstance(entries, list) else [entries]:
@@ -88,6 +92,97 @@ def _build_name_lookup(
     return lookup
 
 
+def _bare(plugin_name: str) -> str:
+    """Return the part of *plugin_name* before ``@``."""
+    return plugin_name.split("@")[0] if "@" in plugin_name else plugin_name
+
+
+class PluginRegistry:
+    """Parsed ``installed_plugins.json`` with precomputed lookups.
+
+    Obtain instances through :meth:`for_path`, which keeps one registry per
+    file for the life of the process and reloads it only when the file's
+    ``(mtime_ns, size)`` signature changes.  Fleet-wide operations resolving
+    hundreds of plugin refs therefore parse the JSON once.
+
+    Attributes
+    ----------
+    raw : Any
+        The decoded JSON document, as stored on disk.  Treat as read-only.
+    plugins : dict[str, list[dict[str, str]]]
+        Normalised ``key -> [entry, ...]`` mapping (see ``_normalise``).
+    by_key : dict[str, Path]
+        Full key (``name@marketplace``) -> first valid install path.
+    by_bare_name : dict[str, Path]
+        Bare name -> install path; the first key with a valid path wins.
+    """
+
+    _registries: dict[Path, PluginRegistry] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, installed_json: Path, raw: Any, signature: tuple[int, int]) -> None:
+        self.path = installed_json
+        self.signature = signature
+        self.raw = raw
+        self.plugins = _normalise(raw)
+        self.by_bare_name = _build_name_lookup(self.plugins)
+        self.by_key: dict[str, Path] = {}
+        for key, entries in self.plugins.items():
+            for entry in entries:
+                install_path = entry.get("installPath")
+                if install_path:
+                    self.by_key[key] = Path(install_path)
+                    break
+
+    @classmethod
+    def load(cls, installed_json: Path) -> PluginRegistry:
+        """Read *installed_json* from disk, bypassing the process cache."""
+        stat = installed_json.stat()
+        with installed_json.open() as fh:
+            raw = json.load(fh)
+        return cls(installed_json, raw, (stat.st_mtime_ns, stat.st_size))
+
+    @classmethod
+    def for_path(cls, installed_json: Path) -> PluginRegistry:
+        """Return the shared registry for *installed_json*, reloading if stale."""
+        key = Path(installed_json).resolve()
+        stat = key.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with cls._lock:
+            registry = cls._registries.get(key)
+            if registry is not None and registry.signature == signature:
+                return registry
+        logger.debug(
+            "Loading installed_plugins.json",
+            extra={"installed_json": str(key), "reload": registry is not None},
+        )
+        registry = cls.load(key)
+        with cls._lock:
+            cls._registries[key] = registry
+        return registry
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every cached registry (mainly for tests)."""
+        with cls._lock:
+            cls._registries.clear()
+
+    def lookup(self, plugin_name: str) -> Path | None:
+        """Install path for a bare name or ``name@marketplace`` key.
+
+        An exact full-key match wins; otherwise the bare name is used, so
+        ``sdlc-core@other`` still finds ``sdlc-core@ai-first-sdlc``.
+        """
+        exact = self.by_key.get(plugin_name)
+        if exact is not None:
+            return exact
+        return self.by_bare_name.get(_bare(plugin_name))
+
+    def first_entries(self) -> dict[str, dict[str, str]]:
+        """Return ``key -> first entry`` for every key with at least one entry."""
+        return {key: entries[0] for key, entries in self.plugins.items() if entries}
+
+
 def resolve(plugin_name: str, installed_json: Path) -> Path | None:
     """Resolve a plugin name to its install path.
 
@@ -108,12 +203,7 @@ def resolve(plugin_name: str, installed_json: Path) -> Path | None:
         "Resolving plugin path",
         extra={"plugin_name": plugin_name, "installed_json": str(installed_json)},
     )
-    plugins = _load_installed(installed_json)
-    lookup = _build_name_lookup(plugins)
-
-    # Try bare name first, then full key
-    bare = plugin_name.split("@")[0] if "@" in plugin_name else plugin_name
-    return lookup.get(bare)
+    return PluginRegistry.for_path(installed_json).lookup(plugin_name)
 
 
 def resolve_all(
@@ -147,16 +237,15 @@ def resolve_all(
         "Resolving plugin paths (bulk)",
         extra={"plugin_count": len(plugin_names), "installed_json": str(installed_json)},
     )
-    plugins = _load_installed(installed_json)
-    lookup = _build_name_lookup(plugins)
+    registry = PluginRegistry.for_path(installed_json)
 
     resolved: dict[str, Path] = {}
     missing: list[str] = []
 
     for name in plugin_names:
-        bare = name.split("@")[0] if "@" in name else name
-        if bare in lookup:
-            resolved[name] = lookup[bare]
+        path = registry.lookup(name)
+        if path is not None:
+            resolved[name] = path
         else:
             missing.append(name)
 
@@ -6,8 +6,21 @@ a structured inventory.  Used by ``manage-teams`` (to show what's
 available during team creation) and ``teams-status`` (to report
 "available but not included").
 
+Walking and frontmatter parsing is done once per plugin version: the
+result is kept as a :class:`PluginInventory` index, persisted next to the
+plugins cache (``cache/.sdlc-inventory/<marketplace>/<plugin>/<version>.json``)
+and rebuilt only when the mtime of the plugin, ``agents/`` or ``skills/``
+directory, or of any file the index is built from (``agents/*.md``,
+``skills/*/SKILL.md``), changes.  Directory mtimes alone would miss
+in-place edits and ``SKILL.md`` files added to or removed from an existing
+skill directory in local plugins under active editing.  The signature is
+checked on the first lookup of a plugin in a process; later lookups are
+served from an in-process memo without touching the filesystem.
+
 Public API
 ----------
+load_plugin_inventory(plugin_path, index_dir=None) -> PluginInventory
+clear_memo() -> None
 discover_plugin_agents(plugin_path) -> list[dict]
 discover_plugin_skills(plugin_path) -> list[dict]
 discover_all(installed_json) -> dict[str, dict]
@@ -20,13 +33,18 @@ import json
 import logging
 import re
 import sys
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 # Allow sibling import when run as a script.
 _scripts_dir = Path(__file__).resolve().parent
 if str(_scripts_dir) not in sys.path:
     sys.path.insert(0, str(_scripts_dir))
 
+import resolve_plugin_paths  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 _FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
@@ -45,23 +63,227 @@ def _parse_frontmatter(text: str) -> dict[str, str]:
     return result
 
 
+INDEX_FORMAT_VERSION = 2
+_INDEX_DIRNAME = ".sdlc-inventory"
+
+_memo: dict[str, PluginInventory] = {}
+_memo_lock = threading.Lock()
+
+
+@dataclass
+class PluginInventory:
+    """Agents and skills of one plugin, with case-insensitive lookups.
+
+    Agent entries carry ``name``, ``description``, ``file`` (relative to the
+    plugin root) and the full ``frontmatter``; skill entries carry ``dir``
+    instead of ``file``.  ``signature`` holds the ``mtime_ns`` of the plugin,
+    ``agents/`` and ``skills/`` directories, then of each ``agents/*.md`` and
+    each ``skills/<dir>/SKILL.md`` in name order (``-1`` when absent).
+    """
+
+    plugin_path: Path
+    signature: list[int]
+    agents: list[dict[str, Any]] = field(default_factory=list)
+    skills: list[dict[str, Any]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._agent_files: dict[str, str] = {}
+        for entry in self.agents:
+            stem = Path(entry["file"]).stem
+            self._agent_files.setdefault(stem, entry["file"])
+            self._agent_files.setdefault(stem.lower(), entry["file"])
+        self._skill_dirs: dict[str, str] = {}
+        for entry in self.skills:
+            dirname = Path(entry["dir"]).name
+            self._skill_dirs.setdefault(dirname, entry["dir"])
+            self._skill_dirs.setdefault(dirname.lower(), entry["dir"])
+
+    def agent_file(self, agent_name: str) -> Path | None:
+        """Path of ``agents/<agent_name>.md``, matching case-insensitively."""
+        rel = self._agent_files.get(agent_name) or self._agent_files.get(agent_name.lower())
+        return self.plugin_path / rel if rel else None
+
+    def skill_dir(self, skill_name: str) -> Path | None:
+        """Path of ``skills/<skill_name>/``, matching case-insensitively."""
+        rel = self._skill_dirs.get(skill_name) or self._skill_dirs.get(skill_name.lower())
+        return self.plugin_path / rel if rel else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise to the on-disk index format."""
+        return {
+            "format_version": INDEX_FORMAT_VERSION,
+            "plugin_path": str(self.plugin_path),
+            "signature": self.signature,
+            "agents": self.agents,
+            "skills": self.skills,
+        }
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _signature(plugin_path: Path) -> list[int]:
+    agents_dir = plugin_path / "agents"
+    skills_dir = plugin_path / "skills"
+    signature = [_mtime_ns(plugin_path), _mtime_ns(agents_dir), _mtime_ns(skills_dir)]
+    if agents_dir.is_dir():
+        signature += [_mtime_ns(f) for f in sorted(agents_dir.glob("*.md"))]
+    if skills_dir.is_dir():
+        signature += [
+            _mtime_ns(child / "SKILL.md")
+            for child in sorted(skills_dir.iterdir())
+            if child.is_dir()
+        ]
+    return signature
+
+
+def _default_index_dir(plugin_path: Path) -> Path | None:
+    """Index directory for a ``cache/<marketplace>/<plugin>/<version>`` path.
+
+    Returns ``None`` for plugins outside the plugins cache layout, which are
+    then indexed in memory only.
+    """
+    parents = plugin_path.parents
+    if len(parents) < 3 or parents[2].name != "cache":
+        return None
+    return parents[2] / _INDEX_DIRNAME
+
+
+def _index_file(plugin_path: Path, index_dir: Path) -> Path:
+    version = plugin_path.name
+    plugin = plugin_path.parent.name
+    marketplace = plugin_path.parent.parent.name
+    return index_dir / marketplace / plugin / f"{version}.json"
+
+
+def _scan_plugin(plugin_path: Path, signature: list[int]) -> PluginInventory:
+    """Walk ``agents/`` and ``skills/`` and parse every frontmatter block."""
+    agents: list[dict[str, Any]] = []
+    agents_dir = plugin_path / "agents"
+    if agents_dir.is_dir():
+        for md_file in sorted(agents_dir.glob("*.md")):
+            fm = _parse_frontmatter(md_file.read_text())
+            agents.append({
+                "name": fm.get("name", md_file.stem),
+                "description": fm.get("description", ""),
+                "file": f"agents/{md_file.name}",
+                "frontmatter": fm,
+            })
+
+    skills: list[dict[str, Any]] = []
+    skills_dir = plugin_path / "skills"
+    if skills_dir.is_dir():
+        for child in sorted(skills_dir.iterdir()):
+            skill_md = child / "SKILL.md"
+            if child.is_dir() and skill_md.exists():
+                fm = _parse_frontmatter(skill_md.read_text())
+                skills.append({
+                    "name": fm.get("name", child.name),
+                    "description": fm.get("description", ""),
+                    "dir": f"skills/{child.name}",
+                    "frontmatter": fm,
+                })
+    return PluginInventory(plugin_path, signature, agents, skills)
+
+
+def _read_index(path: Path, plugin_path: Path, signature: list[int]) -> PluginInventory | None:
+    """Load a persisted index; ``None`` if missing, unreadable or stale."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("format_version") != INDEX_FORMAT_VERSION
+        or data.get("plugin_path") != str(plugin_path)
+        or data.get("signature") != signature
+    ):
+        return None
+    try:
+        return PluginInventory(plugin_path, signature, list(data["agents"]), list(data["skills"]))
+    except (KeyError, TypeError, AttributeError) as exc:
+        logger.debug(
+            "Ignoring malformed plugin inventory index",
+            extra={"index_file": str(path), "error": repr(exc)},
+        )
+        return None
+
+
+def _write_index(inventory: PluginInventory, path: Path) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(inventory.to_dict(), indent=2, sort_keys=True) + "\n")
+        tmp.replace(path)
+    except OSError as exc:
+        logger.debug(
+            "Could not persist plugin inventory index",
+            extra={"index_file": str(path), "error": str(exc)},
+        )
+
+
+def load_plugin_inventory(
+    plugin_path: Path,
+    index_dir: Path | None = None,
+) -> PluginInventory:
+    """Return the agent/skill inventory of *plugin_path*.
+
+    Served from an in-process memo (the signature is computed only on the
+    first lookup of *plugin_path* in a process), then from the persisted
+    index under *index_dir* (default: ``.sdlc-inventory`` beside the plugins
+    cache), and only rebuilt from the Markdown files when the signature
+    (directory and source-file mtimes) has changed.
+    """
+    memo_key = str(plugin_path)
+    with _memo_lock:
+        cached = _memo.get(memo_key)
+    if cached is not None:
+        return cached
+
+    signature = _signature(plugin_path)
+
+    if index_dir is None:
+        index_dir = _default_index_dir(plugin_path)
+    index_file = _index_file(plugin_path, index_dir) if index_dir is not None else None
+
+    inventory = None
+    if index_file is not None:
+        inventory = _read_index(index_file, plugin_path, signature)
+    if inventory is None:
+        logger.debug(
+            "Building plugin inventory index",
+            extra={"plugin_path": str(plugin_path)},
+        )
+        inventory = _scan_plugin(plugin_path, signature)
+        if index_file is not None and signature[0] != -1:
+            _write_index(inventory, index_file)
+
+    with _memo_lock:
+        _memo[memo_key] = inventory
+    return inventory
+
+
+def clear_memo() -> None:
+    """Drop every memoised inventory so the next lookup re-checks the signature (mainly for tests)."""
+    with _memo_lock:
+        _memo.clear()
+
+
 def discover_plugin_agents(plugin_path: Path) -> list[dict[str, str]]:
     """Discover agents in a plugin's ``agents/`` directory.
 
     Returns a list of dicts with ``name`` and ``description`` keys.
     """
     logger.debug("Discovering agents", extra={"plugin_path": str(plugin_path)})
-    agents_dir = plugin_path / "agents"
-    if not agents_dir.is_dir():
-        return []
-
-    agents: list[dict[str, str]] = []
-    for md_file in sorted(agents_dir.glob("*.md")):
-        text = md_file.read_text()
-        fm = _parse_frontmatter(text)
-        name = fm.get("name", md_file.stem)
-        description = fm.get("description", "")
-        agents.append({"name": name, "description": description})
+    inventory = load_plugin_inventory(plugin_path)
+    agents = [
+        {"name": entry["name"], "description": entry["description"]}
+        for entry in inventory.agents
+    ]
     logger.debug(
         "Plugin agent discovery complete",
         extra={"plugin_path": str(plugin_path), "count": len(agents)},
@@ -76,19 +298,11 @@ def discover_plugin_skills(plugin_path: Path) -> list[dict[str, str]]:
     Returns a list of dicts with ``name`` and ``description`` keys.
     """
     logger.debug("Discovering skills", extra={"plugin_path": str(plugin_path)})
-    skills_dir = plugin_path / "skills"
-    if not skills_dir.is_dir():
-        return []
-
-    skills: list[dict[str, str]] = []
-    for child in sorted(skills_dir.iterdir()):
-        skill_md = child / "SKILL.md"
-        if child.is_dir() and skill_md.exists():
-            text = skill_md.read_text()
-            fm = _parse_frontmatter(text)
-            name = fm.get("name", child.name)
-            description = fm.get("description", "")
-            skills.append({"name": name, "description": description})
+    inventory = load_plugin_inventory(plugin_path)
+    skills = [
+        {"name": entry["name"], "description": entry["description"]}
+        for entry in inventory.skills
+    ]
     logger.debug(
         "Plugin skill discovery complete",
         extra={"plugin_path": str(plugin_path), "count": len(skills)},
@@ -116,22 +330,8 @@ def discover_all(
         "Building plugin inventory",
         extra={"installed_json": str(installed_json)},
     )
-    with installed_json.open() as fh:
-        raw = json.load(fh)
-
-    entries: dict[str, dict[str, str]] = {}
-    if isinstance(raw, dict) and "version" in raw and "plugins" in raw:
-        for key, val_list in raw["plugins"].items():
-            if isinstance(val_list, list) and val_list:
-                entries[key] = val_list[0]
-            elif isinstance(val_list, dict):
-                entries[key] = val_list
-    else:
-        for key, val in raw.items():
-            if isinstance(val, dict):
-                entries[key] = val
-            elif isinstance(val, list) and val:
-                entries[key] = val[0]
+    registry = resolve_plugin_paths.PluginRegistry.for_path(installed_json)
+    entries = registry.first_entries()
 
     inventory: dict[str, dict[str, list[dict[str, str]]]] = {}
     for key, entry in entries.items():
@@ -1,28 +1,54 @@
 #!/usr/bin/env python3
 """Generate fleet status data for delegation teams.
 
-Reads team manifests from ``.archon/teams/``, checks staleness via
-timestamp comparison, maps workflow references, and assembles a
-structured report.
+Reads team manifests from ``.archon/teams/``, checks staleness, maps
+workflow references, and assembles a structured report.
+
+Staleness is content-based when ``installed_plugins.json`` is available:
+:func:`content_digest` hashes the manifest, every resolved agent file and
+skill directory, and the generated team CLAUDE.md.  The digest is stored
+as the ``sdlc.team-digest`` image label (and mirrored into the manifest's
+``image_digest`` field) at build time, and a team is stale exactly when
+the recorded digest differs from the current one.  Without a recorded
+digest the older timestamp comparison is used.
 
 Public API
 ----------
 load_manifests(teams_dir) -> list[dict]
-staleness(manifest) -> str
+content_digest(manifest, installed_json, project_root) -> str
+read_image_label(tag, key) -> str | None
+staleness(manifest, installed_json=None, ...) -> str
 workflow_usage(workflows_dir) -> dict[str, list[dict]]
 fleet_report(teams_dir, workflows_dir) -> dict
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import subprocess
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
 import yaml
 
+# Allow sibling import when run as a script.
+_scripts_dir = Path(__file__).resolve().parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+import generate_team_dockerfile  # noqa: E402
+import resolve_plugin_paths  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
+DIGEST_LABEL = "sdlc.team-digest"
+
+# Build bookkeeping, not content: changing these must not change the digest.
+_DIGEST_EXCLUDED_KEYS = frozenset({"updated", "image_built", "image_digest"})
+
 
 def load_manifests(teams_dir: Path) -> list[dict]:
     """Load all team manifest YAML files from *teams_dir*.
@@ -51,36 +77,162 @@ def load_manifests(teams_dir: Path) -> list[dict]:
     return manifests
 
 
-def _generated_claude_mtime(manifest: dict) -> str | None:
-    """Return ISO-formatted mtime of the team's generated CLAUDE.md, if any.
+def _generated_claude_path(manifest: dict) -> Path | None:
+    """Return the path of the team's generated CLAUDE.md, if it exists.
 
     The generated file lives at ``<teams_dir>/.generated/<name>-CLAUDE.md``
     and is produced by ``generate_team_claude_md.py`` during
-    ``build-team.sh``. If the project's root CLAUDE.md has been edited
-    since the last image build, the generated team CLAUDE.md will also
-    be newer — so its mtime is the right staleness input, not the
-    project root's own CLAUDE.md.
+    ``build-team.sh``.
     """
     manifest_path_str = manifest.get("_manifest_path")
     if not manifest_path_str:
         return None
-    manifest_path = Path(manifest_path_str)
     name = manifest.get("name")
     if not name:
         return None
-    generated = manifest_path.parent / ".generated" / f"{name}-CLAUDE.md"
-    if not generated.is_file():
+    generated = Path(manifest_path_str).parent / ".generated" / f"{name}-CLAUDE.md"
+    return generated if generated.is_file() else None
+
+
+def _generated_claude_mtime(manifest: dict) -> str | None:
+    """Return ISO-formatted mtime of the team's generated CLAUDE.md, if any.
+
+    If the project's root CLAUDE.md has been edited since the last image
+    build, the generated team CLAUDE.md will also be newer — so its mtime
+    is the right staleness input, not the project root's own CLAUDE.md.
+    """
+    generated = _generated_claude_path(manifest)
+    if generated is None:
         return None
     mtime = datetime.fromtimestamp(generated.stat().st_mtime, tz=timezone.utc)
     return mtime.isoformat()
 
 
-def staleness(manifest: dict) -> str:
+def _split_ref(ref: str) -> tuple[str, str] | None:
+    """Split ``plugin:name`` into its parts; ``None`` for malformed refs."""
+    parts = ref.rsplit(":", 1)
+    return (parts[0], parts[1]) if len(parts) == 2 else None
+
+
+def _plugin_identity(install_path: Path | None) -> str:
+    """Host-independent identity of a resolved plugin install.
+
+    The part of the path below the plugins ``cache/`` directory
+    (``<marketplace>/<plugin>/<version>``), or just the directory name for
+    installs outside the cache, so the digest never embeds ``$HOME`` or the
+    username and matches across checkouts and machines.
+    """
+    if install_path is None:
+        return "<missing>"
+    parts = install_path.parts
+    if "cache" in parts:
+        below = parts[len(parts) - parts[::-1].index("cache"):]
+        if below:
+            return "/".join(below)
+    return install_path.name
+
+
+def content_digest(
+    manifest: dict,
+    installed_json: Path,
+    project_root: Path = Path("."),
+) -> str:
+    """Return a deterministic SHA-256 over everything baked into a team image.
+
+    Covers the manifest (minus ``updated``/``image_built``/``image_digest``),
+    each plugin's host-independent identity (see ``_plugin_identity``),
+    every referenced agent file,
+    every file under each referenced skill directory (``local:`` refs are
+    resolved against *project_root*), and the generated team CLAUDE.md.
+    Missing items hash as a ``<missing>`` marker so they still register.
+    """
+    hasher = hashlib.sha256()
+
+    def feed(tag: str, data: bytes) -> None:
+        hasher.update(f"{tag}\0{len(data)}\0".encode())
+        hasher.update(data)
+
+    def feed_file(tag: str, path: Path | None) -> None:
+        feed(tag, path.read_bytes() if path is not None and path.is_file() else b"<missing>")
+
+    def feed_dir(tag: str, path: Path | None) -> None:
+        if path is None or not path.is_dir():
+            feed(tag, b"<missing>")
+            return
+        for child in sorted(p for p in path.rglob("*") if p.is_file()):
+            feed(f"{tag}/{child.relative_to(path).as_posix()}", child.read_bytes())
+
+    content = {
+        k: v for k, v in manifest.items()
+        if not k.startswith("_") and k not in _DIGEST_EXCLUDED_KEYS
+    }
+    feed("manifest", json.dumps(content, sort_keys=True, default=str).encode())
+
+    registry = resolve_plugin_paths.PluginRegistry.for_path(installed_json)
+    for plugin in sorted(str(p) for p in manifest.get("plugins", []) or []):
+        feed(f"plugin:{plugin}", _plugin_identity(registry.lookup(plugin)).encode())
+
+    for ref in [str(a) for a in manifest.get("agents", []) or []]:
+        if ref.startswith("local:"):
+            feed_file(f"agent:{ref}", project_root / ref.removeprefix("local:"))
+            continue
+        split = _split_ref(ref)
+        plugin_path = registry.lookup(split[0]) if split else None
+        agent_file = (
+            generate_team_dockerfile.find_agent_file(plugin_path, split[1])
+            if split and plugin_path is not None else None
+        )
+        feed_file(f"agent:{ref}", agent_file)
+
+    for ref in [str(s) for s in manifest.get("skills", []) or []]:
+        if ref.startswith("local:"):
+            feed_dir(f"skill:{ref}", project_root / ref.removeprefix("local:"))
+            continue
+        split = _split_ref(ref)
+        plugin_path = registry.lookup(split[0]) if split else None
+        skill_dir = (
+            generate_team_dockerfile.find_skill_dir(plugin_path, split[1])
+            if split and plugin_path is not None else None
+        )
+        feed_dir(f"skill:{ref}", skill_dir)
+
+    feed_file("claude-md", _generated_claude_path(manifest))
+    return hasher.hexdigest()
+
+
+def read_image_label(tag: str, key: str = DIGEST_LABEL, docker: str = "docker") -> str | None:
+    """Return label *key* of local image *tag*, or ``None`` if absent."""
+    try:
+        result = subprocess.run(
+            [docker, "image", "inspect", "-f", f'{{{{ index .Config.Labels "{key}" }}}}', tag],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    value = result.stdout.strip()
+    if result.returncode != 0 or not value or value == "<no value>":
+        return None
+    return value
+
+
+def staleness(
+    manifest: dict,
+    installed_json: Path | None = None,
+    image_digest: str | None = None,
+    project_root: Path = Path("."),
+) -> str:
     """Determine staleness of a team image.
 
     Returns ``"current"``, ``"stale"``, or ``"not_built"``.
 
-    A team is stale when any of:
+    When *installed_json* is given and a digest was recorded for the image
+    (*image_digest*, read from the image label, else the manifest's
+    ``image_digest`` field), the team is stale exactly when
+    :func:`content_digest` no longer matches it.
+
+    Otherwise a team is stale when any of:
       - the manifest's ``updated`` timestamp is newer than ``image_built``
       - the generated team CLAUDE.md mtime is newer than ``image_built``
         (SA-M-5 — picks up drift from the project root's CLAUDE.md,
@@ -89,6 +241,17 @@ def staleness(manifest: dict) -> str:
     name = manifest.get("name", "unknown")
     updated = manifest.get("updated")
     image_built = manifest.get("image_built")
+    recorded = image_digest or manifest.get("image_digest")
+
+    if installed_json is not None and recorded:
+        current = content_digest(manifest, installed_json, project_root)
+        state = "current" if current == str(recorded) else "stale"
+        logger.info(
+            "Team image status from content digest",
+            extra={"team": name, "staleness": state},
+        )
+        return state
+
     claude_mtime = _generated_claude_mtime(manifest)
     logger.debug(
         "Evaluating team staleness",
@@ -183,9 +346,15 @@ def _count_list(manifest: dict, key: str) -> int:
 def fleet_report(
     teams_dir: Path,
     workflows_dir: Path,
+    installed_json: Path | None = None,
+    image_digests: dict[str, str | None] | None = None,
+    project_root: Path = Path("."),
 ) -> dict:
     """Assemble a complete fleet status report.
 
+    With *installed_json*, staleness is digest-based (see :func:`staleness`);
+    *image_digests* maps team name to the digest label read from its image.
+
     Returns a dict with ``team_count``, ``workflow_count``, and
     ``teams`` (list of per-team status dicts).
     """
@@ -205,7 +374,12 @@ def fleet_report(
             "status": str(manifest.get("status", "unknown")),
             "agent_count": _count_list(manifest, "agents"),
             "skill_count": _count_list(manifest, "skills"),
-            "staleness": staleness(manifest),
+            "staleness": staleness(
+                manifest,
+                installed_json,
+                (image_digests or {}).get(name),
+                project_root,
+            ),
             "workflow_count": len(refs),
             "workflow_refs": refs,
             "updated": manifest.get("updated"),
@@ -242,13 +416,49 @@ def main() -> None:
     parser.add_argument(
         "--workflows-dir", type=Path, default=Path(".archon/workflows"),
     )
+    parser.add_argument(
+        "--installed-plugins",
+        type=Path,
+        default=None,
+        help="installed_plugins.json; enables content-digest staleness.",
+    )
+    parser.add_argument(
+        "--image-labels",
+        action="store_true",
+        help=f"Read recorded digests from the {DIGEST_LABEL} image label.",
+    )
+    parser.add_argument(
+        "--digest",
+        metavar="TEAM",
+        help="Print the current content digest of TEAM and exit.",
+    )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     args = parser.parse_args()
 
-    import json as json_mod
-    report = fleet_report(args.teams_dir, args.workflows_dir)
+    if args.digest:
+        if args.installed_plugins is None:
+            parser.error("--digest requires --installed-plugins")
+        for manifest in load_manifests(args.teams_dir):
+            if manifest.get("name") == args.digest:
+                print(content_digest(manifest, args.installed_plugins))
+                return
+        print(f"ERROR: team not found: {args.digest}", file=sys.stderr)
+        sys.exit(1)
+
+    image_digests = None
+    if args.image_labels:
+        image_digests = {
+            str(m.get("name")): read_image_label(f"sdlc-worker:{m.get('name')}")
+            for m in load_manifests(args.teams_dir)
+        }
+    report = fleet_report(
+        args.teams_dir,
+        args.workflows_dir,
+        installed_json=args.installed_plugins,
+        image_digests=image_digests,
+    )
     if args.json:
-        print(json_mod.dumps(report, indent=2, default=str))
+        print(json.dumps(report, indent=2, default=str))
     else:
         print(f"Teams: {report['team_count']}, Workflows: {report['workflow_count']}")
         for team in report["teams"]:
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""Critical-path and parallelism analysis for workflow DAGs.
+
+``preprocess_workflow`` only looks at fan-out points (to warn about
+shared-workspace writes).  This module analyses the whole ``depends_on``
+graph before a run:
+
+* topological levels — nodes in one level can run concurrently;
+* the critical path, weighted by historical node durations where known,
+  else by the node's ``timeout`` (times ``max_iterations`` for loops);
+* maximum width, serial levels (single-node levels every later node waits
+  on), and total work;
+* a recommended concurrency: the fewest workers with which a
+  critical-path-first list schedule still finishes in critical-path time.
+
+Durations are milliseconds, like Archon's ``timeout``.
+
+Public API
+----------
+topological_levels(workflow) -> list[list[str]]
+node_duration_ms(node, history=None, default_ms=DEFAULT_NODE_MS) -> int
+analyse_workflow(workflow, history=None, default_ms=DEFAULT_NODE_MS) -> DagReport
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import math
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import yaml
+
+# Allow sibling import when run as a script.
+_scripts_dir = Path(__file__).resolve().parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+import preprocess_workflow  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# Assumed duration for nodes with neither history nor ``timeout``.
+DEFAULT_NODE_MS = 600_000
+
+
+class WorkflowDagError(ValueError):
+    """Raised when ``depends_on`` does not describe a DAG."""
+
+
+@dataclass
+class DagReport:
+    """Result of :func:`analyse_workflow`."""
+
+    workflow: str
+    node_count: int
+    levels: list[list[str]]
+    max_width: int
+    serial_levels: list[str]
+    critical_path: list[str]
+    critical_path_ms: int
+    total_work_ms: int
+    recommended_concurrency: int
+    fan_outs: dict[str, list[str]] = field(default_factory=dict)
+    durations_ms: dict[str, int] = field(default_factory=dict)
+    estimated: list[str] = field(default_factory=list)
+
+    @property
+    def average_parallelism(self) -> float:
+        """Total work divided by critical-path length."""
+        if not self.critical_path_ms:
+            return 0.0
+        return self.total_work_ms / self.critical_path_ms
+
+    def to_dict(self) -> dict[str, object]:
+        data = asdict(self)
+        data["average_parallelism"] = round(self.average_parallelism, 2)
+        return data
+
+
+def _dependencies(workflow: dict) -> dict[str, list[str]]:
+    """Return ``{node_id: [dep_id, ...]}`` in declaration order."""
+    deps: dict[str, list[str]] = {}
+    for node in workflow.get("nodes", []) or []:
+        node_id = str(node.get("id"))
+        if node_id in deps:
+            raise WorkflowDagError(f"Duplicate node id: {node_id}")
+        deps[node_id] = [str(d) for d in node.get("depends_on", []) or []]
+    for node_id, node_deps in deps.items():
+        unknown = [d for d in node_deps if d not in deps]
+        if unknown:
+            raise WorkflowDagError(
+                f"Node {node_id!r} depends on unknown node(s): {', '.join(unknown)}"
+            )
+    return deps
+
+
+def topological_levels(workflow: dict) -> list[list[str]]:
+    """Group node ids by longest distance from a root.
+
+    Level 0 holds nodes without ``depends_on``; every other node sits one
+    level below its deepest dependency.  Raises :class:`WorkflowDagError`
+    on cycles, unknown dependencies and duplicate ids.
+    """
+    deps = _dependencies(workflow)
+    children: dict[str, list[str]] = {node_id: [] for node_id in deps}
+    remaining = {node_id: len(node_deps) for node_id, node_deps in deps.items()}
+    for node_id, node_deps in deps.items():
+        for dep in node_deps:
+            children[dep].append(node_id)
+
+    level_of: dict[str, int] = {}
+    frontier = [node_id for node_id, count in remaining.items() if count == 0]
+    for node_id in frontier:
+        level_of[node_id] = 0
+    while frontier:
+        next_frontier: list[str] = []
+        for node_id in frontier:
+            for child in children[node_id]:
+                level_of[child] = max(level_of.get(child, 0), level_of[node_id] + 1)
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    next_frontier.append(child)
+        frontier = next_frontier
+
+    if len(level_of) != len(deps):
+        cyclic = sorted(node_id for node_id in deps if node_id not in level_of)
+        raise WorkflowDagError(f"Dependency cycle through: {', '.join(cyclic)}")
+
+    levels: list[list[str]] = [[] for _ in range(max(level_of.values(), default=-1) + 1)]
+    for node_id in deps:
+        levels[level_of[node_id]].append(node_id)
+    return levels
+
+
+def node_duration_ms(
+    node: dict,
+    history: dict[str, float] | None = None,
+    default_ms: int = DEFAULT_NODE_MS,
+) -> int:
+    """Expected duration of *node* in milliseconds.
+
+    A historical duration for the node id wins.  Otherwise the ``timeout``
+    is used as an upper bound: per iteration for ``loop:`` nodes (times
+    ``max_iterations``), summed over stages for ``loop.stages:`` nodes.
+    """
+    node_id = str(node.get("id"))
+    if history and node_id in history:
+        return int(history[node_id])
+
+    timeout = node.get("timeout")
+    per_run = int(timeout) if timeout else default_ms
+    loop = node.get("loop")
+    if not isinstance(loop, dict):
+        return per_run
+    iterations = int(loop.get("max_iterations", 1) or 1)
+    stages = loop.get("stages")
+    if isinstance(stages, list) and stages:
+        per_run = sum(int(stage.get("timeout") or per_run) for stage in stages)
+    return per_run * iterations
+
+
+def _list_schedule_makespan(
+    deps: dict[str, list[str]],
+    durations: dict[str, int],
+    priority: dict[str, int],
+    workers: int,
+) -> int:
+    """Makespan of a critical-path-first list schedule on *workers* slots."""
+    waiting = {node_id: len(node_deps) for node_id, node_deps in deps.items()}
+    children: dict[str, list[str]] = {node_id: [] for node_id in deps}
+    for node_id, node_deps in deps.items():
+        for dep in node_deps:
+            children[dep].append(node_id)
+
+    ready = [(-priority[n], n) for n, count in waiting.items() if count == 0]
+    heapq.heapify(ready)
+    running: list[tuple[int, str]] = []
+    now = 0
+    while ready or running:
+        while ready and len(running) < workers:
+            _, node_id = heapq.heappop(ready)
+            heapq.heappush(running, (now + durations[node_id], node_id))
+        now, done = heapq.heappop(running)
+        for child in children[done]:
+            waiting[child] -= 1
+            if waiting[child] == 0:
+                heapq.heappush(ready, (-priority[child], child))
+    return now
+
+
+def analyse_workflow(
+    workflow: dict,
+    history: dict[str, float] | None = None,
+    default_ms: int = DEFAULT_NODE_MS,
+) -> DagReport:
+    """Compute levels, critical path, width and a concurrency recommendation.
+
+    Parameters
+    ----------
+    workflow:
+        Parsed workflow YAML (``nodes`` with ``id``/``depends_on``).
+    history:
+        Optional ``{node_id: duration_ms}`` from past runs; preferred over
+        ``timeout`` upper bounds.
+    default_ms:
+        Duration assumed for nodes with neither history nor ``timeout``.
+    """
+    levels = topological_levels(workflow)
+    deps = _dependencies(workflow)
+    nodes = {str(n.get("id")): n for n in workflow.get("nodes", []) or []}
+    durations = {
+        node_id: node_duration_ms(node, history, default_ms)
+        for node_id, node in nodes.items()
+    }
+    estimated = [
+        node_id for node_id, node in nodes.items()
+        if not (history and node_id in history) and not node.get("timeout")
+    ]
+
+    # Longest path ending at each node, walking levels in order.
+    finish: dict[str, int] = {}
+    via: dict[str, str | None] = {}
+    for level in levels:
+        for node_id in level:
+            best = max(deps[node_id], key=lambda d: finish[d], default=None)
+            via[node_id] = best
+            finish[node_id] = durations[node_id] + (finish[best] if best else 0)
+
+    # Longest path starting at each node (scheduling priority).
+    children: dict[str, list[str]] = {node_id: [] for node_id in deps}
+    for node_id, node_deps in deps.items():
+        for dep in node_deps:
+            children[dep].append(node_id)
+    tail: dict[str, int] = {}
+    for level in reversed(levels):
+        for node_id in level:
+            tail[node_id] = durations[node_id] + max(
+                (tail[c] for c in children[node_id]), default=0
+            )
+
+    path: list[str] = []
+    critical_ms = 0
+    if finish:
+        end = max(finish, key=lambda n: finish[n])
+        critical_ms = finish[end]
+        cursor: str | None = end
+        while cursor is not None:
+            path.append(cursor)
+            cursor = via[cursor]
+        path.reverse()
+
+    max_width = max((len(level) for level in levels), default=0)
+    recommended = max_width
+    lower_bound = math.ceil(sum(durations.values()) / critical_ms) if critical_ms else 1
+    for workers in range(max(1, lower_bound), max_width + 1):
+        if _list_schedule_makespan(deps, durations, tail, workers) <= critical_ms:
+            recommended = workers
+            break
+
+    report = DagReport(
+        workflow=str(workflow.get("name", "")),
+        node_count=len(nodes),
+        levels=levels,
+        max_width=max_width,
+        serial_levels=[level[0] for level in levels[:-1] if len(level) == 1],
+        critical_path=path,
+        critical_path_ms=critical_ms,
+        total_work_ms=sum(durations.values()),
+        recommended_concurrency=recommended,
+        fan_outs=preprocess_workflow._detect_fan_outs(workflow),
+        durations_ms=durations,
+        estimated=estimated,
+    )
+    logger.info(
+        "Workflow DAG analysed",
+        extra={
+            "workflow": report.workflow,
+            "node_count": report.node_count,
+            "critical_path_ms": critical_ms,
+            "recommended_concurrency": recommended,
+        },
+    )
+    return report
+
+
+def _fmt_ms(ms: int) -> str:
+    minutes, seconds = divmod(round(ms / 1000), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if hours else f"{minutes}m{seconds:02d}s"
+
+
+def render_text(report: DagReport) -> str:
+    """Human-readable summary of *report*."""
+    lines = [
+        f"Workflow: {report.workflow or '<unnamed>'} ({report.node_count} nodes)",
+        f"Critical path: {_fmt_ms(report.critical_path_ms)}  "
+        f"Total work: {_fmt_ms(report.total_work_ms)}  "
+        f"Avg parallelism: {report.average_parallelism:.1f}",
+        f"Max width: {report.max_width}  "
+        f"Recommended concurrency: {report.recommended_concurrency}",
+        "",
+        "Levels:",
+    ]
+    critical = set(report.critical_path)
+    for index, level in enumerate(report.levels):
+        names = ", ".join(f"{n}*" if n in critical else n for n in level)
+        lines.append(f"  {index:>2}  {names}")
+    lines.append("")
+    lines.append("Critical path (* above):")
+    for node_id in report.critical_path:
+        share = report.durations_ms[node_id] / report.critical_path_ms if report.critical_path_ms else 0
+        lines.append(f"  {node_id:40s} {_fmt_ms(report.durations_ms[node_id]):>8s} {share:>5.0%}")
+    if report.serial_levels:
+        lines.append("")
+        lines.append("Serial bottlenecks: " + ", ".join(report.serial_levels))
+    if report.estimated:
+        lines.append("")
+        lines.append(
+            "No timeout or history (assumed default): " + ", ".join(report.estimated)
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point — analyse a workflow YAML."""
+    import argparse
+
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    logger.info("workflow_dag CLI start")
+
+    parser = argparse.ArgumentParser(description="Critical-path and parallelism report for a workflow")
+    parser.add_argument("workflow", type=Path, help="Workflow YAML")
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=None,
+        help="JSON object mapping node id to observed duration in ms.",
+    )
+    parser.add_argument("--default-timeout-ms", type=int, default=DEFAULT_NODE_MS)
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args(argv)
+
+    with args.workflow.open() as fh:
+        workflow = yaml.safe_load(fh) or {}
+    history = json.loads(args.history.read_text()) if args.history else None
+
+    try:
+        report = analyse_workflow(workflow, history, args.default_timeout_ms)
+    except WorkflowDagError as exc:
+        print(f"workflow_dag: {exc}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(render_text(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
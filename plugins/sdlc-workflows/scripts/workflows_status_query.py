@@ -17,22 +17,42 @@ gap by going to the two real sources:
 Output modes:
 - Default: human-readable table.
 - `--json`: one JSON object per line (runs + inline node events).
+- `--follow`: tail new node events as they are written (SQLite, polled
+  against a rowid high-water mark); with `--run-id`, that run only.
 
 Filters (mutually exclusive):
 - `--running` — only status='running'.
 - `--recent N` — latest N by started_at (default 20).
 - `--run-id <id>` — full detail for one run, including per-node events.
+- `--stats` — historical duration analytics per workflow and per node
+  (count, p50/p95 duration, failure rate, retries), SQLite only. Narrow
+  with `--workflow NAME` and `--since TIMESTAMP`.
+
+List pages are keyset-paginated on `(started_at, id)`: each page prints a
+cursor for `--before` to fetch the next one. `--events` inlines every listed
+run's events — from one batched SQLite query, or on the REST path from
+`--parallel N` concurrent detail requests over keep-alive connections
+(`ArchonHTTPPool`), falling back to SQLite for any run REST cannot serve.
+All SQLite reads in one invocation share a single read-only connection and
+one schema probe (`ArchonDB`).
 """
 from __future__ import annotations
 
 import argparse
+import http.client
 import json
 import os
 import sqlite3
 import sys
+import threading
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable, Iterator
 
 
 ARCHON_DEFAULT_URL = "http://localhost:3090"
@@ -61,9 +81,104 @@ def _http_get_json(url: str, timeout: float) -> object | None:
     return json.loads(resp.read().decode("utf-8"))
 
 
-def fetch_via_rest(base_url: str, timeout: float) -> list[dict] | None:
+class ArchonHTTPPool:
+    """Bounded pool of keep-alive ``http.client`` connections to one server.
+
+    ``urlopen`` pays a TCP connect and teardown per call; reusing a handful
+    of HTTP/1.1 connections matters once run details are fetched in
+    parallel. At most ``maxsize`` requests are in flight (callers beyond
+    that wait for a slot), connections are opened lazily, and a reused
+    connection the server has since dropped is retried once on a fresh one.
+    ``get_json`` keeps the ``_http_get_json`` contract.
+    """
+
+    def __init__(self, base_url: str, maxsize: int = 4, timeout: float = 1.0) -> None:
+        parts = urllib.parse.urlsplit(base_url)
+        self._conn_cls = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.created = 0
+        self._slots = threading.BoundedSemaphore(maxsize)
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _checkout(
+        self, timeout: float, fresh: bool = False
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            conn = self._idle.pop() if self._idle and not fresh else None
+            if conn is None:
+                self.created += 1
+        if conn is None:
+            return self._conn_cls(self._host, self._port, timeout=timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def get_json(self, path: str, timeout: float | None = None) -> object | None:
+        """GET ``path`` and parse JSON; None if unreachable, raise on 5xx."""
+        timeout = self.timeout if timeout is None else timeout
+        with self._slots:
+            for attempt in range(2):
+                conn, reused = self._checkout(timeout, fresh=attempt > 0)
+                try:
+                    conn.request(
+                        "GET", self._prefix + path, headers={"Accept": "application/json"}
+                    )
+                    resp = conn.getresponse()
+                    body = resp.read()
+                except (ConnectionResetError, BrokenPipeError, http.client.BadStatusLine):
+                    conn.close()
+                    if reused and attempt == 0:
+                        continue  # idle keep-alive connection closed by the server
+                    return None
+                except (OSError, http.client.HTTPException):
+                    # Refused, unreachable or timed out — fall back like urlopen.
+                    conn.close()
+                    return None
+                if resp.will_close:
+                    conn.close()
+                else:
+                    with self._lock:
+                        self._idle.append(conn)
+                break
+        if resp.status >= 500:
+            raise RuntimeError(f"Archon server error: {resp.status} from {self._prefix + path}")
+        if resp.status >= 400:
+            return None
+        return json.loads(body.decode("utf-8"))
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def __enter__(self) -> "ArchonHTTPPool":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _rest_get(
+    base_url: str, path: str, timeout: float, pool: ArchonHTTPPool | None
+) -> object | None:
+    if pool is not None:
+        return pool.get_json(path, timeout=timeout)
+    return _http_get_json(base_url.rstrip("/") + path, timeout=timeout)
+
+
+def fetch_via_rest(
+    base_url: str, timeout: float, pool: ArchonHTTPPool | None = None
+) -> list[dict] | None:
     """Fetch all runs via REST; return None if the server is unreachable."""
-    data = _http_get_json(base_url.rstrip("/") + "/api/workflows/runs", timeout=timeout)
+    data = _rest_get(base_url, "/api/workflows/runs", timeout, pool)
     if data is None:
         return None
     if isinstance(data, list):
@@ -74,7 +189,7 @@ def fetch_via_rest(base_url: str, timeout: float) -> list[dict] | None:
 
 
 def fetch_run_detail_via_rest(
-    base_url: str, run_id: str, timeout: float
+    base_url: str, run_id: str, timeout: float, pool: ArchonHTTPPool | None = None
 ) -> dict | None:
     """Fetch one run's detail via REST; None if unreachable.
 
@@ -82,8 +197,7 @@ def fetch_run_detail_via_rest(
     [...]}``) into a single flat dict with ``events`` merged in, matching the
     ``fetch_run_detail_via_sqlite`` contract expected by ``format_run_detail``.
     """
-    url = f"{base_url.rstrip('/')}/api/workflows/runs/{run_id}"
-    data = _http_get_json(url, timeout=timeout)
+    data = _rest_get(base_url, f"/api/workflows/runs/{run_id}", timeout, pool)
     if data is None:
         return None
     # Wrapper shape: {"run": {...}, "events": [...]}. Disambiguate from a
@@ -158,49 +272,150 @@ def _validate_schema(conn: sqlite3.Connection) -> list[str]:
     return warnings
 
 
-def _open_db() -> tuple[sqlite3.Connection | None, list[str]]:
+def _open_db(path: Path | None = None) -> tuple[sqlite3.Connection | None, list[str]]:
     """Open the Archon SQLite DB read-only, returning (conn, schema_warnings).
 
     Returns (None, []) when the DB file does not exist (fresh machine).
     """
-    if not ARCHON_DB_PATH.exists():
+    path = path if path is not None else ARCHON_DB_PATH
+    if not path.exists():
         return None, []
     # URI + mode=ro keeps this strictly read-only even if the DB lock slips.
-    uri = f"file:{ARCHON_DB_PATH}?mode=ro"
+    uri = f"file:{path}?mode=ro"
     conn = sqlite3.connect(uri, uri=True, timeout=2.0)
     warnings = _validate_schema(conn)
     return conn, warnings
 
 
-def fetch_via_sqlite(running_only: bool, limit: int | None) -> list[dict]:
-    conn, schema_warnings = _open_db()
-    for w in schema_warnings:
-        print(w, file=sys.stderr)
-    if conn is None:
-        return []
-    try:
-        conn.row_factory = sqlite3.Row
-        where = "WHERE status = 'running'" if running_only else ""
-        sql = f"""
-            SELECT id, conversation_id, workflow_name, status,
+class ArchonDB:
+    """Read-only archon.db handle shared by every query in one CLI invocation.
+
+    The connection is opened lazily on first use and the schema is probed
+    exactly once — its warnings go to stderr a single time — instead of a
+    fresh connection plus PRAGMA probes per query. Use as a context manager;
+    every ``*_via_sqlite`` function accepts it as ``db=`` and opens a private
+    one-shot handle when it is omitted.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path if path is not None else ARCHON_DB_PATH
+        self.warnings: list[str] = []
+        self._conn: sqlite3.Connection | None = None
+        self._opened = False
+
+    def connect(self) -> sqlite3.Connection | None:
+        """Return the shared connection, or None when archon.db is absent."""
+        if not self._opened:
+            self._opened = True
+            self._conn, self.warnings = _open_db(self.path)
+            for w in self.warnings:
+                print(w, file=sys.stderr)
+            if self._conn is not None:
+                self._conn.row_factory = sqlite3.Row
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+        self._opened = False
+
+    def __enter__(self) -> "ArchonDB":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+@contextmanager
+def _session(db: ArchonDB | None) -> Iterator[ArchonDB]:
+    """Yield ``db`` itself, or a one-shot handle closed on exit."""
+    if db is not None:
+        yield db
+        return
+    with ArchonDB() as own:
+        yield own
+
+
+_RUN_COLUMNS = """id, conversation_id, workflow_name, status,
                    current_step_index, started_at, completed_at,
-                   last_activity_at, working_path
-            FROM remote_agent_workflow_runs
-            {where}
-            ORDER BY started_at DESC
-        """
-        if limit is not None:
-            sql += f" LIMIT {int(limit)}"
-        rows = conn.execute(sql).fetchall()
-        return [dict(r) for r in rows]
-    except sqlite3.OperationalError:
-        # Schema probe already warned; return empty for graceful degradation.
-        return []
-    finally:
-        conn.close()
+                   last_activity_at, working_path"""
+
+# SQLite's default bound-parameter limit is 999 on older builds; stay under it.
+_IN_CHUNK = 500
+# Events returned per follow-mode poll; a full page is drained without sleeping.
+_POLL_PAGE = 1000
+
+
+def run_cursor(run: dict) -> str:
+    """Keyset cursor for ``run`` — pass to ``--before`` for the next page."""
+    return f"{run.get('started_at') or ''}|{run.get('id')}"
+
+
+def _parse_cursor(cursor: str) -> tuple[str, str]:
+    started_at, _, run_id = cursor.rpartition("|")
+    return started_at, run_id
+
 
+def fetch_via_sqlite(
+    running_only: bool,
+    limit: int | None,
+    before: str | None = None,
+    db: ArchonDB | None = None,
+) -> list[dict]:
+    """List runs newest-first, optionally one keyset page at a time.
 
-def resolve_run_id_prefix(prefix: str) -> tuple[str | None, str | None]:
+    ``before`` is a cursor from ``run_cursor`` (the last row of the previous
+    page). Pages are sliced on the bare ``started_at``/``id`` columns, with
+    no OFFSET and no wrapping expression, so SQLite can seek an index on
+    ``started_at`` when one exists. Runs with no ``started_at`` sort last
+    and are paged separately by ``id``.
+    """
+    base = ["status = 'running'"] if running_only else []
+    if before is None:
+        segments: list[tuple[list[str], list[object]]] = [(base, [])]
+    else:
+        started_at, run_id = _parse_cursor(before)
+        if started_at:
+            segments = [
+                (base + ["started_at IS NOT NULL", "(started_at, id) < (?, ?)"],
+                 [started_at, run_id]),
+                (base + ["started_at IS NULL"], []),
+            ]
+        else:
+            segments = [(base + ["started_at IS NULL", "id < ?"], [run_id])]
+
+    with _session(db) as handle:
+        conn = handle.connect()
+        if conn is None:
+            return []
+        runs: list[dict] = []
+        for clauses, params in segments:
+            remaining = None if limit is None else int(limit) - len(runs)
+            if remaining is not None and remaining <= 0:
+                break
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            # ORDER BY started_at DESC already puts NULLs last in SQLite.
+            sql = f"""
+                SELECT {_RUN_COLUMNS}
+                FROM remote_agent_workflow_runs
+                {where}
+                ORDER BY started_at DESC, id DESC
+            """
+            if remaining is not None:
+                sql += f" LIMIT {remaining}"
+            try:
+                rows = conn.execute(sql, params).fetchall()
+            except sqlite3.OperationalError:
+                # Schema probe already warned; return empty for graceful degradation.
+                return []
+            runs.extend(dict(r) for r in rows)
+        return runs
+
+
+def resolve_run_id_prefix(
+    prefix: str, db: ArchonDB | None = None
+) -> tuple[str | None, str | None]:
     """Resolve a run-id prefix to a full id against SQLite.
 
     Archon run ids are 32-char hex UUIDs; ``--recent`` prints only the first
@@ -216,12 +431,10 @@ def resolve_run_id_prefix(prefix: str) -> tuple[str | None, str | None]:
     path still benefit: resolve here, pass the full id to the REST detail
     endpoint.
     """
-    conn, schema_warnings = _open_db()
-    for w in schema_warnings:
-        print(w, file=sys.stderr)
-    if conn is None:
-        return None, f"archon.db not found at {ARCHON_DB_PATH}"
-    try:
+    with _session(db) as handle:
+        conn = handle.connect()
+        if conn is None:
+            return None, f"archon.db not found at {handle.path}"
         rows = conn.execute(
             "SELECT id FROM remote_agent_workflow_runs WHERE id LIKE ? LIMIT 2",
             (prefix + "%",),
@@ -231,39 +444,288 @@ def resolve_run_id_prefix(prefix: str) -> tuple[str | None, str | None]:
         if len(rows) > 1:
             return None, f"prefix {prefix!r} is ambiguous (matches multiple runs)"
         return rows[0][0], None
-    finally:
-        conn.close()
 
 
-def fetch_run_detail_via_sqlite(run_id: str) -> dict | None:
-    conn, schema_warnings = _open_db()
-    for w in schema_warnings:
-        print(w, file=sys.stderr)
-    if conn is None:
-        return None
-    try:
-        conn.row_factory = sqlite3.Row
+def fetch_events_via_sqlite(
+    run_ids: list[str], db: ArchonDB | None = None
+) -> dict[str, list[dict]]:
+    """Fetch the events of many runs with one ``IN (...)`` query per chunk.
+
+    Returns ``{run_id: [event, ...]}`` with each list in ``created_at``
+    order; runs without events map to ``[]``. Replaces one detail query per
+    run when listing runs with their events.
+    """
+    events: dict[str, list[dict]] = {run_id: [] for run_id in run_ids}
+    with _session(db) as handle:
+        conn = handle.connect()
+        if conn is None or not run_ids:
+            return events
+        unique = list(events)
+        for start in range(0, len(unique), _IN_CHUNK):
+            chunk = unique[start:start + _IN_CHUNK]
+            rows = conn.execute(
+                f"""SELECT workflow_run_id, event_type, step_index, step_name,
+                           data, created_at
+                    FROM remote_agent_workflow_events
+                    WHERE workflow_run_id IN ({', '.join('?' * len(chunk))})
+                    ORDER BY created_at ASC, rowid ASC""",
+                chunk,
+            ).fetchall()
+            for row in rows:
+                event = dict(row)
+                events[event.pop("workflow_run_id")].append(event)
+    return events
+
+
+def fetch_run_detail_via_sqlite(run_id: str, db: ArchonDB | None = None) -> dict | None:
+    with _session(db) as handle:
+        conn = handle.connect()
+        if conn is None:
+            return None
         run = conn.execute(
-            """SELECT id, conversation_id, workflow_name, status,
-                      current_step_index, started_at, completed_at,
-                      last_activity_at, working_path
-               FROM remote_agent_workflow_runs WHERE id = ?""",
+            f"SELECT {_RUN_COLUMNS} FROM remote_agent_workflow_runs WHERE id = ?",
             (run_id,),
         ).fetchone()
         if run is None:
             return None
-        events = conn.execute(
-            """SELECT event_type, step_index, step_name, data, created_at
-               FROM remote_agent_workflow_events
-               WHERE workflow_run_id = ?
-               ORDER BY created_at ASC""",
-            (run_id,),
-        ).fetchall()
         result = dict(run)
-        result["events"] = [dict(e) for e in events]
+        result["events"] = fetch_events_via_sqlite([run_id], db=handle)[run_id]
         return result
+
+
+def fetch_run_details(
+    run_ids: list[str],
+    base_url: str,
+    timeout: float,
+    pool: ArchonHTTPPool | None = None,
+    max_workers: int = 4,
+    db: ArchonDB | None = None,
+) -> dict[str, tuple[dict | None, str]]:
+    """Fetch many run details over REST in parallel, falling back per run.
+
+    At most ``max_workers`` requests are in flight, each bounded by
+    ``timeout``, over ``pool``'s keep-alive connections (a private pool is
+    used when none is given). Any run REST cannot serve — unreachable, timed
+    out, 4xx/5xx, malformed — is read from SQLite afterwards on the calling
+    thread, since sqlite3 connections are not shared across threads.
+
+    Returns ``{run_id: (detail or None, source)}`` with source ``"rest"`` or
+    ``"sqlite"``, in ``run_ids`` order.
+    """
+    unique = list(dict.fromkeys(run_ids))
+    if not unique:
+        return {}
+
+    def fetch(run_id: str) -> dict | None:
+        try:
+            return fetch_run_detail_via_rest(base_url, run_id, timeout, pool=pool)
+        except (RuntimeError, ValueError) as e:
+            print(f"WARNING: {e}", file=sys.stderr)
+            return None
+
+    own_pool = pool is None
+    if own_pool:
+        pool = ArchonHTTPPool(base_url, maxsize=max_workers, timeout=timeout)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as executor:
+            rest_details = list(executor.map(fetch, unique))
     finally:
-        conn.close()
+        if own_pool:
+            pool.close()
+
+    results: dict[str, tuple[dict | None, str]] = {}
+    with _session(db) as handle:
+        for run_id, detail in zip(unique, rest_details):
+            if detail is not None:
+                results[run_id] = (detail, "rest")
+            else:
+                results[run_id] = (fetch_run_detail_via_sqlite(run_id, db=handle), "sqlite")
+    return results
+
+
+def latest_event_mark(db: ArchonDB) -> int:
+    """Current high-water mark (max event rowid); 0 for an empty/absent DB."""
+    conn = db.connect()
+    if conn is None:
+        return 0
+    return conn.execute(
+        "SELECT COALESCE(MAX(rowid), 0) FROM remote_agent_workflow_events"
+    ).fetchone()[0]
+
+
+def poll_events(
+    db: ArchonDB, after: int, run_id: str | None = None, limit: int = _POLL_PAGE
+) -> tuple[list[dict], int]:
+    """Return events inserted after high-water mark ``after`` and the new mark.
+
+    Archon only appends to the events table, so its rowid grows with every
+    insert; seeking past the mark walks the rowid b-tree instead of
+    rescanning the table on each poll.
+    """
+    conn = db.connect()
+    if conn is None:
+        return [], after
+    sql = """SELECT rowid, workflow_run_id, event_type, step_index, step_name,
+                    data, created_at
+             FROM remote_agent_workflow_events
+             WHERE rowid > ?"""
+    params: list[object] = [after]
+    if run_id is not None:
+        sql += " AND workflow_run_id = ?"
+        params.append(run_id)
+    sql += f" ORDER BY rowid LIMIT {int(limit)}"
+    events = []
+    for row in conn.execute(sql, params).fetchall():
+        event = dict(row)
+        after = event.pop("rowid")
+        events.append(event)
+    return events, after
+
+
+def follow_events(
+    db: ArchonDB,
+    after: int,
+    run_id: str | None = None,
+    interval: float = 2.0,
+    max_polls: int | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Iterator[dict]:
+    """Yield new events as they land, polling every ``interval`` seconds.
+
+    Drains a backlog without sleeping between full pages. Runs until the
+    caller stops iterating (or ``max_polls`` polls, for tests).
+    """
+    polls = 0
+    while max_polls is None or polls < max_polls:
+        events, after = poll_events(db, after, run_id)
+        polls += 1
+        yield from events
+        if len(events) < _POLL_PAGE:
+            sleep(interval)
+
+
+# Aggregates node attempts and whole runs in one pass. A node attempt is a
+# ``node_completed``/``node_failed`` event paired with the latest preceding
+# ``node_started`` for the same (run, node); a second start of the same node
+# in one run is a retry. Percentiles use nearest-rank over successful
+# attempts (or completed runs for the workflow-level row, ``node`` NULL).
+_STATS_SQL = """
+WITH runs AS (
+    SELECT id, workflow_name, status, started_at, completed_at
+    FROM remote_agent_workflow_runs
+    WHERE (:workflow IS NULL OR workflow_name = :workflow)
+      AND (:since IS NULL OR started_at >= :since)
+),
+node_events AS (
+    SELECT r.workflow_name,
+           e.workflow_run_id AS run_id,
+           COALESCE(e.step_name, CAST(e.step_index AS TEXT)) AS node,
+           e.step_index,
+           e.event_type,
+           e.created_at,
+           MAX(CASE WHEN e.event_type = 'node_started' THEN e.created_at END) OVER (
+               PARTITION BY e.workflow_run_id,
+                            COALESCE(e.step_name, CAST(e.step_index AS TEXT))
+               ORDER BY e.created_at, e.rowid
+               ROWS UNBOUNDED PRECEDING
+           ) AS attempt_started_at
+    FROM remote_agent_workflow_events e
+    JOIN runs r ON r.id = e.workflow_run_id
+    WHERE e.event_type IN ('node_started', 'node_completed', 'node_failed')
+),
+samples AS (
+    SELECT workflow_name, node, step_index,
+           CASE event_type WHEN 'node_completed' THEN 'completed' ELSE 'failed' END AS outcome,
+           (julianday(created_at) - julianday(attempt_started_at)) * 86400000.0 AS duration_ms
+    FROM node_events
+    WHERE event_type <> 'node_started'
+    UNION ALL
+    SELECT workflow_name, NULL, NULL, status,
+           (julianday(completed_at) - julianday(started_at)) * 86400000.0
+    FROM runs
+),
+ranked AS (
+    SELECT *,
+           ROW_NUMBER() OVER timed_window AS rn,
+           COUNT(*) OVER (PARTITION BY workflow_name, node, timed) AS n
+    FROM (
+        SELECT *, (outcome = 'completed' AND duration_ms IS NOT NULL) AS timed
+        FROM samples
+    )
+    WINDOW timed_window AS (
+        PARTITION BY workflow_name, node, timed ORDER BY duration_ms
+    )
+),
+agg AS (
+    SELECT workflow_name, node,
+           MIN(step_index) AS step_index,
+           COUNT(*) AS count,
+           SUM(outcome = 'completed') AS completed,
+           SUM(outcome = 'failed') AS failed,
+           MIN(CASE WHEN timed AND rn * 100 >= n * 50 THEN duration_ms END) AS p50_ms,
+           MIN(CASE WHEN timed AND rn * 100 >= n * 95 THEN duration_ms END) AS p95_ms
+    FROM ranked
+    GROUP BY workflow_name, node
+),
+node_starts AS (
+    SELECT workflow_name, node, SUM(event_type = 'node_started') AS starts
+    FROM node_events
+    GROUP BY workflow_name, run_id, node
+),
+retries AS (
+    SELECT workflow_name, node, SUM(MAX(starts - 1, 0)) AS retries
+    FROM node_starts GROUP BY workflow_name, node
+    UNION ALL
+    SELECT workflow_name, NULL, SUM(MAX(starts - 1, 0))
+    FROM node_starts GROUP BY workflow_name
+)
+SELECT a.workflow_name, a.node, a.count, a.completed, a.failed,
+       CASE WHEN a.completed + a.failed > 0
+            THEN 1.0 * a.failed / (a.completed + a.failed) END AS failure_rate,
+       a.p50_ms, a.p95_ms,
+       COALESCE(r.retries, 0) AS retries
+FROM agg a
+LEFT JOIN retries r ON r.workflow_name = a.workflow_name AND r.node IS a.node
+ORDER BY a.workflow_name, a.node IS NOT NULL, a.step_index, a.node
+"""
+
+
+def fetch_stats_via_sqlite(
+    workflow: str | None = None,
+    since: str | None = None,
+    db: ArchonDB | None = None,
+) -> list[dict]:
+    """Aggregate run and node durations across history in a single query.
+
+    Returns one row per workflow (``node`` is None — whole-run figures from
+    ``remote_agent_workflow_runs``) followed by one row per node of that
+    workflow. Each row carries ``count``, ``completed``, ``failed``,
+    ``failure_rate`` (failed / finished), ``p50_ms``/``p95_ms`` over
+    successful attempts and ``retries`` (extra ``node_started`` events for a
+    node within one run). ``since`` filters on the run's ``started_at``.
+
+    Returns [] when archon.db is absent or the schema cannot answer the query.
+    """
+    with _session(db) as handle:
+        conn = handle.connect()
+        if conn is None:
+            return []
+        try:
+            rows = conn.execute(
+                _STATS_SQL, {"workflow": workflow, "since": since}
+            ).fetchall()
+        except sqlite3.OperationalError:
+            return []
+    stats = []
+    for row in rows:
+        entry = dict(row)
+        for key in ("p50_ms", "p95_ms"):
+            if entry[key] is not None:
+                entry[key] = int(round(entry[key]))
+        if entry["failure_rate"] is not None:
+            entry["failure_rate"] = round(entry["failure_rate"], 4)
+        stats.append(entry)
+    return stats
 
 
 # ---------------------------------------------------------------------------
@@ -319,6 +781,49 @@ def format_run_detail(run: dict) -> str:
     return "\n".join(out)
 
 
+def format_event_line(event: dict) -> str:
+    return (
+        f"{(event.get('created_at') or '')[:19]} "
+        f"{_short(event.get('workflow_run_id')):<8} "
+        f"[{event.get('step_name') or event.get('step_index') or '-'}] "
+        f"{event.get('event_type')}"
+    )
+
+
+def _fmt_ms(ms: int | None) -> str:
+    if ms is None:
+        return "-"
+    if ms < 1000:
+        return f"{ms}ms"
+    if ms < 60_000:
+        return f"{ms / 1000:.1f}s"
+    return f"{ms / 60_000:.1f}m"
+
+
+def format_stats_table(stats: list[dict]) -> str:
+    if not stats:
+        return "(no workflow history found)"
+    header = (
+        f"{'WORKFLOW / NODE':<34} {'COUNT':>6} {'FAIL%':>6} "
+        f"{'P50':>8} {'P95':>8} {'RETRIES':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for s in stats:
+        label = (s["workflow_name"] or "") if s["node"] is None else f"  {s['node']}"
+        rate = s["failure_rate"]
+        lines.append(
+            f"{label[:34]:<34} {s['count']:>6} "
+            f"{'-' if rate is None else f'{rate * 100:.1f}':>6} "
+            f"{_fmt_ms(s['p50_ms']):>8} {_fmt_ms(s['p95_ms']):>8} {s['retries']:>8}"
+        )
+    lines.append("")
+    lines.append(
+        "Workflow rows are whole runs; indented rows are node attempts. "
+        "P50/P95 cover successful attempts only."
+    )
+    return "\n".join(lines)
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -330,6 +835,45 @@ def main() -> int:
     group.add_argument("--running", action="store_true", help="Only active runs")
     group.add_argument("--recent", type=int, metavar="N", help="Latest N runs (default 20)")
     group.add_argument("--run-id", help="Detail for one run")
+    group.add_argument(
+        "--stats",
+        action="store_true",
+        help="Per-workflow and per-node duration analytics (SQLite only)",
+    )
+    p.add_argument("--workflow", help="With --stats: only this workflow")
+    p.add_argument(
+        "--since",
+        metavar="TIMESTAMP",
+        help="With --stats: only runs started at or after this time (e.g. 2026-04-01)",
+    )
+    p.add_argument(
+        "--before",
+        metavar="CURSOR",
+        help="List the page of runs after this cursor (printed with each page)",
+    )
+    p.add_argument(
+        "--events",
+        action="store_true",
+        help="Inline each listed run's node events (one batched query)",
+    )
+    p.add_argument(
+        "--follow",
+        action="store_true",
+        help="Tail new node events from SQLite (all runs, or --run-id) until Ctrl-C",
+    )
+    p.add_argument(
+        "--parallel",
+        type=int,
+        default=4,
+        metavar="N",
+        help="Concurrent REST detail requests for --events (default 4)",
+    )
+    p.add_argument(
+        "--interval",
+        type=float,
+        default=2.0,
+        help="Poll interval in seconds for --follow (default 2.0)",
+    )
     p.add_argument(
         "--url",
         default=ARCHON_DEFAULT_URL,
@@ -347,14 +891,33 @@ def main() -> int:
     )
     args = p.parse_args()
 
-    # Single-run detail path.
+    # One read-only connection (and one schema probe) and one keep-alive
+    # HTTP pool for the whole invocation; both connect lazily.
+    with ArchonDB() as db, ArchonHTTPPool(
+        args.url, maxsize=max(1, args.parallel), timeout=args.timeout
+    ) as pool:
+        return _run(args, db, pool)
+
+
+def _run(args: argparse.Namespace, db: ArchonDB, pool: ArchonHTTPPool) -> int:
+    # Analytics path — Archon's REST API has no aggregate endpoint.
+    if args.stats:
+        stats = fetch_stats_via_sqlite(workflow=args.workflow, since=args.since, db=db)
+        if args.json:
+            print(json.dumps({"source": "sqlite", "stats": stats}, indent=2, default=str))
+        else:
+            print(f"Source: sqlite  ({db.path})")
+            print(format_stats_table(stats))
+        return 0
+
+    resolved_id = None
     if args.run_id:
         # Resolve prefix → full id via SQLite. --recent prints 8-char prefixes,
         # so users naturally paste those into --run-id. Skip if the argument
         # is already 32 hex chars (no point in an extra DB round-trip).
         resolved_id = args.run_id
         if not (len(args.run_id) == 32 and all(c in "0123456789abcdef" for c in args.run_id.lower())):
-            full_id, err = resolve_run_id_prefix(args.run_id)
+            full_id, err = resolve_run_id_prefix(args.run_id, db=db)
             if full_id is not None:
                 resolved_id = full_id
             elif err and ("ambiguous" in err or "archon.db not found" in err):
@@ -365,14 +928,41 @@ def main() -> int:
             # else (no match, err startswith "no run matches"): fall through;
             # fetch_*_via_* will emit the standard "Run <id> not found".
 
+    # Tail path — SQLite only; a single run replays from its first event,
+    # otherwise only events landing after startup are shown.
+    if args.follow:
+        if db.connect() is None:
+            print(f"archon.db not found at {db.path}", file=sys.stderr)
+            return 1
+        mark = 0 if resolved_id else latest_event_mark(db)
+        try:
+            for event in follow_events(db, mark, run_id=resolved_id, interval=args.interval):
+                if args.json:
+                    print(json.dumps(event, default=str), flush=True)
+                else:
+                    print(format_event_line(event), flush=True)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    # Single-run detail path.
+    if resolved_id is not None:
         detail = None
         source = "sqlite"
         if not args.no_rest:
-            detail = fetch_run_detail_via_rest(args.url, resolved_id, args.timeout)
+            try:
+                detail = fetch_run_detail_via_rest(
+                    args.url, resolved_id, args.timeout, pool=pool
+                )
+            except (RuntimeError, ValueError) as e:
+                # 5xx or malformed JSON — fall back to SQLite like an
+                # unreachable server.
+                print(f"WARNING: {e}", file=sys.stderr)
+                detail = None
             if detail is not None:
                 source = "rest"
         if detail is None:
-            detail = fetch_run_detail_via_sqlite(resolved_id)
+            detail = fetch_run_detail_via_sqlite(resolved_id, db=db)
         if detail is None:
             print(f"Run {args.run_id} not found.", file=sys.stderr)
             return 1
@@ -391,8 +981,8 @@ def main() -> int:
     source = "sqlite"
     if not args.no_rest:
         try:
-            runs = fetch_via_rest(args.url, args.timeout)
-        except RuntimeError as e:
+            runs = fetch_via_rest(args.url, args.timeout, pool=pool)
+        except (RuntimeError, ValueError) as e:
             print(f"WARNING: {e}", file=sys.stderr)
             runs = None
         if runs is not None:
@@ -400,18 +990,52 @@ def main() -> int:
             # REST returns everything; apply local filters for parity.
             if running_only:
                 runs = [r for r in runs if r.get("status") == "running"]
+            # REST payload is usually newest-first but don't assume.
+            runs.sort(key=lambda r: _parse_cursor(run_cursor(r)), reverse=True)
+            if args.before is not None:
+                cursor = _parse_cursor(args.before)
+                runs = [r for r in runs if _parse_cursor(run_cursor(r)) < cursor]
             if limit is not None:
-                # REST payload is usually newest-first but don't assume.
-                runs.sort(key=lambda r: r.get("started_at", ""), reverse=True)
                 runs = runs[:limit]
     if runs is None:
-        runs = fetch_via_sqlite(running_only=running_only, limit=limit)
+        runs = fetch_via_sqlite(
+            running_only=running_only, limit=limit, before=args.before, db=db
+        )
+
+    if args.events:
+        run_ids = [r["id"] for r in runs if r.get("id")]
+        if source == "rest":
+            details = fetch_run_details(
+                run_ids, args.url, args.timeout,
+                pool=pool, max_workers=max(1, args.parallel), db=db,
+            )
+            for r in runs:
+                detail, events_source = details.get(r.get("id"), (None, "sqlite"))
+                r["events"] = (detail or {}).get("events", [])
+                r["events_source"] = events_source
+        else:
+            events = fetch_events_via_sqlite(run_ids, db=db)
+            for r in runs:
+                r.setdefault("events", events.get(r.get("id"), []))
 
+    next_cursor = None
+    if runs and limit is not None and len(runs) == limit:
+        next_cursor = run_cursor(runs[-1])
     if args.json:
-        print(json.dumps({"source": source, "runs": runs}, indent=2, default=str))
+        print(json.dumps(
+            {"source": source, "runs": runs, "next_cursor": next_cursor},
+            indent=2,
+            default=str,
+        ))
     else:
-        print(f"Source: {source}  ({'archon serve' if source == 'rest' else str(ARCHON_DB_PATH)})")
+        print(f"Source: {source}  ({'archon serve' if source == 'rest' else str(db.path)})")
         print(format_table(runs))
+        if args.events:
+            for r in runs:
+                for e in r.get("events", []):
+                    print(format_event_line({**e, "workflow_run_id": r.get("id")}))
+        if next_cursor is not None:
+            print(f"Next page: --before '{next_cursor}'")
     return 0
 
 
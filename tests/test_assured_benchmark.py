@@ -0,0 +1,97 @@
+"""Tests for the Assured pipeline benchmark harness."""
+
+from pathlib import Path
+
+import pytest
+
+from sdlc_assured_scripts.assured.benchmark import (
+    STAGES,
+    BenchmarkResult,
+    find_regressions,
+    generate_synthetic_project,
+    main,
+    read_baseline,
+    read_baseline_params,
+    run_benchmarks,
+    write_baseline,
+)
+from sdlc_assured_scripts.assured.ids import build_id_registry
+
+
+def test_generate_synthetic_project_is_deterministic(tmp_path: Path) -> None:
+    a = generate_synthetic_project(tmp_path / "a", n_specs=3, n_sources=25, seed=7)
+    b = generate_synthetic_project(tmp_path / "b", n_specs=3, n_sources=25, seed=7)
+
+    assert len(a.source_files) == 25
+    assert len(a.decomposition.programs[0].sub_programs[0].modules) == 2
+    assert [f.read_text() for f in a.source_files] == [
+        f.read_text() for f in b.source_files
+    ]
+    records = build_id_registry(a.root)
+    assert len(records) == 3 * 5 * 3
+    assert all(r.id in a.spec_module_lookup for r in records)
+
+
+def test_annotation_density_controls_annotations(tmp_path: Path) -> None:
+    none = generate_synthetic_project(tmp_path / "n", n_sources=5, annotation_density=0)
+    full = generate_synthetic_project(tmp_path / "f", n_sources=5, annotation_density=1)
+
+    assert not any("implements:" in f.read_text() for f in none.source_files)
+    assert all(f.read_text().count("implements:") == 4 for f in full.source_files)
+
+
+def test_run_benchmarks_times_every_stage(tmp_path: Path) -> None:
+    project = generate_synthetic_project(tmp_path, n_specs=2, n_sources=10)
+
+    results = run_benchmarks(project, rounds=2)
+
+    assert [r.name for r in results] == list(STAGES)
+    assert all(r.rounds == 2 and 0 <= r.min <= r.mean <= r.max for r in results)
+    with pytest.raises(ValueError, match="nope"):
+        run_benchmarks(project, only=["nope"])
+
+
+def test_baseline_round_trip_and_regression_check(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    write_baseline(
+        [
+            BenchmarkResult("scan", 3, 1.0, 1.1, 1.2),
+            BenchmarkResult("x", 3, 0.5, 0.5, 0.5),
+        ],
+        path,
+        {"specs": 1},
+    )
+    baseline = read_baseline(path)
+
+    current = [
+        BenchmarkResult("scan", 3, 1.3, 1.3, 1.3),
+        BenchmarkResult("x", 3, 0.55, 0.6, 0.7),
+        BenchmarkResult("new", 3, 9.0, 9.0, 9.0),
+    ]
+
+    assert baseline is not None and baseline["scan"].min == 1.0
+    regressions = find_regressions(current, baseline, threshold=0.25)
+    assert len(regressions) == 1 and regressions[0].startswith("scan:")
+    assert read_baseline(tmp_path / "missing.json") is None
+
+
+def test_main_writes_then_checks_baseline(tmp_path: Path, capsys) -> None:
+    baseline = tmp_path / "bench.json"
+    args = ["--specs", "1", "--sources", "3", "--rounds", "1", "--stage", "export_csv"]
+
+    assert main(args + ["--baseline", str(baseline), "--update-baseline"]) == 0
+    assert list(read_baseline(baseline)) == ["export_csv"]
+    assert main(args + ["--baseline", str(baseline), "--threshold", "1000"]) == 0
+    assert "export_csv" in capsys.readouterr().out
+
+
+def test_main_refuses_baseline_with_different_params(tmp_path: Path, capsys) -> None:
+    baseline = tmp_path / "bench.json"
+    args = ["--specs", "1", "--rounds", "1", "--stage", "export_csv"]
+
+    assert main(args + ["--sources", "3", "--baseline", str(baseline), "--update-baseline"]) == 0
+    assert read_baseline_params(baseline)["sources"] == 3
+    capsys.readouterr()
+
+    assert main(args + ["--sources", "4", "--baseline", str(baseline)]) == 2
+    assert "refusing to compare" in capsys.readouterr().out
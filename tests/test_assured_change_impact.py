@@ -0,0 +1,110 @@
+"""Tests for assured.change_impact — indexed change-impact engine."""
+
+import json
+from pathlib import Path
+
+from sdlc_assured_scripts.assured.change_impact import (
+    ChangeImpactEngine,
+    render_impact_report,
+)
+from sdlc_assured_scripts.assured.evidence_index import EvidenceIndexEntry, EvidenceKind
+from sdlc_assured_scripts.assured.ids import IdRecord
+from sdlc_assured_scripts.assured.trace_graph import TraceGraph
+from sdlc_assured_scripts.assured.traceability_validators import change_impact_gate
+
+
+def _registry() -> list[IdRecord]:
+    return [
+        IdRecord(id="REQ-auth-001", kind="REQ", source="r.md", satisfies=[]),
+        IdRecord(id="REQ-auth-002", kind="REQ", source="r.md", satisfies=[]),
+        IdRecord(
+            id="DES-auth-001", kind="DES", source="d.md", satisfies=["REQ-auth-001"]
+        ),
+        IdRecord(
+            id="DES-auth-002", kind="DES", source="d.md", satisfies=["REQ-auth-002"]
+        ),
+        IdRecord(
+            id="TEST-auth-001", kind="TEST", source="t.md", satisfies=["DES-auth-001"]
+        ),
+        IdRecord(
+            id="TEST-auth-002", kind="TEST", source="t.md", satisfies=["DES-auth-002"]
+        ),
+    ]
+
+
+def _evidence() -> list[EvidenceIndexEntry]:
+    return [
+        EvidenceIndexEntry(
+            kind=EvidenceKind.PYTHON_COMMENT,
+            source="src/auth/login.py",
+            line=3,
+            cited_ids=["DES-auth-001"],
+        ),
+        EvidenceIndexEntry(
+            kind=EvidenceKind.PYTHON_COMMENT,
+            source="src/auth/logout.py",
+            line=5,
+            cited_ids=["DES-auth-002", "DES-auth-404"],
+        ),
+    ]
+
+
+def test_impact_walks_des_to_req_and_picks_up_verifying_tests() -> None:
+    engine = ChangeImpactEngine(_registry(), _evidence())
+    report = engine.impact(["src/auth/login.py"])
+    assert report.cited == {"src/auth/login.py": ["DES-auth-001"]}
+    assert report.impacted["DES"] == ["DES-auth-001"]
+    assert report.impacted["REQ"] == ["REQ-auth-001"]
+    assert report.impacted["TEST"] == ["TEST-auth-001"]
+    assert report.unmapped_files == []
+    assert report.dangling == []
+
+
+def test_impact_reports_unmapped_files_and_dangling_ids(tmp_path: Path) -> None:
+    engine = ChangeImpactEngine(TraceGraph.from_records(_registry()), _evidence())
+    report = engine.impact(
+        [tmp_path / "src" / "auth" / "logout.py", tmp_path / "README.md"],
+        project_root=tmp_path,
+    )
+    assert report.changed_files == ["src/auth/logout.py", "README.md"]
+    assert report.unmapped_files == ["README.md"]
+    assert report.dangling == ["DES-auth-404"]
+    assert report.impacted["TEST"] == ["TEST-auth-002"]
+
+
+def test_render_impact_report_is_stable_json() -> None:
+    engine = ChangeImpactEngine(_registry(), _evidence())
+    text = render_impact_report(engine.impact(["src/auth/login.py"]))
+    assert text == render_impact_report(engine.impact(["src/auth/login.py"]))
+    assert json.loads(text)["impacted"]["REQ"] == ["REQ-auth-001"]
+
+
+def test_change_impact_gate_matches_on_whole_path_components(tmp_path: Path) -> None:
+    impacts_dir = tmp_path / "docs" / "change-impacts"
+    impacts_dir.mkdir(parents=True)
+    (impacts_dir / "CHG-002.md").write_text(
+        "- src/auth/login.py: rewrite\n- src/billing: all\n"
+    )
+    result = change_impact_gate(
+        changed_code_files=[
+            tmp_path / "src" / "auth" / "login.py",
+            tmp_path / "src" / "billing" / "invoice.py",
+            tmp_path / "mysrc" / "auth" / "login.py.bak",
+        ],
+        change_impact_records_dir=impacts_dir,
+        enabled=True,
+    )
+    assert len(result.errors) == 1
+    assert "login.py.bak" in result.errors[0]
+
+
+def test_change_impact_gate_accepts_trailing_slash_directory_citation(tmp_path: Path) -> None:
+    impacts_dir = tmp_path / "docs" / "change-impacts"
+    impacts_dir.mkdir(parents=True)
+    (impacts_dir / "CHG-003.md").write_text("- src/auth/: rework login\n- ./src/billing/: all\n")
+    result = change_impact_gate(
+        changed_code_files=[Path("src/auth/login.py"), Path("src/billing/invoice.py")],
+        change_impact_records_dir=impacts_dir,
+        enabled=True,
+    )
+    assert result.passed, result.errors
@@ -10,6 +10,7 @@ from sdlc_assured_scripts.assured.decomposition import (
     DecompositionParseError,
     ImportEdge,
     Module,
+    ModulePathIndex,
     PathSection,
     Program,
     SpecArtefact,
@@ -21,6 +22,7 @@ from sdlc_assured_scripts.assured.decomposition import (
     granularity_match,
     parse_programs_yaml,
     req_has_module_assignment,
+    run_annotation_validators,
     visibility_rule_enforcement,
 )
 
@@ -735,3 +737,96 @@ def test_forward_annotation_completeness_skips_pass_only_body(
     decomp = _decomp_for_path(tmp_path / "src")
     result = forward_annotation_completeness(source_paths=[f], decomp=decomp)
     assert result.passed is True
+
+
+# ---------------------------------------------------------------------------
+# ModulePathIndex + combined annotation runner
+# ---------------------------------------------------------------------------
+
+
+def _two_module_decomp() -> Decomposition:
+    modules = [
+        Module(
+            id="M1",
+            name="Auth",
+            paths=["src/auth/"],
+            granularity="requirement",
+            structure="flat",
+        ),
+        Module(
+            id="M2",
+            name="Auth OAuth",
+            paths=["src/auth/oauth/", "lib/oauth"],
+            granularity="module",
+            structure="flat",
+        ),
+    ]
+    sub_program = SubProgram(id="SP1", name="SP1", modules=modules)
+    program = Program(id="P1", name="P1", description=None, sub_programs=[sub_program])
+    return Decomposition(programs=[program])
+
+
+def test_module_path_index_matches_startswith_semantics() -> None:
+    """The trie answers exactly what a per-module startswith scan would."""
+    index = ModulePathIndex.for_decomposition(_two_module_decomp())
+
+    assert index.modules_covering("src/auth/oauth/login.py") == {
+        "P1.SP1.M1",
+        "P1.SP1.M2",
+    }
+    assert index.modules_covering("src/auth/session.py") == {"P1.SP1.M1"}
+    assert index.modules_covering("lib/oauth_helpers.py") == {"P1.SP1.M2"}
+    assert index.modules_covering("src/billing/x.py") == frozenset()
+    assert index.is_under("src/auth/session.py", "P1.SP1.M1")
+    assert not index.is_under("src/auth/session.py", "P1.SP1.M2")
+    assert index.owner("src/auth/oauth/login.py") == "P1.SP1.M2"
+    assert index.owner("src/billing/x.py") is None
+
+
+def test_module_path_index_is_shared_per_decomposition() -> None:
+    decomp = _two_module_decomp()
+
+    shared = ModulePathIndex.for_decomposition(decomp)
+
+    assert ModulePathIndex.for_decomposition(decomp) is shared
+    assert ModulePathIndex.for_decomposition(_two_module_decomp()) is not shared
+
+
+def test_run_annotation_validators_matches_individual_validators() -> None:
+    """One pass yields the same results as the three validators called separately."""
+    decomp = _two_module_decomp()
+    annotations = [
+        CodeAnnotation("src/auth/session.py", 3, ["REQ-a-001"]),
+        CodeAnnotation("src/billing/pay.py", 9, ["REQ-a-002", "DES-a-001"]),
+        CodeAnnotation("lib/oauth/flow.py", 12, ["REQ-o-001", "REQ-unknown-001"]),
+        CodeAnnotation("src/auth/token.py", 4, ["REQ-o-001"]),
+    ]
+    lookup = {
+        "REQ-a-001": "P1.SP1.M1",
+        "REQ-a-002": "P1.SP1.M1",
+        "REQ-a-003": "P1.SP1.M1",
+        "DES-a-001": "P1.SP1.M1",
+        "REQ-o-001": "P1.SP1.M2",
+    }
+    declared_reqs = ["REQ-a-001", "REQ-a-002", "REQ-a-003", "REQ-o-001"]
+    satisfies_graph = {"DES-a-001": ["REQ-a-003"]}
+
+    combined = run_annotation_validators(
+        annotations,
+        decomp,
+        lookup,
+        declared_reqs=declared_reqs,
+        satisfies_graph=satisfies_graph,
+    )
+
+    assert combined["code_annotation_maps_to_module"] == code_annotation_maps_to_module(
+        annotations, decomp, lookup
+    )
+    assert combined["anaemic_context_detection"] == anaemic_context_detection(
+        annotations, decomp, lookup
+    )
+    assert combined["granularity_match"] == granularity_match(
+        declared_reqs, annotations, decomp, lookup, satisfies_graph
+    )
+    assert len(combined["code_annotation_maps_to_module"].errors) == 3
+    assert combined["anaemic_context_detection"].passed is False
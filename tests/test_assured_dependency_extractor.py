@@ -8,11 +8,16 @@ from sdlc_assured_scripts.assured.dependency_extractor import (
     ImportEdge,
     PythonAstExtractor,
     GenericRegexExtractor,
+    MultiLanguageRegexExtractor,
+    make_kotlin_extractor,
+    make_multi_language_extractor,
     make_swift_extractor,
+    make_typescript_extractor,
     render_dependency_edges,
     parse_dependency_edges,
     build_dependency_edges,
 )
+from sdlc_assured_scripts.assured.source_corpus import SourceCorpus
 from sdlc_assured_scripts.assured.decomposition import (
     Decomposition,
     Module,
@@ -311,3 +316,94 @@ visibility:
     result = visibility_rule_enforcement(parsed, decomp, mode="strict")
     assert result.passed is False
     assert any("P1.SP1.M1" in e and "P1.SP1.M2" in e for e in result.errors)
+
+
+def _three_module_tree(tmp_path: Path) -> tuple[Decomposition, dict[str, Path]]:
+    dirs = {name: tmp_path / "src" / name for name in ("app", "auth", "net")}
+    modules = []
+    for i, (name, d) in enumerate(dirs.items(), start=1):
+        d.mkdir(parents=True)
+        modules.append(
+            Module(
+                id=f"M{i}",
+                name=name,
+                paths=[str(d) + "/"],
+                granularity="requirement",
+                structure="flat",
+            )
+        )
+    sp = SubProgram(id="SP1", name="SP1", modules=modules)
+    p = Program(id="P1", name="P1", description=None, sub_programs=[sp])
+    return Decomposition(programs=[p], visibility=[]), dirs
+
+
+def test_kotlin_and_typescript_extractors_resolve_targets(tmp_path: Path) -> None:
+    decomp, dirs = _three_module_tree(tmp_path)
+    kt = dirs["app"] / "Main.kt"
+    kt.write_text(
+        "package app\n\nimport com.acme.auth.LoginService\nimport com.acme.net.*\n"
+    )
+    (dirs["auth"] / "LoginService.kt").write_text("class LoginService\n")
+    ts = dirs["app"] / "screen.tsx"
+    ts.write_text("import { get } from '../net/client';\nimport React from 'react';\n")
+    client = dirs["net"] / "client.ts"
+    client.write_text("export const get = 1;\n")
+
+    kotlin_edges = make_kotlin_extractor().extract(
+        [kt, dirs["auth"] / "LoginService.kt", client], decomp
+    )
+    assert kotlin_edges == [
+        ImportEdge(from_module="P1.SP1.M1", to_module="P1.SP1.M2"),
+        ImportEdge(from_module="P1.SP1.M1", to_module="P1.SP1.M3"),
+    ]
+    ts_edges = make_typescript_extractor().extract([ts, client], decomp)
+    assert ts_edges == [ImportEdge(from_module="P1.SP1.M1", to_module="P1.SP1.M3")]
+
+
+def test_multi_language_extractor_reads_each_file_once(tmp_path: Path) -> None:
+    decomp, dirs = _three_module_tree(tmp_path)
+    files = [
+        dirs["app"] / "AppView.swift",
+        dirs["app"] / "Main.kt",
+        dirs["app"] / "index.ts",
+        dirs["auth"] / "Auth.swift",
+        dirs["net"] / "client.ts",
+    ]
+    files[0].write_text("import auth\n")
+    files[1].write_text("import com.acme.net.Client\n")
+    files[2].write_text("import { get } from './../net/client';\n")
+    files[3].write_text("public struct Auth {}\n")
+    files[4].write_text("export const get = 1;\n")
+
+    corpus = SourceCorpus()
+    extractor = make_multi_language_extractor()
+    assert isinstance(extractor, MultiLanguageRegexExtractor)
+    assert isinstance(extractor, DependencyExtractor)
+    assert extractor.language == "swift+kotlin+typescript"
+    edges = extractor.extract(files, decomp, corpus=corpus)
+    assert sorted((e.from_module, e.to_module) for e in edges) == [
+        ("P1.SP1.M1", "P1.SP1.M2"),
+        ("P1.SP1.M1", "P1.SP1.M3"),
+    ]
+    assert corpus.reads == len(files)
+
+
+def test_build_dependency_edges_calls_two_argument_extractors(tmp_path: Path) -> None:
+    class LegacyExtractor:
+        language = "legacy"
+
+        def extract(self, source_paths, programs):
+            return [ImportEdge(from_module="P1.SP1.M1", to_module="P1.SP1.M3")]
+
+    decomp, dirs = _three_module_tree(tmp_path)
+    swift = dirs["app"] / "AppView.swift"
+    swift.write_text("import auth\n")
+    auth = dirs["auth"] / "Auth.swift"
+    auth.write_text("public struct Auth {}\n")
+    edges = build_dependency_edges(
+        [swift, auth], decomp, [LegacyExtractor(), make_swift_extractor()]
+    )
+    assert [(e.from_module, e.to_module) for e in edges] == [
+        ("P1.SP1.M1", "P1.SP1.M2"),
+        ("P1.SP1.M1", "P1.SP1.M3"),
+    ]
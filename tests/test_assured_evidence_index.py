@@ -147,3 +147,25 @@ def test_registry_dispatches_python_and_markdown_files(tmp_path: Path) -> None:
     assert EvidenceKind.MARKDOWN_HTML_COMMENT in kinds
     assert any(e.cited_ids == ["DES-x-001"] for e in entries)
     assert any(e.cited_ids == ["DES-x-002"] for e in entries)
+
+
+def test_registry_calls_two_argument_adapters_without_corpus(tmp_path: Path) -> None:
+    class LegacyAdapter:
+        file_extensions = (".txt",)
+
+        def extract(self, files, project_root):
+            return [
+                EvidenceIndexEntry(
+                    kind=EvidenceKind.SATISFIES_BY_EXISTENCE,
+                    source=str(f.relative_to(project_root)),
+                    line=None,
+                    cited_ids=["REQ-x-001"],
+                )
+                for f in files
+            ]
+
+    txt = tmp_path / "a.txt"
+    txt.write_text("x\n")
+    registry = EvidenceIndexRegistry([LegacyAdapter(), PythonCommentAdapter()])
+    entries = list(registry.scan([txt], project_root=tmp_path))
+    assert [e.source for e in entries] == ["a.txt"]
@@ -1,5 +1,9 @@
 """Tests for assured.export — standard-specific traceability formats."""
 
+import csv
+import io
+import types
+
 from sdlc_assured_scripts.assured.ids import IdRecord
 from sdlc_assured_scripts.assured.evidence_index import EvidenceIndexEntry, EvidenceKind
 from sdlc_assured_scripts.assured.requirement_metadata import RequirementMetadata
@@ -10,6 +14,13 @@ from sdlc_assured_scripts.assured.export import (
     export_iec_62304_matrix,
     export_iso_26262_asil_matrix,
     export_markdown,
+    iter_rows,
+    write_csv,
+    write_do178c_rtm,
+    write_fda_dhf_structure,
+    write_iec_62304_matrix,
+    write_iso_26262_asil_matrix,
+    write_markdown,
 )
 from sdlc_assured_scripts.assured.evidence_status import EvidenceStatus
 
@@ -202,3 +213,52 @@ def test_export_do178c_rtm_recognises_markdown_evidence_in_source_code_column()
     out = export_do178c_rtm(records, evidence, metadata)
     assert "plugins/sdlc-x/skills/foo/SKILL.md" in out
     assert "MISSING" not in out
+
+
+def test_writers_stream_same_bytes_as_string_exporters() -> None:
+    records, evidence = _three_id_chain()
+    pairs = [
+        (export_do178c_rtm, write_do178c_rtm),
+        (export_iec_62304_matrix, write_iec_62304_matrix),
+        (export_iso_26262_asil_matrix, write_iso_26262_asil_matrix),
+        (export_fda_dhf_structure, write_fda_dhf_structure),
+        (export_markdown, write_markdown),
+        (export_csv, write_csv),
+    ]
+    for export_fn, write_fn in pairs:
+        buf = io.StringIO()
+        write_fn(records, evidence, {}, buf)
+        assert buf.getvalue() == export_fn(records, evidence, metadata={})
+
+
+def test_iter_rows_is_lazy() -> None:
+    records, evidence = _three_id_chain()
+    rows = iter_rows(records, evidence, {})
+    assert isinstance(rows, types.GeneratorType)
+    assert next(rows) == (
+        "REQ-auth-001",
+        "DES-auth-001",
+        "TEST-auth-001",
+        "src/auth/login.py:10",
+    )
+
+
+def test_write_csv_quotes_cells_instead_of_rewriting_commas() -> None:
+    records = [
+        IdRecord(id="REQ-cfg-001", kind="REQ", source="r.md", satisfies=[]),
+        IdRecord(
+            id="DES-cfg-001", kind="DES", source="d.md", satisfies=["REQ-cfg-001"]
+        ),
+    ]
+    metadata = {
+        "REQ-cfg-001": RequirementMetadata(
+            req_id="REQ-cfg-001",
+            evidence_status=EvidenceStatus.CONFIGURATION_ARTIFACT,
+            justification="limits.yaml, section 2",
+        )
+    }
+    buf = io.StringIO()
+    write_csv(records, [], metadata, buf)
+    parsed = list(csv.reader(io.StringIO(buf.getvalue())))
+    assert parsed[1][3] == "config: limits.yaml, section 2"
+    assert "config: limits.yaml; section 2" in export_csv(records, [], metadata)
@@ -0,0 +1,127 @@
+"""Tests for assured.module_graph — SCC, closure, layering and export."""
+
+import json
+from pathlib import Path
+
+from sdlc_assured_scripts.assured.decomposition import (
+    Decomposition,
+    ImportEdge,
+    Layer,
+    Module,
+    Program,
+    SubProgram,
+    parse_programs_yaml,
+)
+from sdlc_assured_scripts.assured.module_graph import (
+    ModuleGraph,
+    dependency_cycle_detection,
+    layering_rule_enforcement,
+)
+
+
+def _e(a: str, b: str) -> ImportEdge:
+    return ImportEdge(from_module=f"P1.SP1.{a}", to_module=f"P1.SP1.{b}")
+
+
+def _decomp(n: int, layers: list[Layer] | None = None) -> Decomposition:
+    modules = [
+        Module(
+            id=f"M{i}",
+            name=f"M{i}",
+            paths=[f"src/m{i}/"],
+            granularity="requirement",
+            structure="flat",
+        )
+        for i in range(1, n + 1)
+    ]
+    sp = SubProgram(id="SP1", name="SP1", modules=modules)
+    return Decomposition(
+        programs=[Program(id="P1", name="P1", description=None, sub_programs=[sp])],
+        layers=layers or [],
+    )
+
+
+def test_cycles_and_sccs() -> None:
+    edges = [_e("M1", "M2"), _e("M2", "M3"), _e("M3", "M1"), _e("M3", "M4")]
+    graph = ModuleGraph.from_decomposition(_decomp(5), edges)
+    assert graph.cycles() == [["P1.SP1.M1", "P1.SP1.M2", "P1.SP1.M3"]]
+    sccs = graph.strongly_connected_components()
+    # Dependencies come before dependents.
+    assert sccs.index(["P1.SP1.M4"]) < sccs.index(
+        ["P1.SP1.M1", "P1.SP1.M2", "P1.SP1.M3"]
+    )
+    assert ["P1.SP1.M5"] in sccs
+
+
+def test_transitive_reachability() -> None:
+    edges = [_e("M1", "M2"), _e("M2", "M3"), _e("M3", "M2"), _e("M3", "M4")]
+    graph = ModuleGraph(edges)
+    assert graph.reachable_from("P1.SP1.M1") == [
+        "P1.SP1.M2",
+        "P1.SP1.M3",
+        "P1.SP1.M4",
+    ]
+    assert graph.can_reach("P1.SP1.M2", "P1.SP1.M2")
+    assert not graph.can_reach("P1.SP1.M1", "P1.SP1.M1")
+    assert not graph.can_reach("P1.SP1.M4", "P1.SP1.M1")
+    assert graph.reachable_from("P1.SP1.M99") == []
+
+
+def test_long_chain_does_not_recurse() -> None:
+    edges = [
+        ImportEdge(from_module=f"M{i}", to_module=f"M{i + 1}") for i in range(5000)
+    ]
+    graph = ModuleGraph(edges)
+    assert graph.cycles() == []
+    assert graph.can_reach("M0", "M5000")
+
+
+def test_layering_violations_and_validators() -> None:
+    layers = [
+        Layer(name="app", modules=["P1.SP1.M1"]),
+        Layer(name="domain", modules=["P1.SP1.M2", "P1.SP1.M3"]),
+    ]
+    decomp = _decomp(3, layers)
+    edges = [_e("M1", "M2"), _e("M2", "M3"), _e("M3", "M1")]
+    graph = ModuleGraph.from_decomposition(decomp, edges)
+    assert graph.layering_violations(layers) == [_e("M3", "M1")]
+
+    advisory = layering_rule_enforcement(edges, decomp)
+    assert advisory.passed is True
+    assert advisory.warnings == [
+        "layering violation: P1.SP1.M3 (domain) → P1.SP1.M1 (app)"
+    ]
+    strict = dependency_cycle_detection(edges, decomp, mode="strict")
+    assert strict.passed is False
+    assert "P1.SP1.M1 ↔ P1.SP1.M2 ↔ P1.SP1.M3" in strict.errors[0]
+
+
+def test_dot_and_json_export() -> None:
+    layers = [
+        Layer(name="top", modules=["P1.SP1.M1"]),
+        Layer(name="low", modules=["P1.SP1.M2"]),
+    ]
+    graph = ModuleGraph([_e("M1", "M2"), _e("M2", "M1")])
+    dot = graph.to_dot(layers)
+    assert dot.startswith("digraph modules {")
+    assert '"P1.SP1.M2" -> "P1.SP1.M1" [color=red, style=dashed];' in dot
+    payload = json.loads(graph.to_json(layers))
+    assert payload["cycles"] == [["P1.SP1.M1", "P1.SP1.M2"]]
+    assert payload["layering_violations"] == [["P1.SP1.M2", "P1.SP1.M1"]]
+
+
+def test_parse_programs_yaml_reads_optional_layers(tmp_path: Path) -> None:
+    pyaml = tmp_path / "programs.yaml"
+    pyaml.write_text("""schema_version: 1
+programs: []
+layers:
+  - name: app
+    modules: [P1.SP1.M1]
+  - name: core
+    modules: [P1.SP1.M2]
+""")
+    parsed = parse_programs_yaml(pyaml)
+    assert parsed.layers == [
+        Layer(name="app", modules=["P1.SP1.M1"]),
+        Layer(name="core", modules=["P1.SP1.M2"]),
+    ]
@@ -0,0 +1,82 @@
+"""Tests for assured.registry_cache — versioned JSON-lines registry snapshot."""
+
+from pathlib import Path
+
+from sdlc_assured_scripts.assured.evidence_status import EvidenceStatus
+from sdlc_assured_scripts.assured.registry_cache import (
+    DEFAULT_CACHE_PATH,
+    build_registry_snapshot,
+    is_fresh,
+    load_registry_snapshot,
+    read_registry_cache,
+    write_registry_cache,
+)
+
+
+def _project(root: Path) -> list[Path]:
+    spec_dir = root / "docs" / "specs" / "auth"
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "requirements-spec.md").write_text(
+        "### REQ-auth-001\n\n"
+        "**Evidence-Status:** not_applicable\n"
+        "**Justification:** handled upstream\n"
+        "**Related:** REQ-auth-002\n\n"
+        "### REQ-auth-002\n"
+    )
+    (spec_dir / "design-spec.md").write_text(
+        "### DES-auth-001\n\n**satisfies:** REQ-auth-001\n"
+    )
+    src = root / "src" / "login.py"
+    src.parent.mkdir()
+    src.write_text("def login():\n    # implements: DES-auth-001\n    pass\n")
+    return [src]
+
+
+def test_round_trip_preserves_records_metadata_and_evidence(tmp_path: Path) -> None:
+    files = _project(tmp_path)
+    snapshot = build_registry_snapshot(tmp_path, files)
+    cache = tmp_path / "cache.jsonl"
+    write_registry_cache(snapshot, cache)
+    loaded = read_registry_cache(cache)
+    assert loaded == snapshot
+    assert loaded.metadata["REQ-auth-001"].evidence_status == (
+        EvidenceStatus.NOT_APPLICABLE
+    )
+    assert [e.source for e in loaded.evidence] == ["src/login.py"]
+
+
+def test_freshness_tracks_spec_and_evidence_changes(tmp_path: Path) -> None:
+    files = _project(tmp_path)
+    snapshot = build_registry_snapshot(tmp_path, files)
+    assert is_fresh(snapshot, tmp_path, files)
+    files[0].write_text("# implements: DES-auth-002\n")
+    assert not is_fresh(snapshot, tmp_path, files)
+    snapshot = build_registry_snapshot(tmp_path, files)
+    (tmp_path / "docs" / "specs" / "auth" / "test-spec.md").write_text("# new\n")
+    assert not is_fresh(snapshot, tmp_path, files)
+
+
+def test_load_reuses_fresh_cache_and_rebuilds_stale_one(tmp_path: Path) -> None:
+    files = _project(tmp_path)
+    first = load_registry_snapshot(tmp_path, files)
+    cache = tmp_path / DEFAULT_CACHE_PATH
+    assert cache.is_file()
+    mtime = cache.stat().st_mtime_ns
+    assert load_registry_snapshot(tmp_path, files) == first
+    assert cache.stat().st_mtime_ns == mtime
+
+    design = tmp_path / "docs" / "specs" / "auth" / "design-spec.md"
+    design.write_text(
+        design.read_text() + "\n### DES-auth-002\n\n**satisfies:** REQ-auth-002\n"
+    )
+    rebuilt = load_registry_snapshot(tmp_path, files)
+    assert "DES-auth-002" in {r.id for r in rebuilt.records}
+
+
+def test_unreadable_or_wrong_version_cache_is_ignored(tmp_path: Path) -> None:
+    cache = tmp_path / "cache.jsonl"
+    assert read_registry_cache(cache) is None
+    cache.write_text('{"type":"header","format_version":999}\n')
+    assert read_registry_cache(cache) is None
+    cache.write_text("not json\n")
+    assert read_registry_cache(cache) is None
@@ -1,5 +1,7 @@
 """Tests for assured.render — module-scoped traceability render."""
 
+from pathlib import Path
+
 from sdlc_assured_scripts.assured.code_index import CodeIndexEntry
 from sdlc_assured_scripts.assured.decomposition import (
     Decomposition,
@@ -11,6 +13,7 @@ from sdlc_assured_scripts.assured.decomposition import (
 )
 from sdlc_assured_scripts.assured.ids import IdRecord
 from sdlc_assured_scripts.assured.render import (
+    render_all_module_scopes,
     render_module_dependency_graph,
     render_module_scope,
 )
@@ -119,3 +122,54 @@ def test_render_module_dependency_graph_handles_zero_edges() -> None:
     decomp = _two_module_decomp()
     output = render_module_dependency_graph(decomp, [])
     assert "_(no module-to-module dependencies detected)_" in output
+
+
+def _multi_module_fixture() -> tuple[list[IdRecord], list[CodeIndexEntry], dict]:
+    records = []
+    lookup = {}
+    code = []
+    for m in range(1, 4):
+        module = f"P1.SP1.M{m}"
+        req, des = f"REQ-m{m}-001", f"DES-m{m}-001"
+        records.append(IdRecord(id=req, kind="REQ", source="r.md", satisfies=[]))
+        records.append(IdRecord(id=des, kind="DES", source="d.md", satisfies=[req]))
+        lookup[req] = lookup[des] = module
+        code.append(CodeIndexEntry(file_path=f"src/m{m}.py", line=m, cited_ids=[des]))
+    code.append(
+        CodeIndexEntry(
+            file_path="src/shared.py", line=1, cited_ids=["DES-m1-001", "DES-m2-001"]
+        )
+    )
+    code.append(
+        CodeIndexEntry(file_path="src/orphan.py", line=9, cited_ids=["DES-x-404"])
+    )
+    return records, code, lookup
+
+
+def test_render_all_module_scopes_matches_per_module_render() -> None:
+    records, code, lookup = _multi_module_fixture()
+    modules = ["P1.SP1.M1", "P1.SP1.M2", "P1.SP1.M3", "P1.SP1.M9"]
+    pages = render_all_module_scopes(modules, records, code, lookup)
+    assert list(pages) == modules
+    for module in modules:
+        assert pages[module] == render_module_scope(module, records, code, lookup)
+    assert "src/shared.py:1" in pages["P1.SP1.M2"]
+    assert "src/orphan.py:9" in pages["P1.SP1.M9"]
+
+
+def test_render_all_module_scopes_writes_pages_in_parallel(tmp_path: Path) -> None:
+    records, code, lookup = _multi_module_fixture()
+    modules = ["P1.SP1.M1", "P1.SP1.M2", "P1.SP1.M3"]
+    graph = render_module_dependency_graph(_two_module_decomp(), [])
+    pages = render_all_module_scopes(
+        modules,
+        records,
+        code,
+        lookup,
+        output_dir=tmp_path / "traceability",
+        dependency_graph=graph,
+        workers=3,
+    )
+    for module in modules:
+        written = (tmp_path / "traceability" / f"{module}.md").read_text()
+        assert written == pages[module] + "\n" + graph
@@ -0,0 +1,160 @@
+"""Tests for assured.source_corpus — shared memoised text/AST cache."""
+
+from pathlib import Path
+
+import pytest
+
+from sdlc_assured_scripts.assured.decomposition import (
+    Decomposition,
+    Module,
+    Program,
+    SubProgram,
+    forward_annotation_completeness,
+)
+from sdlc_assured_scripts.assured.dependency_extractor import (
+    PythonAstExtractor,
+    build_dependency_edges,
+)
+from sdlc_assured_scripts.assured.evidence_index import EvidenceIndexRegistry
+from sdlc_assured_scripts.assured.source_corpus import SourceCorpus
+from sdlc_assured_scripts.assured.traceability_validators import (
+    annotation_format_integrity,
+)
+
+
+def _two_module_decomp(root: Path) -> Decomposition:
+    modules = [
+        Module(
+            id="M1",
+            name="A",
+            paths=[str(root / "src" / "a")],
+            granularity="requirement",
+            structure="flat",
+        ),
+        Module(
+            id="M2",
+            name="B",
+            paths=[str(root / "src" / "b")],
+            granularity="requirement",
+            structure="flat",
+        ),
+    ]
+    return Decomposition(
+        programs=[
+            Program(
+                id="P1",
+                name="P",
+                description=None,
+                sub_programs=[SubProgram(id="SP1", name="SP", modules=modules)],
+            )
+        ]
+    )
+
+
+def _write_tree(root: Path) -> list[Path]:
+    (root / "src" / "a").mkdir(parents=True)
+    (root / "src" / "b").mkdir(parents=True)
+    a = root / "src" / "a" / "alpha.py"
+    a.write_text(
+        "from b import beta\n\n"
+        "def run(x):\n"
+        "    # implements: DES-demo-001\n"
+        "    return beta.go(x)\n"
+    )
+    b = root / "src" / "b" / "beta.py"
+    b.write_text("def go(x):\n    # implements: DES-demo-002\n    return x + 1\n")
+    return [a, b]
+
+
+def test_text_lines_and_tree_are_memoised(tmp_path: Path) -> None:
+    f = tmp_path / "m.py"
+    f.write_text("x = 1\ny = 2\n")
+    corpus = SourceCorpus()
+    assert corpus.text(f) == "x = 1\ny = 2\n"
+    assert corpus.lines(f) == ["x = 1", "y = 2"]
+    assert corpus.tree(f) is corpus.tree(f)
+    assert corpus.reads == 1
+    assert corpus.parses == 1
+    assert f in corpus
+
+
+def test_errors_propagate_and_are_not_cached(tmp_path: Path) -> None:
+    corpus = SourceCorpus()
+    missing = tmp_path / "missing.py"
+    with pytest.raises(OSError):
+        corpus.text(missing)
+    assert len(corpus) == 0
+    bad = tmp_path / "bad.py"
+    bad.write_text("def broken(:\n")
+    with pytest.raises(SyntaxError):
+        corpus.tree(bad)
+    bad.write_text("def fixed():\n    pass\n")
+    corpus.clear()
+    assert corpus.tree(bad).body
+
+
+def test_lru_eviction_respects_byte_budget(tmp_path: Path) -> None:
+    files = []
+    for i in range(4):
+        f = tmp_path / f"f{i}.py"
+        f.write_text("#" * 10)
+        files.append(f)
+    corpus = SourceCorpus(max_bytes=25)
+    corpus.text(files[0])
+    corpus.text(files[1])
+    corpus.text(files[0])  # touch: f1 is now least recently used
+    corpus.text(files[2])
+    assert files[1] not in corpus
+    assert files[0] in corpus and files[2] in corpus
+    assert corpus.cached_bytes <= 25
+
+
+def test_oversized_entry_is_still_cached(tmp_path: Path) -> None:
+    f = tmp_path / "big.py"
+    f.write_text("#" * 100)
+    corpus = SourceCorpus(max_bytes=10)
+    corpus.text(f)
+    corpus.text(f)
+    assert corpus.reads == 1
+
+
+def test_rejects_non_positive_budget() -> None:
+    with pytest.raises(ValueError):
+        SourceCorpus(max_bytes=0)
+
+
+def test_shared_corpus_parses_each_file_once_across_validators(
+    tmp_path: Path,
+) -> None:
+    files = _write_tree(tmp_path)
+    decomp = _two_module_decomp(tmp_path)
+    corpus = SourceCorpus()
+
+    completeness = forward_annotation_completeness(files, decomp, corpus=corpus)
+    edges = build_dependency_edges(
+        files, decomp, [PythonAstExtractor()], corpus=corpus
+    )
+    integrity = annotation_format_integrity(
+        files, {"DES-demo-001", "DES-demo-002"}, corpus=corpus
+    )
+    evidence = list(
+        EvidenceIndexRegistry.with_default_adapters().scan(
+            files, tmp_path, corpus=corpus
+        )
+    )
+
+    assert completeness.passed is True
+    assert [(e.from_module, e.to_module) for e in edges] == [
+        ("P1.SP1.M1", "P1.SP1.M2")
+    ]
+    assert integrity.passed is True
+    assert len(evidence) == 2
+    assert corpus.reads == 2
+    assert corpus.parses == 2
+
+
+def test_validators_still_work_without_a_corpus(tmp_path: Path) -> None:
+    files = _write_tree(tmp_path)
+    decomp = _two_module_decomp(tmp_path)
+    assert forward_annotation_completeness(files, decomp).passed is True
+    assert annotation_format_integrity(files, {"DES-demo-001"}).passed is False
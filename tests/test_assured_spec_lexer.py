@@ -0,0 +1,61 @@
+"""Tests for the shared spec line classifier."""
+
+from pathlib import Path
+
+from sdlc_assured_scripts.assured.evidence_status import EvidenceStatus
+from sdlc_assured_scripts.assured.ids import build_id_registry
+from sdlc_assured_scripts.assured.requirement_metadata import (
+    build_requirement_metadata_registry,
+)
+from sdlc_assured_scripts.assured.spec_lexer import (
+    FIELD,
+    HEADING,
+    SpecEvent,
+    SpecEventCache,
+    lex_spec,
+)
+
+
+def test_lex_spec_classifies_headings_and_fields() -> None:
+    text = (
+        "# Title\n"
+        "### REQ-auth-001 — login\n"
+        "**Evidence-status:** linked\n"
+        "```\n"
+        "### REQ-auth-999\n"
+        "**satisfies:** REQ-auth-998\n"
+        "```\n"
+        "### P1.SP1.M1.DES-002\n"
+        "**satisfies:** REQ-auth-001\n"
+        "plain **satisfies:** not a field\n"
+    )
+
+    assert lex_spec(text) == [
+        SpecEvent(HEADING, 2, "REQ", "REQ-auth-001"),
+        SpecEvent(FIELD, 3, "Evidence-status", "linked"),
+        SpecEvent(HEADING, 8, "DES", "P1.SP1.M1.DES-002"),
+        SpecEvent(FIELD, 9, "satisfies", "REQ-auth-001"),
+    ]
+
+
+def test_shared_cache_reads_each_spec_once(tmp_path: Path) -> None:
+    feature = tmp_path / "docs" / "specs" / "auth"
+    feature.mkdir(parents=True)
+    (feature / "requirements-spec.md").write_text(
+        "### REQ-auth-001\n**Evidence-status:** linked\n**Related:** REQ-auth-002\n"
+    )
+    (feature / "design-spec.md").write_text(
+        "### DES-auth-001\n**satisfies:** REQ-auth-001\n"
+    )
+    cache = SpecEventCache()
+
+    records = build_id_registry(tmp_path, spec_cache=cache)
+    metadata = build_requirement_metadata_registry(tmp_path, spec_cache=cache)
+
+    assert cache.reads == 2
+    assert [(r.id, r.satisfies) for r in records] == [
+        ("DES-auth-001", ["REQ-auth-001"]),
+        ("REQ-auth-001", []),
+    ]
+    assert metadata["REQ-auth-001"].evidence_status == EvidenceStatus.LINKED
+    assert metadata["REQ-auth-001"].related == ["REQ-auth-002"]
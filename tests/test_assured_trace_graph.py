@@ -0,0 +1,64 @@
+"""Tests for assured.trace_graph — shared precomputed traceability graph."""
+
+from sdlc_assured_scripts.assured.ids import IdRecord
+from sdlc_assured_scripts.assured.trace_graph import TraceGraph
+from sdlc_assured_scripts.assured.traceability_validators import (
+    backward_coverage,
+    cited_ids_resolve,
+    forward_link_integrity,
+    id_uniqueness,
+    orphan_ids,
+)
+
+
+def _records() -> list[IdRecord]:
+    return [
+        IdRecord(id="REQ-a-001", kind="REQ", source="r.md", satisfies=[]),
+        IdRecord(id="DES-a-001", kind="DES", source="d.md", satisfies=["REQ-a-001"]),
+        IdRecord(id="TEST-a-001", kind="TEST", source="t.md", satisfies=["DES-a-001"]),
+        IdRecord(id="TEST-a-002", kind="TEST", source="t.md", satisfies=["DES-a-999"]),
+        IdRecord(id="REQ-a-001", kind="REQ", source="r2.md", satisfies=[]),
+    ]
+
+
+def test_from_records_builds_all_indexes() -> None:
+    graph = TraceGraph.from_records(_records())
+    assert graph.by_id["REQ-a-001"].source == "r.md"
+    assert [r.source for r in graph.declarations["REQ-a-001"]] == ["r.md", "r2.md"]
+    assert graph.forward["DES-a-001"] == ["REQ-a-001"]
+    assert [r.id for r in graph.cited_by("DES-a-001")] == ["TEST-a-001"]
+    assert [r.id for r in graph.cited_by("DES-a-999")] == ["TEST-a-002"]
+    assert not graph.is_declared("DES-a-999")
+    assert [r.id for r in graph.of_kind("TEST")] == ["TEST-a-001", "TEST-a-002"]
+    assert graph.duplicates() == ["REQ-a-001"]
+
+
+def test_has_child_of_kind_filters_by_record_kind() -> None:
+    graph = TraceGraph.from_records(_records())
+    assert graph.has_child_of_kind("REQ-a-001", "DES")
+    assert not graph.has_child_of_kind("REQ-a-001", "TEST")
+    assert graph.cited_by("DES-a-001", kind="DES") == []
+
+
+def test_validators_give_same_result_with_shared_graph() -> None:
+    records = _records()
+    graph = TraceGraph.from_records(records)
+    for validator in (
+        id_uniqueness,
+        cited_ids_resolve,
+        orphan_ids,
+        forward_link_integrity,
+        backward_coverage,
+    ):
+        assert validator(records, graph=graph) == validator(records)
+
+
+def test_id_uniqueness_scales_with_large_duplicate_cluster() -> None:
+    records = [
+        IdRecord(id=f"REQ-big-{i % 500:03d}", kind="REQ", source=f"s{i}.md", satisfies=[])
+        for i in range(50_000)
+    ]
+    result = id_uniqueness(records)
+    assert result.passed is False
+    assert len(result.errors) == 500
+    assert result.errors[0].startswith("duplicate ID 'REQ-big-000' declared in: s0.md, s500.md")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Tests for build_team_fleet — parallel regeneration and rebuild of team images."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from sdlc_workflows_scripts import build_team_fleet
+
+
+class FakeBuilder:
+    """In-memory ImageBuilder that records build order and concurrency."""
+
+    def __init__(self, fail: tuple[str, ...] = (), images: tuple[str, ...] = build_team_fleet.BASE_IMAGES) -> None:
+        self.images = set(images)
+        self.fail = fail
+        self.built: list[str] = []
+        self.labels: dict[str, dict[str, str]] = {}
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def image_exists(self, tag: str) -> bool:
+        return tag in self.images
+
+    def image_label(self, tag: str, key: str) -> str | None:
+        return self.labels.get(tag, {}).get(key)
+
+    def build(self, tag: str, dockerfile: Path, context_dir: Path, labels: dict[str, str]) -> None:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            assert dockerfile.read_text().startswith("# Auto-generated Dockerfile")
+            if tag.split(":")[1] in self.fail:
+                raise RuntimeError("boom")
+            with self._lock:
+                self.built.append(tag)
+                self.labels[tag] = labels
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _fleet(tmp_path: Path) -> tuple[Path, Path]:
+    """Four teams over two plugin sets; 'gamma' is current."""
+    installed: dict[str, dict[str, str]] = {}
+    for name in ("core", "sec"):
+        plugin_dir = tmp_path / "plugins" / "cache" / "mkt" / name / "1.0.0"
+        (plugin_dir / "agents").mkdir(parents=True)
+        (plugin_dir / "agents" / "lead.md").write_text("---\nname: lead\n---\n")
+        installed[f"{name}@mkt"] = {"installPath": str(plugin_dir)}
+    installed_json = tmp_path / "installed_plugins.json"
+    installed_json.write_text(json.dumps(installed))
+
+    teams_dir = tmp_path / "teams"
+    teams_dir.mkdir()
+    teams = {
+        "alpha": ("core", "sec"),
+        "beta": ("core", "sec"),
+        "delta": ("core",),
+        "gamma": ("core",),
+    }
+    for team, plugins in teams.items():
+        lines = [f"name: {team}", "plugins:"]
+        lines += [f"  - {p}" for p in plugins]
+        lines.append(f"agents:\n  - {plugins[0]}:lead")
+        lines.append("updated: '2026-01-01T00:00:00+00:00'")
+        if team == "gamma":
+            lines.append("image_built: '2026-02-01T00:00:00+00:00'")
+        (teams_dir / f"{team}.yaml").write_text("\n".join(lines) + "\n")
+    return teams_dir, installed_json
+
+
+def test_schedule_seeds_one_team_per_plugin_set(tmp_path: Path) -> None:
+    plans = [
+        build_team_fleet.TeamBuildPlan(n, Path(n), "stale", p, Path(), Path(), f"sdlc-worker:{n}")
+        for n, p in [("b", ("x",)), ("a", ("x",)), ("c", ("y",)), ("d", ("x",))]
+    ]
+
+    waves = build_team_fleet.schedule_builds(plans)
+
+    assert [[p.name for p in wave] for wave in waves] == [["a", "c"], ["b", "d"]]
+
+
+def test_build_fleet_rebuilds_only_stale_teams(tmp_path: Path) -> None:
+    teams_dir, installed_json = _fleet(tmp_path)
+    builder = FakeBuilder(fail=("delta",))
+
+    report = build_team_fleet.build_fleet(
+        teams_dir, installed_json, builder, context_dir=tmp_path, max_builds=2,
+    )
+
+    assert report.skipped == ["gamma"]
+    assert [(r.name, r.status, r.wave) for r in report.results] == [
+        ("alpha", "built", 0),
+        ("beta", "built", 1),
+        ("delta", "failed", 0),
+    ]
+    assert builder.peak <= 2
+    assert (teams_dir / ".generated" / "beta-CLAUDE.md").is_file()
+    assert "image_built:" in (teams_dir / "alpha.yaml").read_text()
+    assert "image_built:" not in (teams_dir / "delta.yaml").read_text()
+    assert build_team_fleet.select_teams(
+        build_team_fleet.teams_status_report.load_manifests(teams_dir)
+    )[0]["name"] == "delta"
+
+
+def test_build_fleet_dry_run_and_missing_base_images(tmp_path: Path) -> None:
+    teams_dir, installed_json = _fleet(tmp_path)
+
+    report = build_team_fleet.build_fleet(
+        teams_dir, installed_json, FakeBuilder(images=()), dry_run=True, only=["beta"],
+    )
+
+    assert [(r.name, r.status) for r in report.results] == [("beta", "generated")]
+    assert (teams_dir / ".generated" / "beta.Dockerfile").is_file()
+    with pytest.raises(RuntimeError, match="sdlc-worker:base"):
+        build_team_fleet.build_fleet(teams_dir, installed_json, FakeBuilder(images=()))
+
+
+def test_second_run_rebuilds_only_teams_whose_content_changed(tmp_path: Path) -> None:
+    teams_dir, installed_json = _fleet(tmp_path)
+    builder = FakeBuilder()
+    build_team_fleet.build_fleet(teams_dir, installed_json, builder, context_dir=tmp_path)
+    assert "image_digest:" in (teams_dir / "alpha.yaml").read_text()
+
+    again = build_team_fleet.build_fleet(teams_dir, installed_json, builder, context_dir=tmp_path)
+    assert again.results == [] and again.skipped == ["alpha", "beta", "delta", "gamma"]
+
+    sec_lead = tmp_path / "plugins" / "cache" / "mkt" / "sec" / "1.0.0" / "agents" / "lead.md"
+    sec_lead.write_text("---\nname: lead\ndescription: changed\n---\n")
+    (tmp_path / "plugins" / "cache" / "mkt" / "core" / "1.0.0" / "agents" / "lead.md").touch()
+
+    third = build_team_fleet.build_fleet(teams_dir, installed_json, builder, context_dir=tmp_path)
+    assert third.skipped == ["alpha", "beta", "delta", "gamma"]
+
+    manifest = teams_dir / "beta.yaml"
+    manifest.write_text(manifest.read_text().replace("  - core:lead", "  - sec:lead"))
+    fourth = build_team_fleet.build_fleet(teams_dir, installed_json, builder, context_dir=tmp_path)
+    assert [(r.name, r.staleness) for r in fourth.results] == [("beta", "stale")]
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Tests for coaching_signals — tiered coaching signal analysis."""
 
+import json
+from datetime import datetime, timezone
 from pathlib import Path
 
 from sdlc_workflows_scripts import coaching_signals
@@ -112,3 +114,86 @@ class TestOverrideSignals:
             tmp_path / "nonexistent.jsonl"
         )
         assert signals == []
+
+
+class TestIncrementalOverrideAnalysis:
+    NOW = datetime(2026, 5, 31, 12, tzinfo=timezone.utc)
+
+    @staticmethod
+    def _append(log_path: Path, *entries: tuple[str, str, str]) -> None:
+        with log_path.open("a") as fh:
+            for team, agent, timestamp in entries:
+                fh.write(json.dumps({"timestamp": timestamp, "team": team, "agent": agent}) + "\n")
+
+    def test_windows_and_checkpoint_resume(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "overrides.jsonl"
+        self._append(
+            log_path,
+            ("dev", "sec:architect", "2026-04-01T09:00:00+00:00"),
+            ("ops", "sec:architect", "2026-05-10T09:00:00+00:00"),
+            ("dev", "sec:architect", "2026-05-30T09:00:00+00:00"),
+            ("dev", "qa:tester", "2026-05-31T08:00:00+00:00"),
+        )
+
+        signals = coaching_signals.analyse_overrides(log_path, threshold=3, now=self.NOW)
+
+        assert len(signals) == 1
+        assert signals[0]["count"] == 3 and signals[0]["teams"] == "dev, ops"
+        assert (signals[0]["last_7_days"], signals[0]["last_30_days"]) == (1, 2)
+        checkpoint = json.loads(coaching_signals.checkpoint_path(log_path).read_text())
+        assert checkpoint["offset"] == log_path.stat().st_size
+        assert "2026-04-01" not in checkpoint["agents"]["sec:architect"]["days"]
+
+        self._append(
+            log_path,
+            ("dev", "qa:tester", "2026-05-31T09:00:00+00:00"),
+            ("dev", "qa:tester", "2026-05-31T10:00:00+00:00"),
+        )
+        aggregate = coaching_signals.update_override_aggregate(log_path, now=self.NOW)
+
+        assert aggregate.agents["qa:tester"]["count"] == 3
+        assert aggregate.agents["sec:architect"]["count"] == 3
+        assert aggregate.window_counts("qa:tester", self.NOW) == {
+            "last_7_days": 3, "last_30_days": 3,
+        }
+
+    def test_resume_reads_only_new_lines(self, tmp_path: Path, monkeypatch) -> None:
+        log_path = tmp_path / "overrides.jsonl"
+        self._append(log_path, ("dev", "a", "2026-05-30T09:00:00+00:00"))
+        coaching_signals.update_override_aggregate(log_path, now=self.NOW)
+        self._append(log_path, ("dev", "a", "2026-05-31T09:00:00+00:00"))
+
+        offsets = []
+        real_scan = coaching_signals.override_logger.scan_overrides
+
+        def spy(path: Path, offset: int = 0):
+            offsets.append(offset)
+            return real_scan(path, offset)
+
+        monkeypatch.setattr(coaching_signals.override_logger, "scan_overrides", spy)
+        aggregate = coaching_signals.update_override_aggregate(log_path, now=self.NOW)
+
+        assert offsets[0] > 0
+        assert aggregate.agents["a"]["count"] == 2
+
+    def test_rewritten_log_is_recounted(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "overrides.jsonl"
+        self._append(log_path, *[("dev", "a", "2026-05-30T09:00:00+00:00")] * 3)
+        coaching_signals.update_override_aggregate(log_path, now=self.NOW)
+
+        log_path.write_text("")
+        self._append(log_path, *[("dev", "b", "2026-05-30T09:00:00+00:00")] * 4)
+        aggregate = coaching_signals.update_override_aggregate(log_path, now=self.NOW)
+
+        assert list(aggregate.agents) == ["b"]
+        assert aggregate.agents["b"]["count"] == 4
+
+    def test_corrupt_checkpoint_rebuilds(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "overrides.jsonl"
+        self._append(log_path, *[("dev", "a", "2026-05-30T09:00:00+00:00")] * 3)
+        coaching_signals.checkpoint_path(log_path).write_text("{not json")
+
+        signals = coaching_signals.analyse_overrides(log_path, now=self.NOW, persist=False)
+
+        assert signals[0]["count"] == 3
+        assert coaching_signals.checkpoint_path(log_path).read_text() == "{not json"
@@ -60,6 +60,31 @@ class TestReadOverrides:
         assert entries == []
 
 
+class TestIterOverrides:
+    def test_resumes_from_offset(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "overrides.jsonl"
+        override_logger.log_override(log_path, "t1", "a1", "w1", "n1")
+        first = list(override_logger.iter_overrides(log_path))
+        assert [e["agent"] for _, e in first] == ["a1"]
+        offset = first[-1][0]
+        assert offset == log_path.stat().st_size
+
+        override_logger.log_override(log_path, "t2", "a2", "w2", "n2")
+        rest = list(override_logger.iter_overrides(log_path, offset))
+        assert [e["agent"] for _, e in rest] == ["a2"]
+
+    def test_skips_malformed_and_leaves_partial_line(self, tmp_path: Path) -> None:
+        log_path = tmp_path / "overrides.jsonl"
+        log_path.write_text('{"agent": "a1"}\nnot json\n\n{"agent": "a2"}\n{"agent": "a3"')
+        scanned = list(override_logger.scan_overrides(log_path))
+        assert [e and e["agent"] for _, e in scanned] == ["a1", None, "a2"]
+        assert scanned[-1][0] == len('{"agent": "a1"}\nnot json\n\n{"agent": "a2"}\n')
+        assert [e["agent"] for e in override_logger.read_overrides(log_path)] == ["a1", "a2"]
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        assert list(override_logger.iter_overrides(tmp_path / "nope.jsonl")) == []
+
+
 class TestConcurrentAppend:
     """CR-M-4: concurrent appends to the JSONL log must not lose or corrupt entries.
 
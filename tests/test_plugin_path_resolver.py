@@ -2,6 +2,7 @@
 """Tests for resolve_plugin_paths — plugin name to filesystem path resolution."""
 
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -167,3 +168,49 @@ class TestResolveAll:
         msg = str(err)
         assert "a@m" in msg
         assert "b@m" in msg
+
+
+# ---------------------------------------------------------------------------
+# PluginRegistry — shared, mtime-invalidated cache
+# ---------------------------------------------------------------------------
+
+
+class TestPluginRegistry:
+    """Tests for resolve_plugin_paths.PluginRegistry."""
+
+    def test_for_path_reuses_registry_until_file_changes(self, tmp_path: Path) -> None:
+        """The same registry is returned until the file's mtime/size changes."""
+        root = make_installed_plugins(
+            tmp_path,
+            [("sdlc-core", "ai-first-sdlc", "1.0.0")],
+        )
+        json_path = root / "installed_plugins.json"
+        first = resolve_plugin_paths.PluginRegistry.for_path(json_path)
+        assert resolve_plugin_paths.PluginRegistry.for_path(json_path) is first
+
+        data = json.loads(json_path.read_text())
+        data["extra@m"] = {"installPath": str(tmp_path / "extra")}
+        json_path.write_text(json.dumps(data))
+        os.utime(json_path, ns=(first.signature[0] + 10**9,) * 2)
+
+        second = resolve_plugin_paths.PluginRegistry.for_path(json_path)
+        assert second is not first
+        assert second.lookup("extra") == tmp_path / "extra"
+
+    def test_lookup_prefers_exact_key_then_bare_name(self, tmp_path: Path) -> None:
+        """A full key hits its own entry; other marketplaces fall back to bare name."""
+        json_path = tmp_path / "installed_plugins.json"
+        json_path.write_text(json.dumps({
+            "version": 2,
+            "plugins": {
+                "tool@a": [{"installPath": "/a/tool"}],
+                "tool@b": [{"scope": "user"}, {"installPath": "/b/tool"}],
+            },
+        }))
+        registry = resolve_plugin_paths.PluginRegistry.for_path(json_path)
+
+        assert registry.by_key == {"tool@a": Path("/a/tool"), "tool@b": Path("/b/tool")}
+        assert registry.by_bare_name == {"tool": Path("/a/tool")}
+        assert registry.lookup("tool@b") == Path("/b/tool")
+        assert registry.lookup("tool@c") == Path("/a/tool")
+        assert registry.first_entries()["tool@b"] == {"scope": "user"}
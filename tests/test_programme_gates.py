@@ -1,12 +1,20 @@
 """Tests for plugins.sdlc-programme.scripts.programme.gates."""
+
+import json
 import shutil
 from pathlib import Path
 
+from sdlc_programme_scripts.programme import gates as gates_module
 from sdlc_programme_scripts.programme.gates import (
+    CodeScanCache,
     GateResult,
     code_gate,
+    code_tree_gate,
     design_gate,
+    render_gate_report,
     requirements_gate,
+    run_all_gates,
+    scan_code_citations,
 )
 
 # Aliased to prevent pytest from auto-collecting `test_gate` (the function
@@ -14,7 +22,6 @@ from sdlc_programme_scripts.programme.gates import (
 # `test_`, or pytest will still try to collect it.
 from sdlc_programme_scripts.programme.gates import test_gate as run_test_gate
 
-
 REPO_ROOT = Path(__file__).parent.parent
 SAMPLE_FEATURE = REPO_ROOT / "tests/fixtures/programme/feature-sample"
 
@@ -219,3 +226,172 @@ def test_requirements_gate_passes_when_mandatory_sections_populated(tmp_path: Pa
     )
     result = requirements_gate(feature_dir, feature_id="auth")
     assert result.passed is True
+
+
+def _copy_features(tmp_path: Path, *names: str) -> Path:
+    """Copy the sample fixture once per name under tmp_path/specs/<name>/."""
+    specs = tmp_path / "specs"
+    for name in names:
+        dst = specs / name
+        shutil.copytree(SAMPLE_FEATURE, dst)
+        for spec in dst.glob("*-spec.md"):
+            text = spec.read_text().replace("sample", name)
+            spec.write_text(text)
+    return specs
+
+
+def test_run_all_gates_parses_each_spec_once_per_feature(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """All gates for one feature share a parse cache."""
+    specs = _copy_features(tmp_path, "alpha", "beta")
+    calls: list[tuple[Path, str]] = []
+    real_parse = gates_module.parse_spec
+
+    def counting_parse(path: Path, phase: str):
+        calls.append((path, phase))
+        return real_parse(path, phase=phase)
+
+    monkeypatch.setattr(gates_module, "parse_spec", counting_parse)
+    code_text = "# implements: TEST-alpha-001\n"
+
+    report = run_all_gates(specs, code_text=code_text)
+
+    assert sorted(report.features) == ["alpha", "beta"]
+    assert [r.gate_name for r in report.features["alpha"]] == [
+        "requirements",
+        "design",
+        "test",
+        "code",
+    ]
+    assert len(calls) == len(set(calls)) == 6
+    assert all(r.passed for r in report.features["alpha"])
+    assert report.features["beta"][-1].passed is False
+    assert report.passed is False
+
+
+def test_run_all_gates_code_text_checks_each_feature_own_ids(tmp_path: Path) -> None:
+    """A shared code_text must not fail a feature on another feature's IDs."""
+    specs = _copy_features(tmp_path, "alpha", "beta")
+    code_text = (
+        "# implements: TEST-alpha-001\n"
+        "# implements: TEST-beta-001\n"
+        "# implements: TEST-beta-999\n"
+    )
+
+    report = run_all_gates(specs, code_text=code_text)
+
+    alpha_code = report.features["alpha"][-1]
+    beta_code = report.features["beta"][-1]
+    assert alpha_code.gate_name == "code" and alpha_code.passed, alpha_code.errors
+    assert beta_code.errors == [
+        "<code_text>:3 references TEST-beta-999 which is not declared in test-spec.md"
+    ]
+
+
+def test_run_all_gates_workers_do_not_change_report(tmp_path: Path) -> None:
+    """workers > 1 (source-scan threads only) yields the same report."""
+    specs = _copy_features(tmp_path, "alpha", "beta", "gamma")
+    (specs / "beta" / "design-spec.md").unlink()
+    (specs / "notes").mkdir()
+
+    serial = run_all_gates(specs)
+    parallel = run_all_gates(specs, workers=4)
+
+    assert render_gate_report(parallel) == render_gate_report(serial)
+    assert list(serial.features) == ["alpha", "beta", "gamma"]
+    assert serial.features["alpha"][1].passed is True
+    assert serial.features["beta"][1].passed is False
+
+
+def test_render_gate_report_is_json(tmp_path: Path) -> None:
+    """The consolidated report serialises to JSON with per-gate errors."""
+    specs = _copy_features(tmp_path, "alpha")
+    (specs / "alpha" / "reviews" / "design-review-test.md").unlink()
+
+    payload = json.loads(render_gate_report(run_all_gates(specs)))
+
+    assert payload["passed"] is False
+    design = payload["features"]["alpha"][1]
+    assert design["gate_name"] == "design"
+    assert any("review record" in e for e in design["errors"])
+
+
+def _write_source_tree(root: Path) -> Path:
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "a.py").write_text(
+        "def a():\n    # implements: TEST-sample-001\n    return 1\n"
+    )
+    (root / "pkg" / "b.py").write_text("def b():\n    return 2\n")
+    (root / "pkg" / "c.py").write_text(
+        "# implements: TEST-sample-999, TEST-other-001\n"
+    )
+    (root / ".hidden").mkdir()
+    (root / ".hidden" / "d.py").write_text("# implements: TEST-sample-777\n")
+    return root
+
+
+def test_scan_code_citations_reports_path_and_line(tmp_path: Path) -> None:
+    """The tree scan yields per-file, per-line citations and skips hidden dirs."""
+    src = _write_source_tree(tmp_path / "src")
+
+    citations = scan_code_citations([src], suffixes=(".py",), workers=4)
+
+    assert [(Path(c.path).name, c.line, c.test_id) for c in citations] == [
+        ("a.py", 2, "TEST-sample-001"),
+        ("c.py", 1, "TEST-sample-999"),
+        ("c.py", 1, "TEST-other-001"),
+    ]
+
+
+def test_code_tree_gate_checks_only_this_features_citations(tmp_path: Path) -> None:
+    """Citations for other features are ignored; broken ones name path:line."""
+    feature_dir = _copy_feature(tmp_path)
+    src = _write_source_tree(tmp_path / "src")
+
+    result = code_tree_gate(feature_dir, "sample", source_roots=[src])
+
+    assert result.passed is False
+    assert len(result.errors) == 1
+    assert "c.py:1" in result.errors[0]
+    assert "TEST-sample-999" in result.errors[0]
+
+    (src / "pkg" / "c.py").unlink()
+    assert code_tree_gate(feature_dir, "sample", source_roots=[src]).passed is True
+
+
+def test_code_scan_cache_reuses_results_by_content_hash(
+    tmp_path: Path, monkeypatch
+) -> None:
+    """A persisted cache skips re-scanning files whose bytes are unchanged."""
+    src = _write_source_tree(tmp_path / "src")
+    cache_path = tmp_path / "cache.json"
+    first = CodeScanCache()
+    expected = scan_code_citations([src], cache=first)
+    first.save(cache_path)
+    assert len(first) == 2  # b.py has no annotation and is never hashed
+
+    def no_regex(*args, **kwargs):
+        raise AssertionError("cached file was rescanned")
+
+    monkeypatch.setattr(
+        gates_module, "_TEST_ID_REF_RE", type("R", (), {"search": no_regex})
+    )
+    reloaded = CodeScanCache.load(cache_path)
+
+    assert scan_code_citations([src], cache=reloaded) == expected
+    assert len(CodeScanCache.load(tmp_path / "missing.json")) == 0
+
+
+def test_run_all_gates_scans_source_tree_once(tmp_path: Path) -> None:
+    """source_roots adds a code gate per feature backed by one shared scan."""
+    feature_dir = _copy_feature(tmp_path)
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.py").write_text("# implements: TEST-sample-002\n")
+
+    report = run_all_gates(feature_dir.parent, source_roots=[src])
+
+    code = report.features["sample"][-1]
+    assert code.gate_name == "code"
+    assert code.passed is True
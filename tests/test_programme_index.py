@@ -0,0 +1,74 @@
+"""Tests for plugins.sdlc-programme.scripts.programme.programme_index."""
+import shutil
+from pathlib import Path
+
+from sdlc_programme_scripts.programme.programme_index import (
+    build_programme_index,
+    read_index,
+    write_index,
+)
+
+
+REPO_ROOT = Path(__file__).parent.parent
+SAMPLE_FEATURE = REPO_ROOT / "tests/fixtures/programme/feature-sample"
+
+
+def _specs(tmp_path: Path) -> Path:
+    """sample (full fixture) + tax, whose tests cite sample's DES."""
+    specs = tmp_path / "specs"
+    shutil.copytree(SAMPLE_FEATURE, specs / "sample")
+    tax = specs / "tax"
+    tax.mkdir()
+    (tax / "requirements-spec.md").write_text(
+        "**Feature-id:** tax\n\n## Requirements\n\n"
+        "### REQ-tax-001\nCharge.\n\n"
+        "### REQ-sample-001\nDuplicate declaration.\n"
+    )
+    (tax / "test-spec.md").write_text(
+        "**Feature-id:** tax\n\n## Test cases\n\n"
+        "### TEST-tax-001\n**satisfies:** REQ-tax-001\n\n"
+        "### TEST-tax-002\n**satisfies:** DES-sample-002, DES-tax-404\n"
+    )
+    (specs / "notes").mkdir()
+    return specs
+
+
+def test_index_resolves_coverage_across_features(tmp_path: Path) -> None:
+    """A TEST in one feature covers another feature's REQ through its DES."""
+    index = build_programme_index(_specs(tmp_path))
+
+    assert index.feature_of("TEST-tax-002") == "tax"
+    assert index.tests_covering("REQ-sample-002") == [
+        "TEST-sample-002",
+        "TEST-tax-002",
+    ]
+    assert index.tests_covering("REQ-tax-001") == ["TEST-tax-001"]
+    assert index.tests_covering("REQ-unknown-001") == []
+    assert index.cited_by("DES-sample-002") == ["TEST-sample-002", "TEST-tax-002"]
+    assert index.cross_feature_links() == [("TEST-tax-002", "DES-sample-002")]
+
+
+def test_index_reports_duplicates_and_dangling(tmp_path: Path) -> None:
+    """IDs declared twice and references to undeclared IDs are surfaced."""
+    specs = _specs(tmp_path)
+
+    index = build_programme_index(specs)
+
+    assert list(index.duplicates) == ["REQ-sample-001"]
+    assert index.entries["REQ-sample-001"].feature == "sample"  # first wins
+    assert index.dangling == {"DES-tax-404": ["TEST-tax-002"]}
+    assert index.errors == []
+
+
+def test_index_round_trips_through_json(tmp_path: Path) -> None:
+    """write_index / read_index persist the full index; bad files read as None."""
+    index = build_programme_index(_specs(tmp_path))
+    path = tmp_path / "out" / "programme-index.json"
+
+    write_index(index, path)
+    loaded = read_index(path)
+
+    assert loaded == index
+    path.write_text("{not json")
+    assert read_index(path) is None
+    assert read_index(tmp_path / "missing.json") is None
@@ -86,6 +86,14 @@ def test_parse_test_spec_extracts_test_ids_and_both_prior_phase_references(
         "DES-my-feature-001",
         "DES-my-feature-002",
     }
+    assert parsed.satisfies == {
+        "TEST-my-feature-001": {"REQ-my-feature-001", "DES-my-feature-001"},
+        "TEST-my-feature-002": {
+            "REQ-my-feature-002",
+            "REQ-my-feature-003",
+            "DES-my-feature-002",
+        },
+    }
 
 
 def test_parse_spec_missing_feature_id_raises(tmp_path: Path) -> None:
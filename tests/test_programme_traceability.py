@@ -1,4 +1,5 @@
 """Tests for plugins.sdlc-programme.scripts.programme.traceability."""
+import io
 import shutil
 from pathlib import Path
 
@@ -6,9 +7,13 @@ import pytest
 
 from sdlc_programme_scripts.programme.traceability import (
     TraceabilityError,
+    TraceabilityRow,
     build_matrix,
     export_csv,
     export_markdown,
+    iter_triples,
+    write_csv,
+    write_markdown,
 )
 
 
@@ -88,3 +93,48 @@ def test_build_matrix_missing_artefact_raises(tmp_path: Path) -> None:
 
     with pytest.raises(TraceabilityError, match="test-spec.md"):
         build_matrix(feature_dir, "sample")
+
+
+def test_build_matrix_resolves_tests_transitively_through_des(tmp_path: Path) -> None:
+    """A TEST citing only a DES covers every REQ that DES satisfies."""
+    feature_dir = _copy_feature(tmp_path)
+    test_spec = feature_dir / "test-spec.md"
+    test_spec.write_text(
+        test_spec.read_text().replace(
+            "**satisfies:** REQ-sample-002 via DES-sample-002",
+            "**satisfies:** DES-sample-001",
+        )
+    )
+
+    matrix = {row.req_id: row for row in build_matrix(feature_dir, "sample")}
+
+    assert matrix["REQ-sample-001"].test_ids == {"TEST-sample-001", "TEST-sample-002"}
+    assert matrix["REQ-sample-002"].test_ids == set()
+
+
+def test_write_exports_stream_the_same_text(tmp_path: Path) -> None:
+    """write_csv / write_markdown produce exactly what the string exports return."""
+    feature_dir = _copy_feature(tmp_path)
+    csv_buf, md_buf = io.StringIO(), io.StringIO()
+
+    write_csv(feature_dir, "sample", csv_buf)
+    write_markdown(feature_dir, "sample", md_buf)
+
+    assert csv_buf.getvalue() == export_csv(feature_dir, "sample")
+    assert md_buf.getvalue() == export_markdown(feature_dir, "sample")
+
+
+def test_iter_triples_expands_cartesian_product_lazily(tmp_path: Path) -> None:
+    """iter_triples yields one triple per (DES, TEST) pair, blanks for empties."""
+    rows = [
+        TraceabilityRow("REQ-x-001", {"DES-x-001", "DES-x-002"}, {"TEST-x-001"}),
+        TraceabilityRow("REQ-x-002"),
+    ]
+
+    triples = iter_triples(rows)
+
+    assert next(triples) == ("REQ-x-001", "DES-x-001", "TEST-x-001")
+    assert list(triples) == [
+        ("REQ-x-001", "DES-x-002", "TEST-x-001"),
+        ("REQ-x-002", "", ""),
+    ]
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Tests for generate_team_dockerfile layer layouts."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from sdlc_workflows_scripts import generate_team_dockerfile
+
+
+def _team(tmp_path: Path) -> tuple[Path, Path]:
+    """One plugin with an agent and a skill; the manifest also cites a missing agent."""
+    plugin_dir = tmp_path / "plugins" / "cache" / "mkt" / "core" / "1.0.0"
+    (plugin_dir / ".claude-plugin").mkdir(parents=True)
+    (plugin_dir / "agents").mkdir()
+    (plugin_dir / "agents" / "lead.md").write_text("---\nname: lead\n---\n")
+    (plugin_dir / "skills" / "check").mkdir(parents=True)
+    (plugin_dir / "skills" / "check" / "SKILL.md").write_text("# Check\n")
+    installed_json = tmp_path / "installed_plugins.json"
+    installed_json.write_text(json.dumps({"core@mkt": {"installPath": str(plugin_dir)}}))
+    manifest = tmp_path / "team.yaml"
+    manifest.write_text(
+        "name: team\nplugins: [core]\n"
+        "agents: [core:lead, core:missing]\nskills: [core:check]\n"
+    )
+    return manifest, installed_json
+
+
+def _generate(tmp_path: Path, layout: str) -> str:
+    manifest, installed_json = _team(tmp_path)
+    return generate_team_dockerfile.generate(
+        manifest, installed_json, Path("CLAUDE.md"), tmp_path / "out" / "team.Dockerfile",
+        layout=layout,
+    )
+
+
+def test_per_file_layout_copies_each_item_into_runtime_image(tmp_path: Path) -> None:
+    content = _generate(tmp_path, "per-file")
+
+    assert content.count("COPY --from=plugin-source") == 3
+    assert "FROM scratch" not in content
+    assert "# WARNING: agent 'missing' not found in core" in content
+
+
+def test_grouped_layout_stages_metadata_skills_agents_in_order(tmp_path: Path) -> None:
+    content = _generate(tmp_path, "grouped")
+    runtime = content.split("FROM sdlc-worker:base", 1)[1]
+
+    assert "COPY --from=plugin-source" not in runtime
+    assert [line.split()[1] for line in runtime.splitlines() if line.startswith("COPY --from=")] == [
+        "--from=stage-metadata",
+        "--from=stage-skills",
+        "--from=stage-agents",
+    ]
+    assert "# WARNING: agent 'missing' not found in core" in content
+
+
+def test_consolidated_layout_adds_one_plugin_layer(tmp_path: Path) -> None:
+    content = _generate(tmp_path, "consolidated")
+    runtime = content.split("FROM sdlc-worker:base", 1)[1]
+
+    assert content.count("FROM scratch AS stage-plugins") == 1
+    assert runtime.count("COPY --from=") == 1
+    with pytest.raises(ValueError, match="layout"):
+        _generate(tmp_path / "x", "per-layer")
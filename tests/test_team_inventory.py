@@ -2,6 +2,7 @@
 """Tests for team_inventory — plugin agent and skill discovery."""
 
 import json
+import os
 from pathlib import Path
 
 from sdlc_workflows_scripts import team_inventory
@@ -161,3 +162,93 @@ class TestInventoryForTeam:
         assert "sec-plugin:auditor" in names
         assert "sec-plugin:privacy" in names
         assert "sec-plugin:architect" not in names
+
+
+class TestPluginInventoryIndex:
+    def _plugin(self, tmp_path: Path) -> Path:
+        plugin_dir = tmp_path / "cache" / "mkt" / "sec-plugin" / "1.0.0"
+        (plugin_dir / "agents").mkdir(parents=True)
+        (plugin_dir / "agents" / "Architect.md").write_text(
+            "---\nname: architect\ndescription: Design\nmodel: opus\n---\n"
+        )
+        (plugin_dir / "skills" / "Validate").mkdir(parents=True)
+        (plugin_dir / "skills" / "Validate" / "SKILL.md").write_text(
+            "---\nname: validate\n---\n"
+        )
+        return plugin_dir
+
+    def test_index_is_persisted_beside_plugins_cache(self, tmp_path: Path) -> None:
+        plugin_dir = self._plugin(tmp_path)
+
+        inventory = team_inventory.load_plugin_inventory(plugin_dir)
+
+        index_file = tmp_path / "cache" / ".sdlc-inventory" / "mkt" / "sec-plugin" / "1.0.0.json"
+        assert json.loads(index_file.read_text())["agents"] == inventory.agents
+        assert inventory.agents[0]["frontmatter"]["model"] == "opus"
+        assert inventory.agent_file("architect") == plugin_dir / "agents" / "Architect.md"
+        assert inventory.skill_dir("VALIDATE") == plugin_dir / "skills" / "Validate"
+        assert inventory.agent_file("missing") is None
+
+    def test_index_rebuilt_when_directory_mtime_changes(self, tmp_path: Path) -> None:
+        plugin_dir = self._plugin(tmp_path)
+        index_dir = tmp_path / "index"
+        first = team_inventory.load_plugin_inventory(plugin_dir, index_dir)
+        assert team_inventory.load_plugin_inventory(plugin_dir, index_dir) is first
+
+        (plugin_dir / "agents" / "auditor.md").write_text("---\nname: auditor\n---\n")
+        os.utime(plugin_dir / "agents", ns=(first.signature[1] + 10**9,) * 2)
+        team_inventory.clear_memo()
+
+        names = [a["name"] for a in team_inventory.discover_plugin_agents(plugin_dir)]
+        assert names == ["architect", "auditor"]
+
+    def test_index_rebuilt_when_source_files_change_in_place(self, tmp_path: Path) -> None:
+        plugin_dir = self._plugin(tmp_path)
+        index_dir = tmp_path / "index"
+        (plugin_dir / "skills" / "Draft").mkdir()
+        first = team_inventory.load_plugin_inventory(plugin_dir, index_dir)
+        dir_mtimes = {d: d.stat().st_mtime_ns for d in (plugin_dir / "agents", plugin_dir / "skills")}
+
+        agent = plugin_dir / "agents" / "Architect.md"
+        agent.write_text("---\nname: architect\ndescription: Revised\n---\n")
+        os.utime(agent, ns=(first.signature[3] + 10**9,) * 2)
+        (plugin_dir / "skills" / "Draft" / "SKILL.md").write_text("---\nname: draft\n---\n")
+        (plugin_dir / "skills" / "Validate" / "SKILL.md").unlink()
+        for d, mtime in dir_mtimes.items():
+            os.utime(d, ns=(mtime, mtime))
+        team_inventory.clear_memo()
+
+        second = team_inventory.load_plugin_inventory(plugin_dir, index_dir)
+        assert second.agents[0]["description"] == "Revised"
+        assert [s["name"] for s in second.skills] == ["draft"]
+        assert second.skill_dir("validate") is None
+
+    def test_signature_checked_once_per_process(self, tmp_path: Path, monkeypatch) -> None:
+        plugin_dir = self._plugin(tmp_path)
+        index_dir = tmp_path / "index"
+        calls = []
+        real_signature = team_inventory._signature
+        monkeypatch.setattr(
+            team_inventory, "_signature", lambda p: calls.append(p) or real_signature(p)
+        )
+
+        first = team_inventory.load_plugin_inventory(plugin_dir, index_dir)
+        for _ in range(3):
+            assert team_inventory.load_plugin_inventory(plugin_dir, index_dir) is first
+        assert calls == [plugin_dir]
+
+    def test_malformed_index_is_a_cache_miss(self, tmp_path: Path) -> None:
+        plugin_dir = self._plugin(tmp_path)
+        index_dir = tmp_path / "index"
+        first = team_inventory.load_plugin_inventory(plugin_dir, index_dir)
+        index_file = index_dir / "mkt" / "sec-plugin" / "1.0.0.json"
+        data = json.loads(index_file.read_text())
+        del data["agents"]
+        data["skills"] = [{"name": "validate"}]
+        index_file.write_text(json.dumps(data))
+        team_inventory.clear_memo()
+
+        second = team_inventory.load_plugin_inventory(plugin_dir, index_dir)
+        assert second.agents == first.agents
+        assert second.skill_dir("validate") == plugin_dir / "skills" / "Validate"
+        assert "agents" in json.loads(index_file.read_text())
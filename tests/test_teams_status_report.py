@@ -184,3 +184,65 @@ class TestFleetReport:
         assert report["teams"][0]["name"] == "sec-team"
         assert report["teams"][0]["staleness"] == "current"
         assert report["teams"][0]["workflow_count"] == 1
+
+
+class TestContentDigest:
+    def _setup(self, tmp_path: Path) -> tuple[dict, Path, Path]:
+        plugin_dir = tmp_path / "cache" / "mkt" / "sdlc-core" / "1.0.0"
+        (plugin_dir / "agents").mkdir(parents=True)
+        (plugin_dir / "agents" / "architect.md").write_text("# Architect\n")
+        (plugin_dir / "skills" / "validate" / "refs").mkdir(parents=True)
+        (plugin_dir / "skills" / "validate" / "SKILL.md").write_text("# Validate\n")
+        (plugin_dir / "skills" / "validate" / "refs" / "a.md").write_text("a\n")
+        installed_json = tmp_path / "installed_plugins.json"
+        installed_json.write_text(
+            '{"sdlc-core@mkt": {"installPath": "%s"}}' % plugin_dir
+        )
+        teams_dir = tmp_path / "teams"
+        teams_dir.mkdir()
+        write_manifest(
+            teams_dir,
+            "sec-team",
+            agents="[sdlc-core:architect]",
+            skills="[sdlc-core:validate]",
+            updated="2026-04-10T12:00:00",
+            image_built="2026-04-12T12:00:00",
+        )
+        manifest = teams_status_report.load_manifests(teams_dir)[0]
+        return manifest, installed_json, plugin_dir
+
+    def test_digest_tracks_content_not_timestamps(self, tmp_path: Path) -> None:
+        manifest, installed_json, plugin_dir = self._setup(tmp_path)
+        digest = teams_status_report.content_digest(manifest, installed_json)
+
+        bumped = {**manifest, "updated": "2030-01-01T00:00:00", "image_digest": digest}
+        (plugin_dir / "agents" / "architect.md").touch()
+        assert teams_status_report.content_digest(bumped, installed_json) == digest
+
+        (plugin_dir / "skills" / "validate" / "refs" / "a.md").write_text("b\n")
+        assert teams_status_report.content_digest(manifest, installed_json) != digest
+
+    def test_digest_is_independent_of_install_root(self, tmp_path: Path) -> None:
+        manifest_a, installed_a, _ = self._setup(tmp_path / "alice")
+        manifest_b, installed_b, plugin_b = self._setup(tmp_path / "bob")
+
+        digest = teams_status_report.content_digest(manifest_a, installed_a)
+        assert teams_status_report.content_digest(manifest_b, installed_b) == digest
+
+        moved = plugin_b.parent / "2.0.0"
+        plugin_b.rename(moved)
+        installed_b.write_text('{"sdlc-core@mkt": {"installPath": "%s"}}' % moved)
+        assert teams_status_report.content_digest(manifest_b, installed_b) != digest
+
+    def test_staleness_compares_recorded_digest(self, tmp_path: Path) -> None:
+        manifest, installed_json, plugin_dir = self._setup(tmp_path)
+        digest = teams_status_report.content_digest(manifest, installed_json)
+        manifest["updated"] = "2030-01-01T00:00:00"
+
+        assert teams_status_report.staleness(manifest) == "stale"
+        assert teams_status_report.staleness(manifest, installed_json, digest) == "current"
+        (plugin_dir / "agents" / "architect.md").write_text("# Changed\n")
+        assert teams_status_report.staleness(manifest, installed_json, digest) == "stale"
+        assert teams_status_report.staleness(
+            {"name": "new"}, installed_json, None
+        ) == "not_built"
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Tests for workflow_dag — critical path and parallelism analysis."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from sdlc_workflows_scripts import workflow_dag
+
+
+def _workflow() -> dict:
+    """a -> (b, c, d) -> e, with c the slow branch; f is an independent root."""
+    return {
+        "name": "wf",
+        "nodes": [
+            {"id": "a", "timeout": 1000},
+            {"id": "b", "depends_on": ["a"], "timeout": 1000},
+            {"id": "c", "depends_on": ["a"], "timeout": 5000},
+            {"id": "d", "depends_on": ["a"], "timeout": 1000},
+            {"id": "e", "depends_on": ["b", "c", "d"], "timeout": 1000},
+            {"id": "f", "timeout": 2000},
+        ],
+    }
+
+
+def test_levels_and_critical_path() -> None:
+    report = workflow_dag.analyse_workflow(_workflow())
+
+    assert report.levels == [["a", "f"], ["b", "c", "d"], ["e"]]
+    assert report.critical_path == ["a", "c", "e"]
+    assert report.critical_path_ms == 7000
+    assert report.total_work_ms == 11000
+    assert report.max_width == 3
+    assert report.fan_outs == {"a": ["b", "c", "d"]}
+    # b and d fit beside c, and f beside a: two workers match the critical path.
+    assert report.recommended_concurrency == 2
+
+
+def test_history_overrides_timeout_and_loops_multiply() -> None:
+    workflow = _workflow()
+    workflow["nodes"].append(
+        {"id": "g", "depends_on": ["e"], "timeout": 100, "loop": {"max_iterations": 3}}
+    )
+
+    report = workflow_dag.analyse_workflow(workflow, history={"c": 500, "b": 4000})
+
+    assert report.durations_ms["g"] == 300
+    assert report.critical_path == ["a", "b", "e", "g"]
+    assert report.serial_levels == ["e"]
+
+
+def test_cycles_and_unknown_dependencies_are_rejected() -> None:
+    with pytest.raises(workflow_dag.WorkflowDagError, match="cycle"):
+        workflow_dag.topological_levels({"nodes": [
+            {"id": "x", "depends_on": ["y"]},
+            {"id": "y", "depends_on": ["x"]},
+        ]})
+    with pytest.raises(workflow_dag.WorkflowDagError, match="unknown"):
+        workflow_dag.topological_levels({"nodes": [{"id": "x", "depends_on": ["z"]}]})
+
+
+def test_cli_json_report(tmp_path: Path, capsys) -> None:
+    path = tmp_path / "wf.yaml"
+    path.write_text(
+        "name: wf\nnodes:\n  - id: a\n  - id: b\n    depends_on: [a]\n    timeout: 2000\n"
+    )
+
+    assert workflow_dag.main([str(path), "--json", "--default-timeout-ms", "1000"]) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert data["critical_path_ms"] == 3000
+    assert data["estimated"] == ["a"]
@@ -6,9 +6,12 @@ by integration tests (workforce-smoke).
 """
 from __future__ import annotations
 
+import http.server
 import json
 import sqlite3
 import sys
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -253,6 +256,207 @@ def test_main_run_id_prefix_resolves_to_full_id(tmp_path, monkeypatch, capsys):
     assert "node_started" in out
 
 
+# ---------------------------------------------------------------------------
+# Shared connection, batching, pagination, follow
+# ---------------------------------------------------------------------------
+
+
+def test_shared_db_probes_schema_once(tmp_path, monkeypatch, capsys):
+    db = _build_test_db(tmp_path)
+    monkeypatch.setattr(wsq, "ARCHON_DB_PATH", db)
+    calls = []
+    real_validate = wsq._validate_schema
+    monkeypatch.setattr(
+        wsq, "_validate_schema", lambda conn: calls.append(conn) or real_validate(conn)
+    )
+    monkeypatch.setattr(sys, "argv", ["prog", "--run-id", "run-a", "--no-rest"])
+
+    assert wsq.main() == 0
+    assert len(calls) == 1
+
+    with wsq.ArchonDB() as shared:
+        wsq.fetch_via_sqlite(running_only=False, limit=None, db=shared)
+        wsq.resolve_run_id_prefix("abcd", db=shared)
+        wsq.fetch_run_detail_via_sqlite("run-a", db=shared)
+    assert len(calls) == 2
+
+
+def test_batched_events_fetch(tmp_path, monkeypatch):
+    db = _build_test_db(tmp_path)
+    monkeypatch.setattr(wsq, "ARCHON_DB_PATH", db)
+    monkeypatch.setattr(wsq, "_IN_CHUNK", 1)
+
+    events = wsq.fetch_events_via_sqlite(["run-a", "run-b", "run-a"])
+
+    assert list(events) == ["run-a", "run-b"]
+    assert [e["step_name"] for e in events["run-a"]] == ["impl", "impl", "review"]
+    assert events["run-b"] == []
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 4])
+def test_keyset_pagination_walks_all_runs(tmp_path, monkeypatch, page_size):
+    db = _build_test_db(tmp_path)
+    conn = sqlite3.connect(db)
+    conn.executescript(
+        """
+        INSERT INTO remote_agent_workflow_runs (id, workflow_name, status)
+        VALUES ('pending-1', 'wf-a', 'pending'), ('pending-2', 'wf-b', 'pending');
+        """
+    )
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(wsq, "ARCHON_DB_PATH", db)
+
+    seen, cursor = [], None
+    while True:
+        page = wsq.fetch_via_sqlite(running_only=False, limit=page_size, before=cursor)
+        seen += [r["id"] for r in page]
+        if len(page) < page_size:
+            break
+        cursor = wsq.run_cursor(page[-1])
+
+    assert seen == [r["id"] for r in wsq.fetch_via_sqlite(running_only=False, limit=None)]
+    assert seen[-2:] == ["pending-2", "pending-1"]
+    assert len(seen) == 6
+
+
+def test_main_json_page_reports_next_cursor(tmp_path, monkeypatch, capsys):
+    db = _build_test_db(tmp_path)
+    monkeypatch.setattr(wsq, "ARCHON_DB_PATH", db)
+    monkeypatch.setattr(sys, "argv", ["prog", "--recent", "2", "--no-rest", "--json", "--events"])
+    assert wsq.main() == 0
+    first = json.loads(capsys.readouterr().out)
+    assert [r["id"] for r in first["runs"]] == ["abcd1234deadbeefcafe5678feedface", "run-b"]
+    assert first["runs"][1]["events"] == []
+
+    monkeypatch.setattr(
+        sys, "argv",
+        ["prog", "--recent", "2", "--no-rest", "--json", "--events", "--before", first["next_cursor"]],
+    )
+    assert wsq.main() == 0
+    second = json.loads(capsys.readouterr().out)
+    assert [r["id"] for r in second["runs"]] == ["run-a", "run-c"]
+    assert len(second["runs"][0]["events"]) == 3
+
+
+def test_follow_yields_only_new_events(tmp_path, monkeypatch):
+    db = _build_test_db(tmp_path)
+    monkeypatch.setattr(wsq, "ARCHON_DB_PATH", db)
+    writer = sqlite3.connect(db)
+
+    def sleep(_interval):
+        writer.execute(
+            "INSERT INTO remote_agent_workflow_events "
+            "(id, workflow_run_id, event_type, step_index, step_name, created_at) "
+            "VALUES (?, 'run-b', 'node_started', 2, 'fix', '2026-04-19 12:12:00')",
+            (f"n{writer.total_changes}",),
+        )
+        writer.commit()
+
+    with wsq.ArchonDB() as shared:
+        mark = wsq.latest_event_mark(shared)
+        assert mark == 3
+        followed = list(wsq.follow_events(shared, mark, max_polls=3, sleep=sleep))
+        replay, _ = wsq.poll_events(shared, 0, run_id="run-a")
+    writer.close()
+
+    assert [(e["workflow_run_id"], e["step_name"]) for e in followed] == [("run-b", "fix")] * 2
+    assert [e["event_type"] for e in replay] == ["node_started", "node_completed", "node_started"]
+
+
+# ---------------------------------------------------------------------------
+# Analytics (--stats)
+# ---------------------------------------------------------------------------
+
+
+def _add_history(db: Path) -> None:
+    """Extend the fixture DB with node history across several wf-a runs."""
+    conn = sqlite3.connect(db)
+    conn.executescript(
+        """
+        UPDATE remote_agent_workflow_runs SET completed_at = '2026-04-19 12:05:00'
+            WHERE id = 'run-a';
+        UPDATE remote_agent_workflow_runs SET completed_at = '2026-04-18 09:04:00'
+            WHERE id = 'run-c';
+        UPDATE remote_agent_workflow_runs SET status = 'failed',
+            completed_at = '2026-04-19 13:10:00'
+            WHERE id = 'abcd1234deadbeefcafe5678feedface';
+        INSERT INTO remote_agent_workflow_events
+            (id, workflow_run_id, event_type, step_index, step_name, created_at)
+        VALUES
+            ('e4', 'run-a', 'node_completed', 1, 'review', '2026-04-19 12:04:10'),
+            ('c1', 'run-c', 'node_started',   0, 'impl',   '2026-04-18 09:00:00'),
+            ('c2', 'run-c', 'node_completed', 0, 'impl',   '2026-04-18 09:01:00'),
+            ('d1', 'abcd1234deadbeefcafe5678feedface', 'node_started', 0, 'impl',
+             '2026-04-19 13:00:00'),
+            ('d2', 'abcd1234deadbeefcafe5678feedface', 'node_failed', 0, 'impl',
+             '2026-04-19 13:00:30'),
+            ('d3', 'abcd1234deadbeefcafe5678feedface', 'node_started', 0, 'impl',
+             '2026-04-19 13:01:00'),
+            ('d4', 'abcd1234deadbeefcafe5678feedface', 'node_completed', 0, 'impl',
+             '2026-04-19 13:06:00');
+        """
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_sqlite_stats_per_workflow_and_node(tmp_path, monkeypatch):
+    db = _build_test_db(tmp_path)
+    _add_history(db)
+    monkeypatch.setattr(wsq, "ARCHON_DB_PATH", db)
+
+    stats = wsq.fetch_stats_via_sqlite(workflow="wf-a")
+
+    assert [(s["workflow_name"], s["node"]) for s in stats] == [
+        ("wf-a", None),
+        ("wf-a", "impl"),
+        ("wf-a", "review"),
+    ]
+    run_row, impl, review = stats
+    # Runs: run-a 5m, run-c 4m completed; abcd… failed after a retry.
+    assert run_row["count"] == 3 and run_row["failed"] == 1
+    assert run_row["p50_ms"] == 240_000 and run_row["p95_ms"] == 300_000
+    assert run_row["retries"] == 1
+    # impl attempts: 170s, 60s, 300s succeeded; one 30s failure then retry.
+    assert (impl["count"], impl["completed"], impl["failed"]) == (4, 3, 1)
+    assert impl["failure_rate"] == 0.25
+    assert impl["p50_ms"] == 170_000 and impl["p95_ms"] == 300_000
+    assert impl["retries"] == 1
+    assert review["p50_ms"] == 60_000 and review["retries"] == 0
+
+
+def test_sqlite_stats_since_filter_and_missing_db(tmp_path, monkeypatch):
+    db = _build_test_db(tmp_path)
+    _add_history(db)
+    monkeypatch.setattr(wsq, "ARCHON_DB_PATH", db)
+
+    stats = wsq.fetch_stats_via_sqlite(since="2026-04-19")
+    impl = next(s for s in stats if s["node"] == "impl")
+    assert impl["completed"] == 2
+    assert {s["workflow_name"] for s in stats} == {"wf-a", "wf-b"}
+
+    monkeypatch.setattr(wsq, "ARCHON_DB_PATH", tmp_path / "missing.db")
+    assert wsq.fetch_stats_via_sqlite() == []
+
+
+def test_main_stats_table_and_json(tmp_path, monkeypatch, capsys):
+    db = _build_test_db(tmp_path)
+    _add_history(db)
+    monkeypatch.setattr(wsq, "ARCHON_DB_PATH", db)
+
+    monkeypatch.setattr(sys, "argv", ["prog", "--stats", "--workflow", "wf-a"])
+    assert wsq.main() == 0
+    out = capsys.readouterr().out
+    assert "P95" in out and "  impl" in out and "2.8m" in out
+
+    monkeypatch.setattr(sys, "argv", ["prog", "--stats", "--json"])
+    assert wsq.main() == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["source"] == "sqlite"
+    assert {s["workflow_name"] for s in payload["stats"]} == {"wf-a", "wf-b"}
+
+
 # ---------------------------------------------------------------------------
 # REST path
 # ---------------------------------------------------------------------------
@@ -358,6 +562,161 @@ def test_rest_run_detail_wrapped_in_run_key(monkeypatch):
     assert detail["events"][0]["event_type"] == "workflow_started"
 
 
+# ---------------------------------------------------------------------------
+# Pooled REST client — against a local stub of `archon serve`
+# ---------------------------------------------------------------------------
+
+
+class _StubArchon(http.server.ThreadingHTTPServer):
+    """Keep-alive HTTP/1.1 stand-in for the Archon runs API."""
+
+    daemon_threads = True
+
+    def __init__(self, delay: float = 0.05, slow: tuple[str, ...] = ()) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.delay = delay
+        self.slow = slow
+        self.connections = 0
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        try:
+            run_id = self.path.rsplit("/", 1)[-1]
+            time.sleep(1.0 if run_id in server.slow else server.delay)
+            if run_id == "runs":
+                status, payload = 200, [{"id": "run-a"}, {"id": "run-b"}]
+            elif run_id.startswith("run-"):
+                status, payload = 200, {
+                    "run": {"id": run_id, "status": "completed"},
+                    "events": [{"event_type": "node_started", "step_name": "rest"}],
+                }
+            elif run_id == "boom":
+                status, payload = 500, {}
+            else:
+                status, payload = 404, {}
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client gave up on a slow request
+        finally:
+            with server.lock:
+                server.active -= 1
+
+
+@pytest.fixture
+def stub_archon():
+    servers = []
+
+    def start(**kwargs) -> _StubArchon:
+        server = _StubArchon(**kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pool_reuses_keepalive_connections(stub_archon):
+    server = stub_archon(delay=0)
+    with wsq.ArchonHTTPPool(server.url, maxsize=2) as pool:
+        assert wsq.fetch_via_rest(server.url, 1.0, pool=pool) == [{"id": "run-a"}, {"id": "run-b"}]
+        for _ in range(3):
+            detail = wsq.fetch_run_detail_via_rest(server.url, "run-a", 1.0, pool=pool)
+            assert detail["events"][0]["step_name"] == "rest"
+        assert pool.get_json("/api/workflows/runs/missing") is None
+        with pytest.raises(RuntimeError, match="server error"):
+            pool.get_json("/api/workflows/runs/boom")
+    assert server.connections == 1 and pool.created == 1
+
+
+def test_pool_unreachable_returns_none():
+    with wsq.ArchonHTTPPool("http://127.0.0.1:9", timeout=0.2) as pool:
+        assert wsq.fetch_via_rest("http://127.0.0.1:9", 0.2, pool=pool) is None
+
+
+def test_concurrent_details_fall_back_to_sqlite_per_run(stub_archon, tmp_path, monkeypatch, capsys):
+    db = _build_test_db(tmp_path)
+    monkeypatch.setattr(wsq, "ARCHON_DB_PATH", db)
+    server = stub_archon(delay=0.1, slow=("run-c",))
+    ids = ["run-a", "run-b", "run-c", "boom", "run-x", "run-y"]
+
+    details = wsq.fetch_run_details(ids, server.url, timeout=0.3, max_workers=3)
+
+    assert list(details) == ids
+    assert details["run-a"][1] == "rest" and details["run-a"][0]["events"][0]["step_name"] == "rest"
+    # run-c timed out, boom returned 500: both read from SQLite instead.
+    assert details["run-c"][1] == "sqlite" and details["run-c"][0]["workflow_name"] == "wf-a"
+    assert details["boom"] == (None, "sqlite")
+    assert "server error" in capsys.readouterr().err
+    assert 1 < server.peak <= 3
+    assert server.connections <= 4  # 3 workers + one reopened after the timeout
+
+
+def test_main_run_id_5xx_falls_back_to_sqlite(stub_archon, tmp_path, monkeypatch, capsys):
+    db = _build_test_db(tmp_path)
+    monkeypatch.setattr(wsq, "ARCHON_DB_PATH", db)
+    server = stub_archon(delay=0)
+
+    monkeypatch.setattr(sys, "argv", ["prog", "--url", server.url, "--run-id", "boom"])
+    assert wsq.main() == 1
+    captured = capsys.readouterr()
+    assert "server error" in captured.err and "Run boom not found." in captured.err
+
+    # A run the server errors on but SQLite knows is still shown.
+    monkeypatch.setattr(
+        wsq, "fetch_run_detail_via_sqlite",
+        lambda run_id, db=None: {"id": run_id, "workflow_name": "wf-a", "events": []},
+    )
+    assert wsq.main() == 0
+    assert "Source: sqlite" in capsys.readouterr().out
+
+
+def test_main_events_over_rest(stub_archon, tmp_path, monkeypatch, capsys):
+    db = _build_test_db(tmp_path)
+    monkeypatch.setattr(wsq, "ARCHON_DB_PATH", db)
+    server = stub_archon(delay=0)
+    monkeypatch.setattr(
+        sys, "argv", ["prog", "--url", server.url, "--events", "--json", "--parallel", "2"]
+    )
+
+    assert wsq.main() == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["source"] == "rest"
+    assert [(r["id"], r["events_source"]) for r in payload["runs"]] == [
+        ("run-b", "rest"), ("run-a", "rest"),
+    ]
+    assert server.connections <= 2
+
+
 # ---------------------------------------------------------------------------
 # CLI entry: main() dispatches correctly
 # ---------------------------------------------------------------------------